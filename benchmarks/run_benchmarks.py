@@ -0,0 +1,266 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from importlib import metadata
+from zoneinfo import ZoneInfo
+
+# Run against the working tree, not an installed copy of the package
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPOSITORY)
+
+# Never reach the network: any lookup that is not given coordinates fails instead of geolocating
+os.environ["MOON_PHASE_OFFLINE"] = "1"
+
+from moon_phase import set_device_location, set_offline_mode, clear_longitude_cache
+from moon_phase import set_lunation_catalog, set_sign_ingress_index
+from moon_phase import status_on_date, status_at_time, next_sign, generate_moon_name
+from moon_phase import determine_moon_phase, is_retrograde
+from moon_phase.parse_timestamp import parse_timestamp
+
+# Fixed observers, so that timings do not depend on where the benchmark runs
+OBSERVERS = [
+    ("Los Angeles", 34.05, -118.24, "America/Los_Angeles"),
+    ("London", 51.51, -0.13, "Europe/London"),
+    ("Sydney", -33.87, 151.21, "Australia/Sydney")
+]
+
+# Fixed dates spread over a year, at midday UTC for the timed benchmarks
+DATES = [date(2024, 1, 1) + timedelta(days=days) for days in range(0, 366, 13)]
+TIMES = [datetime.combine(d, datetime.min.time(), dt_timezone.utc) + timedelta(hours=12) for d in DATES]
+
+BODIES = ["Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn"]
+
+# Timestamps in the formats the command line accepts
+TIMESTAMPS = [
+    "2024-05-01",
+    "2024-05-01T12:30:00",
+    "2024-05-01T12:30:00+02:00",
+    "1714566600",
+    "May 1 2024 12:30"
+]
+
+SCHEMA_VERSION = 1
+
+def clear_caches():
+    """
+    Empty the package's result caches, so that the next call computes from scratch.
+
+    The lunation catalog and sign ingress index are module globals rather than memoized
+    functions, so they are unset here too. The phase and sign paths are therefore timed
+    against the live ephemeris, cold and warm.
+    """
+    clear_longitude_cache()
+    set_lunation_catalog(None)
+    set_sign_ingress_index(None)
+
+    for name, module in list(sys.modules.items()):
+        if not name.startswith("moon_phase.") or module is None:
+            continue
+
+        for value in list(vars(module).values()):
+            if callable(getattr(value, "cache_clear", None)) and getattr(value, "__module__", None) == name:
+                value.cache_clear()
+
+def cases():
+    """
+    Build the benchmark cases as (name, list of calls) pairs. Each call takes no arguments.
+    """
+    calls = {}
+
+    def add(name, function, arguments):
+        calls[name] = [lambda function=function, kwargs=kwargs: function(**kwargs) for kwargs in arguments]
+
+    add("status_on_date", status_on_date, [
+        dict(d=d, timezone=tz, lat=lat, lon=lon) for d in DATES for _, lat, lon, tz in OBSERVERS
+    ])
+    add("status_at_time", status_at_time, [
+        dict(dt=dt, timezone=tz, lat=lat, lon=lon) for dt in TIMES for _, lat, lon, tz in OBSERVERS
+    ])
+
+    for body in BODIES:
+        add(f"next_sign[{body}]", next_sign, [
+            dict(body=body, current_date=d, timezone=tz, lat=lat, lon=lon) for d in DATES for _, lat, lon, tz in OBSERVERS[:1]
+        ])
+
+    add("generate_moon_name", generate_moon_name, [
+        dict(d=d, timezone=tz, lat=lat, lon=lon) for d in DATES for _, lat, lon, tz in OBSERVERS
+    ])
+    add("determine_moon_phase", determine_moon_phase, [
+        dict(dt=dt, timezone=tz, lat=lat, lon=lon) for dt in TIMES for _, lat, lon, tz in OBSERVERS
+    ])
+    add("is_retrograde", is_retrograde, [
+        dict(body=body, dt=d, timezone=tz, lat=lat, lon=lon) for d in DATES for body in BODIES[2:] for _, lat, lon, tz in OBSERVERS[:1]
+    ])
+    add("parse_timestamp", parse_timestamp, [
+        dict(timestamp=timestamp, timezone=tz, lat=lat, lon=lon) for timestamp in TIMESTAMPS for _, lat, lon, tz in OBSERVERS
+    ])
+
+    return calls
+
+def summarize(samples: list) -> dict:
+    """
+    Summarize timings in seconds per call.
+    """
+    return {
+        "calls": len(samples),
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "max": max(samples)
+    }
+
+def time_calls(calls: list, cold: bool) -> list:
+    """
+    Time each call once, emptying the caches before each one if cold is set.
+    """
+    samples = []
+
+    for call in calls:
+        if cold:
+            clear_caches()
+
+        start = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - start)
+
+    return samples
+
+def benchmark(calls: list, repeat: int) -> dict:
+    """
+    Time a benchmark case cold, with empty caches, and warm, repeating the same calls.
+    """
+    cold = time_calls(calls, cold=True)
+
+    # Fill the caches once, then time repeated calls against them
+    time_calls(calls, cold=False)
+    warm = []
+
+    for _ in range(repeat):
+        warm.extend(time_calls(calls, cold=False))
+
+    return {"cold": summarize(cold), "warm": summarize(warm)}
+
+def benchmark_import(repeat: int) -> dict:
+    """
+    Time a cold import of the package in fresh interpreters.
+    """
+    code = "import time; start = time.perf_counter(); import moon_phase; print(time.perf_counter() - start)"
+    environment = dict(os.environ, PYTHONPATH=REPOSITORY, PYTHONDONTWRITEBYTECODE="1")
+    samples = []
+
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            env=environment,
+            cwd=REPOSITORY,
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout
+        samples.append(float(output))
+
+    return {"cold": summarize(samples)}
+
+def environment_info() -> dict:
+    """
+    Describe the interpreter, platform, dependency versions and commit the benchmark ran on.
+    """
+    versions = {}
+
+    for package in ("ephem", "numpy", "timezonefinder", "dateparser", "pyluach"):
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = None
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=REPOSITORY,
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "packages": versions,
+        "commit": commit
+    }
+
+def compare(results: dict, baseline: dict):
+    """
+    Print the ratio of each median time to the same median in a baseline results file.
+    """
+    print(f"{'benchmark':<28}{'mode':<6}{'baseline':>12}{'current':>12}{'ratio':>8}")
+
+    for name, modes in results["benchmarks"].items():
+        for mode, summary in modes.items():
+            previous = baseline.get("benchmarks", {}).get(name, {}).get(mode)
+
+            if previous is None:
+                continue
+
+            ratio = summary["median"] / previous["median"] if previous["median"] else float("nan")
+            print(f"{name:<28}{mode:<6}{previous['median'] * 1e3:>10.3f}ms{summary['median'] * 1e3:>10.3f}ms{ratio:>8.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the moon_phase hot paths offline, writing the timings as JSON.")
+    parser.add_argument("--output", default="benchmark_results.json", help="the JSON file to write the results to")
+    parser.add_argument("--repeat", type=int, default=5, help="the number of times the warm calls are repeated")
+    parser.add_argument("--import-repeat", type=int, default=10, help="the number of fresh interpreters timing the import")
+    parser.add_argument("--only", nargs="*", help="run only the benchmarks with these names")
+    parser.add_argument("--compare", help="a previous results file to compare the medians against")
+    args = parser.parse_args()
+
+    set_offline_mode(True)
+    set_device_location(*OBSERVERS[0][1:3])
+
+    # Load the timezone database and the ephemeris before any timing
+    for _, _, _, tz in OBSERVERS:
+        ZoneInfo(tz)
+
+    status_on_date(DATES[0], OBSERVERS[0][3], *OBSERVERS[0][1:3])
+
+    results = {
+        "schema_version": SCHEMA_VERSION,
+        "created": datetime.now(dt_timezone.utc).isoformat(),
+        "environment": environment_info(),
+        "units": "seconds per call",
+        "benchmarks": {}
+    }
+
+    if not args.only or "import" in args.only:
+        print("import", flush=True)
+        results["benchmarks"]["import"] = benchmark_import(args.import_repeat)
+
+    for name, calls in cases().items():
+        if args.only and name not in args.only and name.split("[")[0] not in args.only:
+            continue
+
+        print(name, flush=True)
+        results["benchmarks"][name] = benchmark(calls, args.repeat)
+
+    with open(args.output, "w") as file:
+        json.dump(results, file, indent=2)
+
+    print(f"Wrote {args.output}")
+
+    if args.compare:
+        with open(args.compare) as file:
+            compare(results, json.load(file))
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,30 @@
-from .moon_phase import *
+import sys
+from types import ModuleType
+
+from .moon_phase import EXPORTS, load_export
 
 __author__ = "Gregory H. Halverson"
+
+__all__ = list(EXPORTS)
+
+class LazyPackage(ModuleType):
+    """
+    The moon_phase package, importing the module behind each public name on first access (PEP 562).
+    """
+    def __getattr__(self, name: str):
+        value = load_export(name)
+        super().__setattr__(name, value)
+
+        return value
+
+    def __setattr__(self, name: str, value):
+        # Importing a submodule binds it on the package, which would hide the public function of the same name
+        if name in EXPORTS and isinstance(value, ModuleType) and value.__name__ == f"{__name__}.{name}":
+            return
+
+        super().__setattr__(name, value)
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(EXPORTS))
+
+sys.modules[__name__].__class__ = LazyPackage
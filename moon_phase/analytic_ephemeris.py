@@ -0,0 +1,322 @@
+from typing import Dict, Optional, Sequence
+import numpy as np
+
+from .time_scales import nutation
+
+# Constant of aberration in degrees (20.49552 arcseconds)
+ABERRATION_DEGREES = 20.49552 / 3600.0
+
+# Light time for one astronomical unit, in Julian centuries (0.0057755 days)
+LIGHT_TIME_CENTURIES_PER_AU = 0.0057755183 / 36525.0
+
+# Keplerian elements of the planets and the Earth-Moon barycenter on the J2000.0 ecliptic and equinox, valid 1800-2050
+# (Standish, "Keplerian Elements for Approximate Positions of the Major Planets", table 1).
+# Columns: semi-major axis (au), eccentricity, inclination, mean longitude, longitude of perihelion,
+# longitude of the ascending node (degrees); each followed by its rate per Julian century.
+PLANET_ELEMENTS: Dict[str, np.ndarray] = {
+    "mercury": np.array([
+        [0.38709927, 0.20563593, 7.00497902, 252.25032350, 77.45779628, 48.33076593],
+        [0.00000037, 0.00001906, -0.00594749, 149472.67411175, 0.16047689, -0.12534081]
+    ]),
+    "venus": np.array([
+        [0.72333566, 0.00677672, 3.39467605, 181.97909950, 131.60246718, 76.67984255],
+        [0.00000390, -0.00004107, -0.00078890, 58517.81538729, 0.00268329, -0.27769418]
+    ]),
+    "earth": np.array([
+        [1.00000261, 0.01671123, -0.00001531, 100.46457166, 102.93768193, 0.0],
+        [0.00000562, -0.00004392, -0.01294668, 35999.37244981, 0.32327364, 0.0]
+    ]),
+    "mars": np.array([
+        [1.52371034, 0.09339410, 1.84969142, -4.55343205, -23.94362959, 49.55953891],
+        [0.00001847, 0.00007882, -0.00813131, 19140.30268499, 0.44441088, -0.29257343]
+    ]),
+    "jupiter": np.array([
+        [5.20288700, 0.04838624, 1.30439695, 34.39644051, 14.72847983, 100.47390909],
+        [-0.00011607, -0.00013253, -0.00183714, 3034.74612775, 0.21252668, 0.20469106]
+    ]),
+    "saturn": np.array([
+        [9.53667594, 0.05386179, 2.48599187, 49.95424423, 92.59887831, 113.66242448],
+        [-0.00125060, -0.00050991, 0.00193609, 1222.49362201, -0.41897216, -0.28867794]
+    ])
+}
+
+# Planets with elements above, excluding the Earth-Moon barycenter
+ANALYTIC_PLANETS = ("mercury", "venus", "mars", "jupiter", "saturn")
+
+# Years over which the error bounds below hold
+ANALYTIC_FIRST_YEAR = 1800
+ANALYTIC_LAST_YEAR = 2100
+
+# Maximum difference in degrees from ephem's apparent longitudes between ANALYTIC_FIRST_YEAR and ANALYTIC_LAST_YEAR,
+# measured at 20,000 random instants and rounded up. The outer planets' two-body orbits omit their mutual perturbations.
+ANALYTIC_MAX_ERROR_DEGREES = {
+    "sun": 0.012,
+    "moon": 0.008,
+    "mercury": 0.02,
+    "venus": 0.035,
+    "mars": 0.08,
+    "jupiter": 0.2,
+    "saturn": 0.4
+}
+
+# Maximum difference in degrees from ephem's change in a planet's longitude over one day, measured daily over 1850-2100 and rounded up
+ANALYTIC_MAX_DAILY_MOTION_ERROR_DEGREES = 0.0025
+
+# Periodic terms of the Moon's longitude (Meeus, table 47.A).
+# Columns: multiples of D, M, M', F; sine coefficient in 0.000001 degrees.
+MOON_LONGITUDE_TERMS = np.array([
+    [0, 0, 1, 0, 6288774],
+    [2, 0, -1, 0, 1274027],
+    [2, 0, 0, 0, 658314],
+    [0, 0, 2, 0, 213618],
+    [0, 1, 0, 0, -185116],
+    [0, 0, 0, 2, -114332],
+    [2, 0, -2, 0, 58793],
+    [2, -1, -1, 0, 57066],
+    [2, 0, 1, 0, 53322],
+    [2, -1, 0, 0, 45758],
+    [0, 1, -1, 0, -40923],
+    [1, 0, 0, 0, -34720],
+    [0, 1, 1, 0, -30383],
+    [2, 0, 0, -2, 15327],
+    [0, 0, 1, 2, -12528],
+    [0, 0, 1, -2, 10980],
+    [4, 0, -1, 0, 10675],
+    [0, 0, 3, 0, 10034],
+    [4, 0, -2, 0, 8548],
+    [2, 1, -1, 0, -7888],
+    [2, 1, 0, 0, -6766],
+    [1, 0, -1, 0, -5163],
+    [1, 1, 0, 0, 4987],
+    [2, -1, 1, 0, 4036],
+    [2, 0, 2, 0, 3994],
+    [4, 0, 0, 0, 3861],
+    [2, 0, -3, 0, 3665],
+    [0, 1, -2, 0, -2689],
+    [2, 0, -1, 2, -2602],
+    [2, -1, -2, 0, 2390],
+    [1, 0, 1, 0, -2348],
+    [2, -2, 0, 0, 2236],
+    [0, 1, 2, 0, -2120],
+    [0, 2, 0, 0, -2069],
+    [2, -2, -1, 0, 2048],
+    [2, 0, 1, -2, -1773],
+    [2, 0, 0, 2, -1595],
+    [4, -1, -1, 0, 1215],
+    [0, 0, 2, 2, -1110],
+    [3, 0, -1, 0, -892],
+    [2, 1, 1, 0, -810],
+    [4, -1, -2, 0, 759],
+    [0, 2, -1, 0, -713],
+    [2, 2, -1, 0, -700],
+    [2, 1, -2, 0, 691],
+    [2, -1, 0, -2, 596],
+    [4, 0, 1, 0, 549],
+    [0, 0, 4, 0, 537],
+    [4, -1, 0, 0, 520],
+    [1, 0, -2, 0, -487],
+    [2, 1, 0, -2, -399],
+    [0, 0, 2, -2, -381],
+    [1, 1, 1, 0, 351],
+    [3, 0, -2, 0, -340],
+    [4, 0, -3, 0, 330],
+    [2, -1, 2, 0, 327],
+    [0, 2, 1, 0, -323],
+    [1, 1, -1, 0, 299],
+    [2, 0, 3, 0, 294]
+], dtype=np.float64)
+
+def general_precession(T: np.ndarray) -> np.ndarray:
+    """
+    Calculate the general precession in longitude from the J2000.0 equinox to the equinox of date (Lieske 1977).
+
+    Parameters:
+    T (np.ndarray): Julian centuries (TT) since J2000.0.
+
+    Returns:
+    np.ndarray: The precession in degrees.
+    """
+    return (5029.0966 * T + 1.11113 * T**2 - 0.000006 * T**3) / 3600.0
+
+def sun_longitudes(T: np.ndarray, delta_psi: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Calculate the apparent geocentric ecliptic longitude of the Sun (Meeus, chapter 25, low accuracy).
+
+    Parameters:
+    T (np.ndarray): Julian centuries (TT) since J2000.0.
+    delta_psi (np.ndarray, optional): The nutation in longitude in degrees, if already calculated. Defaults to None.
+
+    Returns:
+    np.ndarray: The longitude in degrees on the true ecliptic and equinox of date, 0-360.
+    """
+    T = np.asarray(T, dtype=np.float64)
+
+    # Geometric mean longitude and mean anomaly
+    L0 = 280.46646 + 36000.76983 * T + 0.0003032 * T**2
+    M = np.radians(357.52911 + 35999.05029 * T - 0.0001537 * T**2)
+
+    # Equation of the center
+    C = (
+        (1.914602 - 0.004817 * T - 0.000014 * T**2) * np.sin(M)
+        + (0.019993 - 0.000101 * T) * np.sin(2 * M)
+        + 0.000289 * np.sin(3 * M)
+    )
+
+    if delta_psi is None:
+        delta_psi, _ = nutation(T)
+
+    # True longitude, corrected for aberration and nutation
+    return (L0 + C - ABERRATION_DEGREES + delta_psi) % 360
+
+def moon_longitudes(T: np.ndarray, delta_psi: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Calculate the apparent geocentric ecliptic longitude of the Moon (Meeus, chapter 47).
+
+    Parameters:
+    T (np.ndarray): Julian centuries (TT) since J2000.0.
+    delta_psi (np.ndarray, optional): The nutation in longitude in degrees, if already calculated. Defaults to None.
+
+    Returns:
+    np.ndarray: The longitude in degrees on the true ecliptic and equinox of date, 0-360.
+    """
+    T = np.asarray(T, dtype=np.float64)
+
+    # Mean longitude, elongation, anomalies and argument of latitude of the Moon
+    L_prime = 218.3164477 + 481267.88123421 * T - 0.0015786 * T**2 + T**3 / 538841.0 - T**4 / 65194000.0
+    D = 297.8501921 + 445267.1114034 * T - 0.0018819 * T**2 + T**3 / 545868.0 - T**4 / 113065000.0
+    M = 357.5291092 + 35999.0502909 * T - 0.0001536 * T**2 + T**3 / 24490000.0
+    M_prime = 134.9633964 + 477198.8675055 * T + 0.0087414 * T**2 + T**3 / 69699.0 - T**4 / 14712000.0
+    F = 93.2720950 + 483202.0175233 * T - 0.0036539 * T**2 - T**3 / 3526000.0 + T**4 / 863310000.0
+
+    # Additive terms for the action of Venus and Jupiter and the flattening of the Earth
+    A1 = np.radians(119.75 + 131.849 * T)
+    A2 = np.radians(53.09 + 479264.290 * T)
+
+    # Decreasing eccentricity of the Earth's orbit, applied once per multiple of M
+    E = 1 - 0.002516 * T - 0.0000074 * T**2
+
+    fundamental = np.radians(np.stack([D, M, M_prime, F], axis=-1) % 360.0)
+    arguments = fundamental @ MOON_LONGITUDE_TERMS[:, :4].T
+    eccentricity = E[..., np.newaxis] ** np.abs(MOON_LONGITUDE_TERMS[:, 1])
+
+    sigma_l = np.sum(MOON_LONGITUDE_TERMS[:, 4] * eccentricity * np.sin(arguments), axis=-1)
+    sigma_l += 3958 * np.sin(A1) + 1962 * np.sin(np.radians(L_prime - F)) + 318 * np.sin(A2)
+
+    if delta_psi is None:
+        delta_psi, _ = nutation(T)
+
+    return (L_prime + sigma_l / 1e6 + delta_psi) % 360
+
+def heliocentric_positions(name: str, T: np.ndarray) -> np.ndarray:
+    """
+    Calculate the heliocentric position of a planet from its Keplerian elements.
+
+    Parameters:
+    name (str): The lowercase planet name, or "earth" for the Earth-Moon barycenter.
+    T (np.ndarray): Julian centuries (TT) since J2000.0.
+
+    Returns:
+    np.ndarray: Rectangular coordinates in au on the J2000.0 ecliptic and equinox, with the axes last.
+    """
+    elements, rates = PLANET_ELEMENTS[name]
+    a, e, I, L, perihelion, node = (elements[:, np.newaxis] + rates[:, np.newaxis] * np.ravel(T)).reshape(6, *np.shape(T))
+
+    # Argument of perihelion and mean anomaly
+    omega = perihelion - node
+    M = np.radians((L - perihelion + 180) % 360 - 180)
+
+    # Solve Kepler's equation by Newton's method, which converges in a few steps for planetary eccentricities
+    E = M + e * np.sin(M)
+
+    for _ in range(5):
+        E -= (E - e * np.sin(E) - M) / (1 - e * np.cos(E))
+
+    # Position in the orbital plane
+    x_orbit = a * (np.cos(E) - e)
+    y_orbit = a * np.sqrt(1 - e**2) * np.sin(E)
+
+    # Rotate to the ecliptic
+    omega, node, I = np.radians(omega), np.radians(node), np.radians(I)
+    cos_omega, sin_omega = np.cos(omega), np.sin(omega)
+    cos_node, sin_node = np.cos(node), np.sin(node)
+    cos_I, sin_I = np.cos(I), np.sin(I)
+
+    x = (cos_omega * cos_node - sin_omega * sin_node * cos_I) * x_orbit + (-sin_omega * cos_node - cos_omega * sin_node * cos_I) * y_orbit
+    y = (cos_omega * sin_node + sin_omega * cos_node * cos_I) * x_orbit + (-sin_omega * sin_node + cos_omega * cos_node * cos_I) * y_orbit
+    z = (sin_omega * sin_I) * x_orbit + (cos_omega * sin_I) * y_orbit
+
+    return np.stack([x, y, z], axis=-1)
+
+def planet_longitudes(
+        name: str,
+        T: np.ndarray,
+        delta_psi: Optional[np.ndarray] = None,
+        earth: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Calculate the apparent geocentric ecliptic longitude of a planet from Keplerian elements.
+
+    The planet is placed at its position one light time earlier, seen from the Earth-Moon barycenter,
+    and its longitude is precessed to the equinox of date and corrected for nutation and aberration.
+
+    Parameters:
+    name (str): The lowercase planet name, Mercury through Saturn.
+    T (np.ndarray): Julian centuries (TT) since J2000.0.
+    delta_psi (np.ndarray, optional): The nutation in longitude in degrees, if already calculated. Defaults to None.
+    earth (np.ndarray, optional): The heliocentric position of the Earth-Moon barycenter, if already calculated. Defaults to None.
+
+    Returns:
+    np.ndarray: The longitude in degrees on the true ecliptic and equinox of date, 0-360.
+    """
+    T = np.asarray(T, dtype=np.float64)
+
+    if earth is None:
+        earth = heliocentric_positions("earth", T)
+
+    # Correct for light time with one iteration, the planet moving little during it
+    geocentric = heliocentric_positions(name, T) - earth
+    distance = np.linalg.norm(geocentric, axis=-1)
+    geocentric = heliocentric_positions(name, T - distance * LIGHT_TIME_CENTURIES_PER_AU) - earth
+
+    longitude = np.degrees(np.arctan2(geocentric[..., 1], geocentric[..., 0]))
+
+    # Annual aberration, from the Sun's geometric longitude seen from the Earth
+    sun_longitude = np.arctan2(-earth[..., 1], -earth[..., 0])
+    aberration = -ABERRATION_DEGREES * np.cos(sun_longitude - np.radians(longitude))
+
+    if delta_psi is None:
+        delta_psi, _ = nutation(T)
+
+    return (longitude + general_precession(T) + aberration + delta_psi) % 360
+
+def analytic_longitudes(bodies: Sequence[str], T: np.ndarray) -> np.ndarray:
+    """
+    Calculate the apparent geocentric ecliptic longitudes of several bodies over an array of instants.
+
+    Parameters:
+    bodies (Sequence[str]): Lowercase body names: the Sun, the Moon, or Mercury through Saturn.
+    T (np.ndarray): Julian centuries (TT) since J2000.0, one-dimensional.
+
+    Returns:
+    np.ndarray: A (time x body) matrix of longitudes in degrees.
+    """
+    T = np.asarray(T, dtype=np.float64)
+    longitudes = np.empty((len(T), len(bodies)), dtype=np.float64)
+
+    # Share the nutation and the Earth's position among the bodies
+    delta_psi, _ = nutation(T)
+    earth = None
+
+    for j, body in enumerate(bodies):
+        if body == "sun":
+            longitudes[:, j] = sun_longitudes(T, delta_psi)
+        elif body == "moon":
+            longitudes[:, j] = moon_longitudes(T, delta_psi)
+        elif body in ANALYTIC_PLANETS:
+            if earth is None:
+                earth = heliocentric_positions("earth", T)
+
+            longitudes[:, j] = planet_longitudes(body, T, delta_psi, earth)
+        else:
+            raise ValueError(f"the analytic ephemeris has no theory for {body}")
+
+    return longitudes
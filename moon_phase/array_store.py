@@ -0,0 +1,111 @@
+from typing import Any, Dict, Tuple
+import json
+import struct
+import numpy as np
+
+# Layout: magic, format version, header length, JSON header, then each array aligned to ARRAY_ALIGNMENT bytes
+MAGIC = b"MOONPHAS"
+FORMAT_VERSION = 1
+PREAMBLE = struct.Struct("<8sII")
+ARRAY_ALIGNMENT = 64
+
+def write_array_store(
+        path: str,
+        kind: str,
+        version: int,
+        arrays: Dict[str, np.ndarray],
+        metadata: Dict[str, Any] = None):
+    """
+    Write named NumPy arrays to a versioned binary file that can be memory-mapped.
+
+    Parameters:
+    path (str): The file to write.
+    kind (str): The kind of data stored, checked when the file is read.
+    version (int): The version of the data layout for this kind, checked when the file is read.
+    arrays (Dict[str, np.ndarray]): The arrays to store, by name.
+    metadata (Dict[str, Any], optional): JSON-serializable metadata stored in the header. Defaults to None.
+    """
+    arrays = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+
+    header = {
+        "kind": kind,
+        "version": version,
+        "metadata": metadata or {},
+        "arrays": {}
+    }
+
+    # Offsets depend on the header length, so lay out the arrays until the header size is stable
+    header_bytes = b""
+
+    while True:
+        offset = PREAMBLE.size + len(header_bytes)
+
+        for name, array in arrays.items():
+            offset += -offset % ARRAY_ALIGNMENT
+            header["arrays"][name] = {
+                "dtype": array.dtype.str,
+                "shape": list(array.shape),
+                "offset": offset
+            }
+            offset += array.nbytes
+
+        encoded = json.dumps(header).encode("utf-8")
+
+        if len(encoded) == len(header_bytes):
+            break
+
+        header_bytes = encoded
+
+    with open(path, "wb") as file:
+        file.write(PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header_bytes)))
+        file.write(header_bytes)
+
+        for name, array in arrays.items():
+            file.write(b"\0" * (header["arrays"][name]["offset"] - file.tell()))
+            file.write(array.tobytes())
+
+def read_array_store(
+        path: str,
+        kind: str,
+        version: int,
+        mmap: bool = True) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    """
+    Read named NumPy arrays written by write_array_store.
+
+    Parameters:
+    path (str): The file to read.
+    kind (str): The expected kind of data.
+    version (int): The expected version of the data layout.
+    mmap (bool, optional): Memory-map the arrays read-only instead of loading them. Defaults to True.
+
+    Returns:
+    Tuple[Dict[str, np.ndarray], Dict[str, Any]]: The arrays by name and the stored metadata.
+
+    Raises:
+    ValueError: If the file is not an array store or holds a different kind or version of data.
+    """
+    with open(path, "rb") as file:
+        magic, format_version, header_length = PREAMBLE.unpack(file.read(PREAMBLE.size))
+
+        if magic != MAGIC or format_version != FORMAT_VERSION:
+            raise ValueError(f"not a version {FORMAT_VERSION} array store: {path}")
+
+        header = json.loads(file.read(header_length).decode("utf-8"))
+
+        if header["kind"] != kind or header["version"] != version:
+            raise ValueError(f"expected {kind} version {version} in {path}, found {header['kind']} version {header['version']}")
+
+        arrays = {}
+
+        for name, layout in header["arrays"].items():
+            dtype = np.dtype(layout["dtype"])
+            shape = tuple(layout["shape"])
+
+            if mmap and int(np.prod(shape)) > 0:
+                arrays[name] = np.memmap(path, dtype=dtype, mode="r", offset=layout["offset"], shape=shape)
+            else:
+                file.seek(layout["offset"])
+                count = int(np.prod(shape))
+                arrays[name] = np.fromfile(file, dtype=dtype, count=count).reshape(shape)
+
+    return arrays, header["metadata"]
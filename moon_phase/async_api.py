@@ -0,0 +1,141 @@
+from concurrent.futures import Executor
+from functools import partial
+from importlib import import_module
+from inspect import signature
+from typing import Any, Optional, Tuple
+from weakref import WeakKeyDictionary
+import asyncio
+
+from .moon_phase import EXPORTS
+
+_executor = None
+
+# Computations in flight on each event loop, by function name and arguments
+_in_flight: "WeakKeyDictionary[asyncio.AbstractEventLoop, dict[Tuple, asyncio.Future]]" = WeakKeyDictionary()
+
+def set_async_executor(executor: Optional[Executor]):
+    """
+    Set the executor that runs the computations of the async API, or None to use the event loop's default executor.
+
+    Parameters:
+    executor (Optional[Executor]): A thread or process pool. Process pools give CPU-bound ephemeris work its own cores.
+    """
+    global _executor
+    _executor = executor
+
+def get_async_executor() -> Optional[Executor]:
+    """
+    Get the executor that runs the computations of the async API.
+
+    Returns:
+    Optional[Executor]: The executor, or None if the event loop's default executor is used.
+    """
+    return _executor
+
+def call_export(name: str, args: tuple, kwargs: dict) -> Any:
+    """
+    Import a public function of the package and call it. Runs in the executor, so it can be sent to a process pool.
+    """
+    function = getattr(import_module(f".{EXPORTS[name]}", __package__), name)
+
+    return function(*args, **kwargs)
+
+async def run_export(
+        name: str,
+        args: tuple = (),
+        kwargs: dict = None,
+        timeout: float = None,
+        blocking_io: bool = False) -> Any:
+    """
+    Run a public function of the package in the executor, sharing one computation among concurrent identical calls.
+
+    Cancelling or timing out one caller does not cancel the computation for the others.
+
+    Parameters:
+    name (str): The public name of the function.
+    args (tuple, optional): The positional arguments. Defaults to ().
+    kwargs (dict, optional): The keyword arguments. Defaults to None.
+    timeout (float, optional): Seconds to wait before raising asyncio.TimeoutError. Defaults to None, waiting indefinitely.
+    blocking_io (bool, optional): Run in the event loop's default thread pool instead of the async executor,
+        for network and file access that should see this process's settings. Defaults to False.
+
+    Returns:
+    Any: The result of the function.
+    """
+    kwargs = kwargs or {}
+    loop = asyncio.get_running_loop()
+    in_flight = _in_flight.setdefault(loop, {})
+
+    key = (name, args, tuple(sorted(kwargs.items())))
+
+    try:
+        hash(key)
+    except TypeError:
+        # Calls with unhashable arguments are not shared
+        key = None
+
+    future = in_flight.get(key) if key is not None else None
+
+    if future is None:
+        executor = None if blocking_io else _executor
+        future = loop.run_in_executor(executor, partial(call_export, name, args, kwargs))
+
+        if key is not None:
+            in_flight[key] = future
+            future.add_done_callback(lambda _: in_flight.pop(key, None))
+
+    return await asyncio.wait_for(asyncio.shield(future), timeout)
+
+async def alocate_device(timeout: float = None) -> Tuple[float, float]:
+    """
+    Locate the device without blocking the event loop. See locate_device.
+    """
+    return await run_export("locate_device", timeout=timeout, blocking_io=True)
+
+async def afind_timezone(lat: float = None, lon: float = None, timeout: float = None):
+    """
+    Find the timezone of a location without blocking the event loop. See find_timezone.
+    """
+    if lat is None or lon is None:
+        lat, lon = await alocate_device(timeout=timeout)
+
+    return await run_export("find_timezone", (lat, lon), timeout=timeout, blocking_io=True)
+
+def asynchronous(name: str):
+    """
+    Make the async counterpart of a public function taking lat and lon.
+
+    The device is located first, in the default thread pool, if the coordinates and session are not given,
+    so that concurrent calls share one geolocation. The call then runs in the executor.
+    """
+    function = getattr(import_module(f".{EXPORTS[name]}", __package__), name)
+    parameters = signature(function)
+
+    async def wrapper(*args, timeout: float = None, **kwargs):
+        bound = parameters.bind(*args, **kwargs)
+
+        if "lat" in parameters.parameters and bound.arguments.get("session") is None:
+            if bound.arguments.get("lat") is None or bound.arguments.get("lon") is None:
+                bound.arguments["lat"], bound.arguments["lon"] = await alocate_device(timeout=timeout)
+
+        return await run_export(name, bound.args, bound.kwargs, timeout=timeout)
+
+    wrapper.__name__ = wrapper.__qualname__ = f"a{name}"
+    wrapper.__doc__ = (
+        f"Async counterpart of {name}, run in the async executor without blocking the event loop.\n"
+        f"Takes the same arguments, plus timeout in seconds.\n\n"
+        f"{function.__doc__ or ''}"
+    )
+
+    return wrapper
+
+astatus_on_date = asynchronous("status_on_date")
+astatus_at_time = asynchronous("status_at_time")
+adetermine_moon_phase = asynchronous("determine_moon_phase")
+afind_next_phase = asynchronous("find_next_phase")
+agenerate_moon_name = asynchronous("generate_moon_name")
+adetermine_sign = asynchronous("determine_sign")
+ais_retrograde = asynchronous("is_retrograde")
+anext_sign = asynchronous("next_sign")
+aupcoming_phases = asynchronous("upcoming_phases")
+arecent_phases = asynchronous("recent_phases")
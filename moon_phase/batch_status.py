@@ -0,0 +1,168 @@
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime, date
+from itertools import islice
+import os
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+from zoneinfo import ZoneInfo
+import ephem
+
+from .constants import BATCH_CHUNK_SIZE
+from .locate_device import location_from_explicit, is_offline, set_device_location, set_offline_mode
+from .sign_ingress_index import SignIngressIndex, get_sign_ingress_index, set_sign_ingress_index
+from .lunation_catalog import LunationCatalog, get_lunation_catalog, set_lunation_catalog
+from .ephemeris_backend import EphemerisBackend, get_ephemeris_backend, set_ephemeris_backend
+
+class StatusRequest(NamedTuple):
+    """
+    The arguments of one status report in a batch.
+    """
+    dt: Union[ephem.Date, datetime, date, str] = None
+    timezone: Union[ZoneInfo, str] = None
+    lat: float = None
+    lon: float = None
+
+STATUS_FUNCTIONS = ("status_on_date", "status_at_time")
+
+def initialize_status_worker(
+        device_location: Optional[Tuple[float, float]],
+        offline: bool,
+        sign_ingress_index: Optional[SignIngressIndex],
+        lunation_catalog: Optional[LunationCatalog],
+        ephemeris_backend: EphemerisBackend = None):
+    """
+    Prepare a worker process once: copy the parent's location settings, indexes, catalog and ephemeris backend, and load the status modules.
+    """
+    if device_location is not None:
+        set_device_location(*device_location)
+
+    set_offline_mode(offline)
+    set_sign_ingress_index(sign_ingress_index)
+    set_lunation_catalog(lunation_catalog)
+    set_ephemeris_backend(ephemeris_backend)
+
+    from .find_timezone import get_timezone_finder
+    from .status_on_date import status_on_date
+    from .status_at_time import status_at_time
+
+    get_timezone_finder()
+
+def render_status_chunk(function_name: str, chunk: List[StatusRequest]) -> List[str]:
+    """
+    Render the status reports of a chunk of requests in the current process.
+    """
+    if function_name == "status_on_date":
+        from .status_on_date import status_on_date as status_function
+    else:
+        from .status_at_time import status_at_time as status_function
+
+    return [status_function(*request) for request in chunk]
+
+def batch_status(
+        requests: Iterable[Union[StatusRequest, tuple]],
+        function_name: str = "status_on_date",
+        workers: int = None,
+        chunk_size: int = BATCH_CHUNK_SIZE,
+        max_in_flight: int = None,
+        ordered: bool = True) -> Iterator[Union[str, Tuple[int, str]]]:
+    """
+    Render status reports for many requests across a pool of worker processes.
+
+    Requests are read lazily and sent to the workers in chunks, with at most max_in_flight
+    chunks submitted and not yet yielded at any time. Each worker starts with the parent's
+    device location, offline mode, sign ingress index, lunation catalog and ephemeris backend. The reports are
+    the same as calling the status function on each request in turn.
+
+    Parameters:
+    requests (Iterable[Union[StatusRequest, tuple]]): The requests, as StatusRequest objects or (dt, timezone, lat, lon) tuples.
+    function_name (str, optional): "status_on_date" or "status_at_time". Defaults to "status_on_date".
+    workers (int, optional): The number of worker processes. Defaults to the number of CPUs. 0 renders in this process.
+    chunk_size (int, optional): The number of requests sent to a worker at once. Defaults to BATCH_CHUNK_SIZE.
+    max_in_flight (int, optional): The maximum number of chunks submitted and not yet yielded. Defaults to twice the number of workers.
+    ordered (bool, optional): Yield reports in the order of the requests. If False, yield (index, report) pairs as chunks complete. Defaults to True.
+
+    Yields:
+    Union[str, Tuple[int, str]]: Each report, or its request index and report if ordered is False.
+    """
+    if function_name not in STATUS_FUNCTIONS:
+        raise ValueError(f"unknown status function: {function_name}")
+
+    if chunk_size < 1:
+        raise ValueError(f"chunk size must be positive: {chunk_size}")
+
+    requests = (StatusRequest(*request) for request in requests)
+
+    def chunks() -> Iterator[Tuple[int, List[StatusRequest]]]:
+        start = 0
+
+        while True:
+            chunk = list(islice(requests, chunk_size))
+
+            if not chunk:
+                return
+
+            yield start, chunk
+            start += len(chunk)
+
+    # Render in this process without a pool
+    if workers == 0:
+        for start, chunk in chunks():
+            for i, status in enumerate(render_status_chunk(function_name, chunk), start):
+                yield status if ordered else (i, status)
+
+        return
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if max_in_flight is None:
+        max_in_flight = 2 * workers
+
+    initializer_arguments = (
+        location_from_explicit(),
+        is_offline(),
+        get_sign_ingress_index(),
+        get_lunation_catalog(),
+        get_ephemeris_backend()
+    )
+
+    with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=initialize_status_worker,
+            initargs=initializer_arguments) as executor:
+        pending_chunks = chunks()
+        in_flight = {}
+        completed = {}
+        next_start = 0
+        exhausted = False
+
+        while True:
+            # Keep the pool fed up to the limit on chunks in flight
+            while not exhausted and len(in_flight) + len(completed) < max_in_flight:
+                try:
+                    start, chunk = next(pending_chunks)
+                except StopIteration:
+                    exhausted = True
+                    break
+
+                in_flight[executor.submit(render_status_chunk, function_name, chunk)] = start
+
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                start = in_flight.pop(future)
+                statuses = future.result()
+
+                if ordered:
+                    completed[start] = statuses
+                else:
+                    for i, status in enumerate(statuses, start):
+                        yield i, status
+
+            # Yield the chunks that are next in order
+            while next_start in completed:
+                statuses = completed.pop(next_start)
+                yield from statuses
+                next_start += len(statuses)
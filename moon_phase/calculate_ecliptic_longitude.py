@@ -3,26 +3,28 @@ from datetime import datetime, date
 from zoneinfo import ZoneInfo
 import numpy as np
 import ephem
-import math
 
 from .create_ephem_body import create_ephem_body
 from .parse_timestamp import parse_timestamp
 from .locate_device import locate_device
 from .process_time import process_time
+from .longitude_cache import longitude_cache
+from .time_scales import julian_centuries, mean_obliquity, nutation, true_obliquity
+from .observer_session import ObserverSession, resolve_session
+from .ephemeris_backend import EphemerisBackend, resolve_ephemeris_backend
+from .instrumentation import count, timed
 
 def julian_century(date: datetime) -> float:
     """
     Calculate the Julian Century (T) for a given date.
     
     Parameters:
-    date (datetime): The input date.
+    date (datetime): The input date. Timezone-aware dates are converted to UTC, naive dates are taken to be UTC.
     
     Returns:
     float: Julian Century (T)
     """
-    jd = date.toordinal() + 1721424.5 + (date.hour / 24) + (date.minute / 1440) + (date.second / 86400)
-    jd_j2000 = 2451545.0  # Julian Date for J2000.0
-    return (jd - jd_j2000) / 36525
+    return float(julian_centuries(date, terrestrial=False)[0])
 
 def calculate_obliquity_of_ecliptic(date: datetime) -> float:
     """
@@ -34,13 +36,7 @@ def calculate_obliquity_of_ecliptic(date: datetime) -> float:
     Returns:
     float: The mean obliquity of the ecliptic in degrees.
     """
-    T = julian_century(date)
-    
-    epsilon_0 = 84381.406  # Mean obliquity of the ecliptic at J2000.0 in arcseconds
-    epsilon = epsilon_0 - (46.836769 * T) - (0.0001831 * T**2) + (0.000000093 * T**3) - (0.0000000002 * T**4)
-    
-    # Convert mean obliquity from arcseconds to degrees
-    return epsilon / 3600.0  # arcseconds to degrees
+    return float(mean_obliquity(julian_centuries(date))[0])
 
 def nutation_in_obliquity(date: datetime) -> float:
     """
@@ -52,22 +48,9 @@ def nutation_in_obliquity(date: datetime) -> float:
     Returns:
     float: Nutation in the obliquity in degrees.
     """
-    T = julian_century(date)
-    
-    # Mean longitude of the Moon (in degrees)
-    L = (218.3164477 + 481267.88123421 * T) % 360.0  # degrees
-    
-    # Longitude of the ascending node of the Moon (in degrees)
-    Omega = (125.04452222 - 1934.13626197 * T) % 360.0  # degrees
-    
-    # Convert to radians
-    Omega_rad = math.radians(Omega)
-    
-    # Nutation in obliquity (arcseconds)
-    delta_epsilon = 0.00257 * math.sin(Omega_rad)  # First term approximation
-    
-    # Convert to degrees
-    return delta_epsilon / 3600.0  # arcseconds to degrees
+    _, delta_epsilon = nutation(julian_centuries(date))
+
+    return float(delta_epsilon[0])
 
 def true_obliquity_of_ecliptic(date: datetime) -> float:
     """
@@ -79,18 +62,17 @@ def true_obliquity_of_ecliptic(date: datetime) -> float:
     Returns:
     float: The true obliquity of the ecliptic in degrees.
     """
-    epsilon_mean = calculate_obliquity_of_ecliptic(date)
-    delta_epsilon = nutation_in_obliquity(date)
-    
-    # True obliquity of the ecliptic
-    return epsilon_mean + delta_epsilon
+    return float(true_obliquity(julian_centuries(date))[0])
 
+@timed()
 def calculate_ecliptic_longitude(
         body: Union[ephem.Body, str],
         dt: Union[ephem.Date, datetime, date, str] = None,
         timezone: Union[ZoneInfo, str] = None,
         lat: float = None,
-        lon: float = None) -> float:
+        lon: float = None,
+        session: ObserverSession = None,
+        backend: Union[EphemerisBackend, str] = None) -> float:
     """
     Calculate the ecliptic longitude of a celestial body.
 
@@ -104,10 +86,15 @@ def calculate_ecliptic_longitude(
                                                Defaults to None.
     lat (float, optional): The latitude of the observer. Defaults to None.
     lon (float, optional): The longitude of the observer. Defaults to None.
+    session (ObserverSession, optional): The observer session to take the timezone, latitude and longitude from. Defaults to None.
+    backend (Union[EphemerisBackend, str], optional): The ephemeris backend, or its name. Defaults to the global backend.
 
     Returns:
     float: The ecliptic longitude of the celestial body in degrees.
     """
+    # Take the timezone and coordinates from the session, if one is given
+    timezone, lat, lon = resolve_session(session, timezone, lat, lon)
+
     # If the body is provided as a string, create an ephem.Body object
     if isinstance(body, str):
         body = create_ephem_body(body)
@@ -119,14 +106,38 @@ def calculate_ecliptic_longitude(
     # Process the date and time, and adjust for the provided timezone
     dt, timezone = process_time(dt, timezone, lat, lon)
 
-    # Create an observer object with the provided or located coordinates and date/time
-    observer = ephem.Observer()
-    observer.lat = lat
-    observer.lon = lon
-    observer.date = dt
+    backend = resolve_ephemeris_backend(backend)
+
+    # Geocentric longitudes depend only on the body, the instant and the backend, so reuse a cached one if there is one
+    cache_key = None
+
+    if isinstance(body, ephem.Planet):
+        cache_key = (backend.name, body.name.lower(), round(dt.timestamp() * 1e6))
+        cached_longitude = longitude_cache.get(cache_key)
+
+        if cached_longitude is not None:
+            return cached_longitude
+
+    # Let other backends evaluate the bodies they know by name
+    if not backend.reference and isinstance(body, ephem.Planet):
+        ecliptic_longitude_degrees = float(backend.longitudes([body.name], [dt])[0, 0])
+        longitude_cache.put(cache_key, ecliptic_longitude_degrees)
+
+        return ecliptic_longitude_degrees
+
+    if session is not None and (lat, lon) == (session.lat, session.lon):
+        # Reuse the session's observer, set to the date/time
+        observer = session.observer_at(dt)
+    else:
+        # Create an observer object with the provided or located coordinates and date/time
+        observer = ephem.Observer()
+        observer.lat = lat
+        observer.lon = lon
+        observer.date = dt
 
     # Compute the position of the celestial body for the observer
     body.compute(observer)
+    count("ephem.compute")
 
     # Get the right ascension and declination
     ra = body.g_ra  # Right ascension in radians
@@ -145,4 +156,7 @@ def calculate_ecliptic_longitude(
     # Convert the result to degrees
     ecliptic_longitude_degrees = np.degrees(lambda_rad) % 360  # Normalize to 0-360 degrees
 
+    if cache_key is not None:
+        longitude_cache.put(cache_key, ecliptic_longitude_degrees)
+
     return ecliptic_longitude_degrees
\ No newline at end of file
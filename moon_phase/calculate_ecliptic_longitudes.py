@@ -0,0 +1,109 @@
+from typing import TYPE_CHECKING, Sequence, Union
+from datetime import datetime
+import numpy as np
+import ephem
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+from .create_ephem_body import create_ephem_body
+from .time_scales import ephem_dates_from_times, julian_centuries, true_obliquity
+from .observer_session import ObserverSession, resolve_session
+from .ephemeris_backend import EphemerisBackend, resolve_ephemeris_backend
+from .instrumentation import count, timed
+
+def ecliptic_longitude_from_equatorial(
+        ra: np.ndarray,
+        dec: np.ndarray,
+        epsilon: np.ndarray) -> np.ndarray:
+    """
+    Convert right ascension and declination to ecliptic longitude.
+
+    Parameters:
+    ra (np.ndarray): Right ascension in radians.
+    dec (np.ndarray): Declination in radians.
+    epsilon (np.ndarray): Obliquity of the ecliptic in radians.
+
+    Returns:
+    np.ndarray: Ecliptic longitude in degrees, normalized to 0-360.
+    """
+    sin_lambda = np.sin(ra) * np.cos(epsilon) + np.tan(dec) * np.sin(epsilon)
+    cos_lambda = np.cos(ra)
+
+    return np.degrees(np.arctan2(sin_lambda, cos_lambda)) % 360
+
+@timed()
+def calculate_ecliptic_longitudes(
+        body: Union[ephem.Body, str, Sequence[Union[ephem.Body, str]]],
+        times: Union[np.ndarray, "pd.DatetimeIndex", Sequence[datetime]],
+        lat: float = None,
+        lon: float = None,
+        session: ObserverSession = None,
+        backend: Union[EphemerisBackend, str] = None) -> np.ndarray:
+    """
+    Calculate the ecliptic longitude of one or more celestial bodies over an array of instants.
+
+    The positions are geocentric (g_ra/g_dec), so the observer's coordinates do not change the result
+    and the device is not located when they are omitted.
+
+    Parameters:
+    body (Union[ephem.Body, str, Sequence[Union[ephem.Body, str]]]): The celestial body, or a list of bodies.
+    times (Union[np.ndarray, pd.DatetimeIndex, Sequence[datetime]]): The instants, as a datetime64 array,
+        a pandas DatetimeIndex, a sequence of datetimes, or a numeric array of ephem.Date values.
+    lat (float, optional): The latitude of the observer. Defaults to None.
+    lon (float, optional): The longitude of the observer. Defaults to None.
+    session (ObserverSession, optional): The observer session to take the latitude and longitude from. Defaults to None.
+    backend (Union[EphemerisBackend, str], optional): The ephemeris backend, or its name. Defaults to the global backend.
+
+    Returns:
+    np.ndarray: A float64 array of ecliptic longitudes in degrees with one element per instant,
+                or a (time x body) matrix if a list of bodies is given.
+    """
+    # Take the coordinates from the session, if one is given
+    _, lat, lon = resolve_session(session, None, lat, lon)
+
+    single_body = isinstance(body, (ephem.Body, str))
+    bodies = [body] if single_body else list(body)
+
+    # Let other backends evaluate the bodies by name
+    backend = resolve_ephemeris_backend(backend)
+
+    if not backend.reference and all(isinstance(b, (str, ephem.Planet)) for b in bodies):
+        names = [b if isinstance(b, str) else b.name for b in bodies]
+        longitudes = backend.longitudes(names, times)
+
+        return longitudes[:, 0] if single_body else longitudes
+
+    # If the bodies are provided as strings, create ephem.Body objects
+    bodies = [create_ephem_body(b) if isinstance(b, str) else b for b in bodies]
+
+    ephem_dates = ephem_dates_from_times(times)
+
+    ra = np.empty((len(ephem_dates), len(bodies)), dtype=np.float64)
+    dec = np.empty((len(ephem_dates), len(bodies)), dtype=np.float64)
+
+    # Reuse a single observer for every instant and body
+    observer = ephem.Observer()
+
+    if lat is not None and lon is not None:
+        observer.lat = lat
+        observer.lon = lon
+
+    for i, ephem_date in enumerate(ephem_dates):
+        observer.date = ephem_date
+
+        for j, b in enumerate(bodies):
+            b.compute(observer)
+            ra[i, j] = b.g_ra
+            dec[i, j] = b.g_dec
+
+    count("ephem.compute", len(ephem_dates) * len(bodies))
+
+    # Convert the whole batch to ecliptic longitude at once
+    epsilon = np.radians(true_obliquity(julian_centuries(ephem_dates)))[:, np.newaxis]
+    longitudes = ecliptic_longitude_from_equatorial(ra, dec, epsilon)
+
+    if single_body:
+        return longitudes[:, 0]
+
+    return longitudes
@@ -0,0 +1,187 @@
+from typing import Dict, Sequence, Tuple
+from datetime import datetime
+import numpy as np
+
+from .constants import CHEBYSHEV_DEGREE, CHEBYSHEV_SEGMENT_DAYS
+from .time_scales import ephem_dates_from_times
+from .array_store import write_array_store, read_array_store
+
+CHEBYSHEV_YEAR_KIND = "chebyshev_longitudes"
+CHEBYSHEV_YEAR_VERSION = 1
+
+def chebyshev_nodes(degree: int) -> np.ndarray:
+    """
+    Get the Chebyshev-Gauss nodes in [-1, 1] used to fit a polynomial of a given degree, in increasing order.
+    """
+    n = degree + 1
+
+    return -np.cos(np.pi * (np.arange(n) + 0.5) / n)
+
+def chebyshev_fit_matrix(degree: int) -> np.ndarray:
+    """
+    Get the matrix taking values at the nodes of chebyshev_nodes to the coefficients of the interpolating Chebyshev series.
+    """
+    n = degree + 1
+    angles = np.pi * (np.arange(n)[:, np.newaxis] + 0.5) / n
+
+    # Increasing nodes are cos(pi - angle), so the k-th basis value at them is (-1)^k cos(k angle)
+    matrix = (2.0 / n) * np.cos(angles * np.arange(n)) * (-1.0) ** np.arange(n)
+    matrix[:, 0] /= 2
+
+    return matrix
+
+def chebyshev_values(coefficients: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """
+    Evaluate a Chebyshev series per row by Clenshaw's recurrence.
+
+    Parameters:
+    coefficients (np.ndarray): An (instant x coefficient) matrix, one series per instant.
+    x (np.ndarray): The argument of each series, in [-1, 1].
+
+    Returns:
+    np.ndarray: The value of each series.
+    """
+    b1 = np.zeros_like(x)
+    b2 = np.zeros_like(x)
+
+    for k in range(coefficients.shape[1] - 1, 0, -1):
+        b1, b2 = 2 * x * b1 - b2 + coefficients[:, k], b1
+
+    return x * b1 - b2 + coefficients[:, 0]
+
+class ChebyshevYear:
+    """
+    Piecewise Chebyshev fits of the unwrapped ecliptic longitude of several bodies over one calendar year (UTC).
+
+    Each body's year is cut into segments of segment_days[body] days from the start of the year,
+    the last one running past its end, and coefficients[body] holds one row of Chebyshev
+    coefficients per segment. Longitudes and their speeds are evaluated for any number of
+    instants at once.
+    """
+    def __init__(
+            self,
+            year: int,
+            degree: int,
+            segment_days: Dict[str, float],
+            coefficients: Dict[str, np.ndarray]):
+        self.year = year
+        self.degree = degree
+        self.segment_days = segment_days
+        self.coefficients = coefficients
+        self.start = float(ephem_dates_from_times(datetime(year, 1, 1))[0])
+        self.end = float(ephem_dates_from_times(datetime(year + 1, 1, 1))[0])
+
+        # Coefficients of the derivative of each segment's series, with respect to its argument
+        self.derivatives = {
+            body: np.polynomial.chebyshev.chebder(np.asarray(body_coefficients), axis=1)
+            for body, body_coefficients in coefficients.items()
+        }
+
+    @property
+    def bodies(self) -> Sequence[str]:
+        return list(self.coefficients)
+
+    def evaluate(self, body: str, ephem_dates: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate the longitude of a body and its speed.
+
+        Parameters:
+        body (str): The lowercase body name.
+        ephem_dates (np.ndarray): ephem.Date values within the year.
+
+        Returns:
+        Tuple[np.ndarray, np.ndarray]: The longitudes in degrees (0-360) and the speeds in degrees per day.
+        """
+        segment_days = self.segment_days[body]
+        coefficients = self.coefficients[body]
+
+        # Find the segment of each instant and its position within the segment
+        offsets = np.asarray(ephem_dates, dtype=np.float64) - self.start
+        segments = np.clip((offsets // segment_days).astype(np.int64), 0, len(coefficients) - 1)
+        x = 2 * (offsets - segments * segment_days) / segment_days - 1
+
+        longitudes = chebyshev_values(coefficients[segments], x) % 360
+        speeds = chebyshev_values(self.derivatives[body][segments], x) * 2 / segment_days
+
+        return longitudes, speeds
+
+    def save(self, path: str):
+        """
+        Write the fits to a file that can be memory-mapped by load.
+
+        Parameters:
+        path (str): The file to write.
+        """
+        arrays = {f"{body}_coefficients": np.asarray(self.coefficients[body], dtype=np.float64) for body in self.bodies}
+
+        metadata = {
+            "year": self.year,
+            "degree": self.degree,
+            "segment_days": self.segment_days,
+            "bodies": self.bodies
+        }
+
+        write_array_store(path, CHEBYSHEV_YEAR_KIND, CHEBYSHEV_YEAR_VERSION, arrays, metadata)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "ChebyshevYear":
+        """
+        Read fits written by save.
+
+        Parameters:
+        path (str): The file to read.
+        mmap (bool, optional): Memory-map the arrays instead of loading them. Defaults to True.
+
+        Returns:
+        ChebyshevYear: The loaded fits.
+        """
+        arrays, metadata = read_array_store(path, CHEBYSHEV_YEAR_KIND, CHEBYSHEV_YEAR_VERSION, mmap=mmap)
+        coefficients = {body: arrays[f"{body}_coefficients"] for body in metadata["bodies"]}
+
+        return cls(metadata["year"], metadata["degree"], metadata["segment_days"], coefficients)
+
+def build_chebyshev_year(
+        year: int,
+        bodies: Sequence[str] = tuple(CHEBYSHEV_SEGMENT_DAYS),
+        degree: int = CHEBYSHEV_DEGREE,
+        segment_days: Dict[str, float] = None) -> ChebyshevYear:
+    """
+    Fit piecewise Chebyshev series to the ecliptic longitudes of bodies over a year.
+
+    The longitudes are sampled at the Chebyshev nodes of every segment in one call of
+    calculate_ecliptic_longitudes with the reference backend, unwrapped within each
+    segment, and interpolated.
+
+    Parameters:
+    year (int): The calendar year (UTC).
+    bodies (Sequence[str], optional): The bodies to fit. Defaults to the bodies in CHEBYSHEV_SEGMENT_DAYS.
+    degree (int, optional): The degree of each segment's series. Defaults to CHEBYSHEV_DEGREE.
+    segment_days (Dict[str, float], optional): The segment length of each body in days. Defaults to CHEBYSHEV_SEGMENT_DAYS.
+
+    Returns:
+    ChebyshevYear: The fits.
+    """
+    from .calculate_ecliptic_longitudes import calculate_ecliptic_longitudes
+
+    bodies = [body.lower() for body in bodies]
+    segment_days = {body: float((segment_days or CHEBYSHEV_SEGMENT_DAYS)[body]) for body in bodies}
+
+    start = float(ephem_dates_from_times(datetime(year, 1, 1))[0])
+    end = float(ephem_dates_from_times(datetime(year + 1, 1, 1))[0])
+    nodes = (chebyshev_nodes(degree) + 1) / 2
+    fit_matrix = chebyshev_fit_matrix(degree)
+
+    coefficients = {}
+
+    for body in bodies:
+        length = segment_days[body]
+        segment_starts = start + length * np.arange(int(np.ceil((end - start) / length)))
+
+        # Sample every segment at its nodes, as a (segment x node) matrix of unwrapped longitudes
+        times = (segment_starts[:, np.newaxis] + length * nodes).ravel()
+        longitudes = calculate_ecliptic_longitudes(body, times, backend="ephem").reshape(len(segment_starts), -1)
+        longitudes = np.unwrap(longitudes, period=360, axis=1)
+
+        coefficients[body] = longitudes @ fit_matrix
+
+    return ChebyshevYear(year, degree, segment_days, coefficients)
@@ -12,3 +12,126 @@ ZODIAC_SIGNS = [
     "Aquarius",
     "Pisces"
 ]
+
+# Upper bounds on the geocentric ecliptic longitude speed of each body in degrees per day
+MAX_LONGITUDE_SPEED = {
+    "sun": 1.05,
+    "moon": 16.0,
+    "mercury": 2.3,
+    "venus": 1.3,
+    "mars": 0.85,
+    "jupiter": 0.25,
+    "saturn": 0.14
+}
+
+# Smallest coarse step in days taken while bracketing a sign ingress
+MIN_INGRESS_STEP = {
+    "sun": 0.25,
+    "moon": 1 / 24,
+    "mercury": 0.25,
+    "venus": 0.25,
+    "mars": 0.25,
+    "jupiter": 0.25,
+    "saturn": 0.25
+}
+
+# Bodies whose geocentric motion can be retrograde
+RETROGRADE_BODIES = ["mercury", "venus", "mars", "jupiter", "saturn"]
+
+# Coarse step in days when scanning for stations, shorter than half of the body's shortest retrograde or direct period
+STATION_SCAN_STEP = {
+    "mercury": 2.0,
+    "venus": 4.0,
+    "mars": 5.0,
+    "jupiter": 8.0,
+    "saturn": 8.0
+}
+
+# Longest retrograde period of each body in days, rounded up
+MAX_RETROGRADE_DAYS = {
+    "mercury": 25,
+    "venus": 45,
+    "mars": 82,
+    "jupiter": 125,
+    "saturn": 145
+}
+
+# Principal moon phases in the order they occur, indexed by the phase codes of the lunation catalog
+PRINCIPAL_PHASES = [
+    "New",
+    "First Quarter",
+    "Full",
+    "Last Quarter"
+]
+
+# Intermediate moon phases by quadrant of the Moon's elongation from the Sun, 0-90 degrees first
+INTERMEDIATE_PHASES = [
+    "Waxing Crescent",
+    "Waxing Gibbous",
+    "Waning Gibbous",
+    "Waning Crescent"
+]
+
+# Mean length of the synodic month in days, and the mean daily increase of the Moon's elongation in degrees
+SYNODIC_MONTH_DAYS = 29.530588853
+MEAN_ELONGATION_RATE = 360 / SYNODIC_MONTH_DAYS
+
+# Ways determine_moon_phase can find the phase: searching for the next principal phase, or reading the Sun-Moon elongation
+MOON_PHASE_METHODS = ("search", "elongation")
+
+# Number of (body, instant) ecliptic longitudes kept by the shared longitude cache
+LONGITUDE_CACHE_SIZE = 4096
+
+# Seconds a located device position is reused before the location providers run again
+LOCATION_CACHE_TTL = 3600
+
+# Local file holding the device position, read if no coordinates are set or in the environment
+LOCATION_FILE = "~/.moon_phase_location"
+
+# Environment variables configuring how the device is located
+LATITUDE_VARIABLE = "MOON_PHASE_LAT"
+LONGITUDE_VARIABLE = "MOON_PHASE_LON"
+LOCATION_FILE_VARIABLE = "MOON_PHASE_LOCATION_FILE"
+OFFLINE_VARIABLE = "MOON_PHASE_OFFLINE"
+
+# Size in degrees of the grid cells that coordinates are snapped to for timezone lookups, about 1 km
+TIMEZONE_QUANTUM_DEGREES = 0.01
+
+# Number of grid cells whose timezone is kept by the timezone cache
+TIMEZONE_CACHE_SIZE = 65536
+
+# Number of free-form timestamp strings whose dateparser results are cached
+TIMESTAMP_CACHE_SIZE = 1024
+
+# Bodies evaluated together by the day snapshot engine
+SNAPSHOT_BODIES = ["Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn"]
+
+# Number of (date, timezone) day snapshots kept in memory
+SNAPSHOT_CACHE_SIZE = 256
+
+# Number of results kept by each observer session's cache, dropping the least recently used
+SESSION_CACHE_SIZE = 4096
+
+# Number of status requests sent to a worker process at once by batch_status
+BATCH_CHUNK_SIZE = 64
+
+# Length in days of the Chebyshev segments fitted to each body's ecliptic longitude, shorter for faster and more irregular motion
+CHEBYSHEV_SEGMENT_DAYS = {
+    "sun": 32,
+    "moon": 4,
+    "mercury": 8,
+    "venus": 16,
+    "mars": 16,
+    "jupiter": 64,
+    "saturn": 64
+}
+
+# Degree of the Chebyshev polynomial fitted to each segment
+CHEBYSHEV_DEGREE = 12
+
+# Number of years of Chebyshev fits kept in memory
+CHEBYSHEV_CACHE_YEARS = 16
+
+# Directory holding a file of Chebyshev fits for each year, and the environment variable overriding it
+CHEBYSHEV_CACHE_DIRECTORY = "~/.cache/moon_phase/chebyshev"
+CHEBYSHEV_CACHE_VARIABLE = "MOON_PHASE_CHEBYSHEV_CACHE"
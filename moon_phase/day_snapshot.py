@@ -0,0 +1,140 @@
+from typing import Sequence, Union
+from datetime import datetime, date, time, timedelta, timezone as dt_timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+import numpy as np
+import ephem
+
+from .constants import ZODIAC_SIGNS, RETROGRADE_BODIES, SNAPSHOT_BODIES, SNAPSHOT_CACHE_SIZE
+from .process_date import process_date
+from .process_time import process_time
+from .observer_session import ObserverSession, resolve_session
+from .ephemeris_backend import EphemerisBackend, resolve_ephemeris_backend
+from .retrograde_index import retrograde_index_for_year
+from .instrumentation import timed
+
+class DaySnapshot:
+    """
+    The ecliptic longitudes of several bodies at local midnight of the day before, the day of, and the day after a date.
+
+    longitudes is a (3 x body) matrix in degrees, with rows for d - 1, d and d + 1.
+    Sign and movement through the sign of every body are read from it. Retrograde motion
+    is looked up in the retrograde periods of the planet, as is_retrograde does.
+    """
+    def __init__(
+            self,
+            d: date,
+            timezone: ZoneInfo,
+            bodies: Sequence[str],
+            longitudes: np.ndarray):
+        self.date = d
+        self.timezone = timezone
+        self.bodies = [body.lower() for body in bodies]
+        self.longitudes = longitudes
+        self.signs = (longitudes // 30).astype(np.int8) % 12
+
+    def _column(self, body: Union[ephem.Body, str]) -> int:
+        body_name = body if isinstance(body, str) else body.name
+
+        return self.bodies.index(body_name.lower())
+
+    def sign(self, body: Union[ephem.Body, str]) -> str:
+        """
+        Get the sign of a body at midnight of the date.
+
+        Parameters:
+        body (Union[ephem.Body, str]): The body, case-insensitive.
+
+        Returns:
+        str: The zodiac sign.
+        """
+        return ZODIAC_SIGNS[self.signs[1, self._column(body)]]
+
+    def movement(self, body: Union[ephem.Body, str]) -> str:
+        """
+        Describe how a body moves through its sign on the date.
+
+        Parameters:
+        body (Union[ephem.Body, str]): The body, case-insensitive.
+
+        Returns:
+        str: "enters" if the body was in another sign the day before, "leaves" if it is in another sign
+             the day after, or "in" otherwise.
+        """
+        yesterday_sign, sign, tomorrow_sign = self.signs[:, self._column(body)]
+
+        if yesterday_sign != sign:
+            return "enters"
+        elif tomorrow_sign != sign:
+            return "leaves"
+        else:
+            return "in"
+
+    def is_retrograde(self, body: Union[ephem.Body, str]) -> bool:
+        """
+        Check whether a body is in retrograde motion at midnight of the date.
+
+        Parameters:
+        body (Union[ephem.Body, str]): The body, case-insensitive.
+
+        Returns:
+        bool: True if midnight falls in one of the body's retrograde periods.
+        """
+        body_name = self.bodies[self._column(body)]
+
+        if body_name not in RETROGRADE_BODIES:
+            return False
+
+        # Look midnight up between the stations of its year, so that the flag matches is_retrograde near a station
+        midnight = datetime.combine(self.date, time.min, tzinfo=self.timezone)
+        index = retrograde_index_for_year(body_name, midnight.astimezone(dt_timezone.utc).year)
+
+        return index.is_retrograde(body_name, midnight.timestamp())
+
+@lru_cache(maxsize=SNAPSHOT_CACHE_SIZE)
+def day_snapshot_in_timezone(d: date, timezone: ZoneInfo, bodies: tuple, backend: EphemerisBackend) -> DaySnapshot:
+    """
+    Take and cache the snapshot of a date in a timezone. Geocentric longitudes do not depend on the observer's coordinates.
+    """
+    midnight = datetime.combine(d, time.min, tzinfo=timezone)
+    times = [midnight - timedelta(days=1), midnight, midnight + timedelta(days=1)]
+
+    return DaySnapshot(d, timezone, bodies, backend.sign_longitudes(list(bodies), times))
+
+@timed()
+def take_day_snapshot(
+        d: Union[ephem.Date, datetime, date, str] = None,
+        timezone: Union[ZoneInfo, str] = None,
+        lat: float = None,
+        lon: float = None,
+        bodies: Sequence[str] = SNAPSHOT_BODIES,
+        session: ObserverSession = None,
+        backend: Union[EphemerisBackend, str] = None) -> DaySnapshot:
+    """
+    Evaluate the ecliptic longitudes of several bodies at local midnight of the day before, the day of, and the day after a date in one pass.
+
+    Parameters:
+    d (Union[ephem.Date, datetime, date, str], optional): The date. Defaults to None.
+    timezone (Union[ZoneInfo, str], optional): The timezone of the date. Defaults to None.
+    lat (float, optional): The latitude of the location. Defaults to None.
+    lon (float, optional): The longitude of the location. Defaults to None.
+    bodies (Sequence[str], optional): The bodies to evaluate. Defaults to the Sun, Moon and Mercury through Saturn.
+    session (ObserverSession, optional): The observer session to take the timezone, latitude and longitude from. Defaults to None.
+    backend (Union[EphemerisBackend, str], optional): The ephemeris backend, or its name. Defaults to the global backend.
+
+    Returns:
+    DaySnapshot: The snapshot of the date.
+    """
+    # Take the timezone and coordinates from the session, if one is given
+    timezone, lat, lon = resolve_session(session, timezone, lat, lon)
+
+    # Process the date, and find the timezone of its midnight
+    d, timezone = process_date(d, timezone, lat, lon)
+    midnight, timezone = process_time(d, timezone, lat, lon)
+
+    return day_snapshot_in_timezone(
+        d,
+        midnight.tzinfo,
+        tuple(body.lower() for body in bodies),
+        resolve_ephemeris_backend(backend)
+    )
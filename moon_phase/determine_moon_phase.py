@@ -1,4 +1,4 @@
-from datetime import datetime, timezone, date
+from datetime import datetime, timezone, date, time, timedelta
 from zoneinfo import ZoneInfo
 from typing import Optional, Union
 
@@ -7,12 +7,21 @@ import ephem
 from .process_time import process_time
 from .find_next_phase import find_next_phase
 from .preceding_intermediate_phase import preceding_intermediate_phase
+from .observer_session import ObserverSession, resolve_session
+from .moon_phase_angles import moon_elongations, classify_moon_phases
+from .ephemeris_backend import EphemerisBackend
+from .constants import MOON_PHASE_METHODS
+from .instrumentation import timed
 
+@timed()
 def determine_moon_phase(
         dt: Union[ephem.Date, datetime, date, str] = None,
         timezone: Union[ZoneInfo, str] = None,
         lat: float = None,
-        lon: float = None) -> str:
+        lon: float = None,
+        session: ObserverSession = None,
+        method: str = "search",
+        backend: Union[EphemerisBackend, str] = None) -> str:
     """
     Determine the moon phase for a given date and location.
 
@@ -21,15 +30,38 @@ def determine_moon_phase(
     timezone (Union[ZoneInfo, str]): The timezone of the given date and time.
     lat (float): The latitude of the location.
     lon (float): The longitude of the location.
+    session (ObserverSession, optional): The observer session to take the timezone, latitude and longitude from. Defaults to None.
+    method (str, optional): "search" to find the next principal phase, or "elongation" to classify the
+                            Sun-Moon elongation at dt and at the end of its day. Defaults to "search".
+    backend (Union[EphemerisBackend, str], optional): The ephemeris backend for the "elongation" method. Defaults to the global backend.
 
     Returns:
     str: The name of the moon phase.
     """
+    # Take the timezone and coordinates from the session, if one is given
+    timezone, lat, lon = resolve_session(session, timezone, lat, lon)
+
+    if method not in MOON_PHASE_METHODS:
+        raise ValueError(f"Unknown moon phase method {method!r}, expected one of {MOON_PHASE_METHODS}")
+
     # Process the input date, time, and location to get a datetime object and timezone
     dt, timezone = process_time(dt, timezone, lat, lon)
 
-    # Get the next moon phase name and its datetime
-    next_phase_name, next_phase_datetime = find_next_phase(dt)
+    # Name the phase from the elongation now and at the next local midnight, without searching for the next phase
+    if method == "elongation":
+        day_end = datetime.combine(dt.date() + timedelta(days=1), time(), tzinfo=dt.tzinfo)
+        elongations = moon_elongations([dt, day_end], backend)
+
+        return str(classify_moon_phases(elongations[:1], elongations[1:])[0])
+
+    # Get the next moon phase name and its datetime, reusing one found earlier in the session
+    if session is not None:
+        next_phase_name, next_phase_datetime = session.cached(
+            ("next_phase", dt.timestamp(), timezone),
+            lambda: find_next_phase(dt, timezone, lat, lon)
+        )
+    else:
+        next_phase_name, next_phase_datetime = find_next_phase(dt, timezone, lat, lon)
     next_phase_date = next_phase_datetime.date()
     given_date = dt.date()
 
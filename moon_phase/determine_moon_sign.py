@@ -5,12 +5,14 @@ from zoneinfo import ZoneInfo
 import ephem
 
 from .determine_sign import determine_sign
+from .observer_session import ObserverSession, resolve_session
 
 def determine(
         dt: Union[datetime, date, str] = None,
         timezone: Union[ZoneInfo, str] = None,
         lat: float = None,
-        lon: float = None) -> str:
+        lon: float = None,
+        session: ObserverSession = None) -> str:
     """
     Calculate the moon sign for a given date, time, and location.
 
@@ -20,9 +22,13 @@ def determine(
     timezone (Union[ZoneInfo, str], optional): The timezone for the given date and time. Can be a ZoneInfo object or string. Defaults to None.
     lat (float, optional): The latitude of the location. Defaults to None.
     lon (float, optional): The longitude of the location. Defaults to None.
+    session (ObserverSession, optional): The observer session to take the timezone, latitude and longitude from. Defaults to None.
 
     Returns:
     str: The moon sign for the given date, time, and location.
     """
+    # Take the timezone and coordinates from the session, if one is given
+    timezone, lat, lon = resolve_session(session, timezone, lat, lon)
+
     # Use the get_sign function to calculate the moon sign
-    return determine_sign(ephem.Moon(), dt, timezone, lat, lon)
\ No newline at end of file
+    return determine_sign(ephem.Moon(), dt, timezone, lat, lon, session=session)
\ No newline at end of file
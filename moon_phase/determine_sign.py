@@ -1,49 +1,112 @@
 from datetime import datetime, date
 from typing import Union
 from zoneinfo import ZoneInfo
-import geocoder
-import dateparser
 import ephem
-import numpy as np
 
+from .constants import ZODIAC_SIGNS
 from .create_ephem_body import create_ephem_body
 from .calculate_ecliptic_longitude import calculate_ecliptic_longitude
 from .tropical_zodiac_from_ecliptic_longitude import tropical_zodiac_from_ecliptic_longitude
+from .locate_device import locate_device
+from .process_time import process_time
+from .sign_ingress_index import get_sign_ingress_index
+from .observer_session import ObserverSession, resolve_session
+from .ephemeris_backend import EphemerisBackend, near_sign_boundary, resolve_ephemeris_backend
+from .instrumentation import count, timed
 
+@timed()
 def determine_sign(
         body: ephem.Body,
         dt: Union[datetime, date, str] = None,
         timezone: Union[ZoneInfo, str] = None,
         lat: float = None,
-        lon: float = None) -> str:
+        lon: float = None,
+        session: ObserverSession = None,
+        backend: Union[EphemerisBackend, str] = None) -> str:
     """
     Determine the astrological sign of a celestial body at a given date and time.
 
+    If a sign ingress index is in use and covers the given time, the sign is looked up in it.
+    Otherwise it is computed from the ecliptic longitude of the body. Longitudes from an approximate
+    backend that fall within its error bound of a sign boundary are recomputed with the reference backend.
+
     Parameters:
     body (ephem.Body): The celestial body for which to determine the sign.
     dt (Union[datetime, date, str], optional): The date and time for which to determine the sign. Defaults to None.
     timezone (Union[ZoneInfo, str], optional): The timezone of the given date and time. Defaults to None.
     lat (float, optional): The latitude of the observer. Defaults to None.
     lon (float, optional): The longitude of the observer. Defaults to None.
+    session (ObserverSession, optional): The observer session to take the timezone, latitude and longitude from. Defaults to None.
+    backend (Union[EphemerisBackend, str], optional): The ephemeris backend, or its name. Defaults to the global backend.
 
     Returns:
     str: The astrological sign of the celestial body.
     """
+    # Take the timezone and coordinates from the session, if one is given
+    timezone, lat, lon = resolve_session(session, timezone, lat, lon)
+
     
     # If the body is given as a string, create the ephem.Body object
     if isinstance(body, str):
         body = create_ephem_body(body)
 
+    # If latitude or longitude is not provided, locate the device to get the coordinates
+    if lat is None or lon is None:
+        lat, lon = locate_device()
+
+    # Process the date and time, and adjust for the provided timezone
+    dt, timezone = process_time(dt, timezone, lat, lon)
+
+    backend = resolve_ephemeris_backend(backend)
+
+    # Look the sign up in the ingress index if it covers the given time
+    index = get_sign_ingress_index()
+
+    if index is not None:
+        sign_index = index.lookup(body.name, dt.timestamp())
+
+        if sign_index is not None:
+            return ZODIAC_SIGNS[sign_index]
+
+    # Reuse the sign found earlier in the session for the same body and instant
+    cache_key = ("sign", body.name.lower(), dt.timestamp())
+
+    if session is not None:
+        sign = session.cache.get(cache_key)
+
+        if sign is not None:
+            count("cache.session.hits")
+            return sign
+
+        count("cache.session.misses")
+
     # Calculate the ecliptic longitude of the body
     ecliptic_longitude_degrees = calculate_ecliptic_longitude(
         body=body, 
         dt=dt, 
         timezone=timezone, 
         lat=lat, 
-        lon=lon
+        lon=lon,
+        session=session,
+        backend=backend
     )
-    
+
+    # Confirm a longitude that the backend's error could place in the neighboring sign
+    if near_sign_boundary(ecliptic_longitude_degrees, backend.max_error(body.name)):
+        ecliptic_longitude_degrees = calculate_ecliptic_longitude(
+            body=body,
+            dt=dt,
+            timezone=timezone,
+            lat=lat,
+            lon=lon,
+            session=session,
+            backend="ephem"
+        )
+
     # Determine the astrological sign from the ecliptic longitude
     sign = tropical_zodiac_from_ecliptic_longitude(ecliptic_longitude_degrees)
 
-    return sign
\ No newline at end of file
+    if session is not None:
+        session.cache[cache_key] = sign
+
+    return sign
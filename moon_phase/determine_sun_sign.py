@@ -5,12 +5,14 @@ from zoneinfo import ZoneInfo
 import ephem
 
 from .determine_sign import determine_sign
+from .observer_session import ObserverSession, resolve_session
 
 def determine_sun_sign(
         dt: Union[datetime, date, str] = None,
         timezone: Union[ZoneInfo, str] = None,
         lat: float = None,
-        lon: float = None) -> str:
+        lon: float = None,
+        session: ObserverSession = None) -> str:
     """
     Determine the sun sign based on the provided date, time, and location.
 
@@ -20,17 +22,22 @@ def determine_sun_sign(
     timezone (Union[ZoneInfo, str], optional): The timezone information. Can be a ZoneInfo object or string. Defaults to None.
     lat (float, optional): The latitude of the location. Defaults to None.
     lon (float, optional): The longitude of the location. Defaults to None.
+    session (ObserverSession, optional): The observer session to take the timezone, latitude and longitude from. Defaults to None.
 
     Returns:
     str: The sun sign for the given date, time, and location.
     """
+    # Take the timezone and coordinates from the session, if one is given
+    timezone, lat, lon = resolve_session(session, timezone, lat, lon)
+
     # Determine the sun sign using the determine_sign function
     sign = determine_sign(
         body=ephem.Sun(), 
         dt=dt, 
         timezone=timezone, 
         lat=lat, 
-        lon=lon
+        lon=lon,
+        session=session
     )
 
     # Return the determined sun sign
@@ -0,0 +1,383 @@
+from typing import Dict, Optional, Sequence, Tuple, Union
+from collections import OrderedDict
+from datetime import datetime
+from threading import Lock
+import os
+import numpy as np
+
+from .constants import (
+    CHEBYSHEV_CACHE_DIRECTORY,
+    CHEBYSHEV_CACHE_VARIABLE,
+    CHEBYSHEV_CACHE_YEARS,
+    CHEBYSHEV_DEGREE,
+    CHEBYSHEV_SEGMENT_DAYS
+)
+from .time_scales import TimesLike, ephem_dates_from_times, julian_centuries, utc_years_from_ephem_dates
+from .chebyshev_ephemeris import ChebyshevYear, build_chebyshev_year
+from .analytic_ephemeris import (
+    ANALYTIC_FIRST_YEAR,
+    ANALYTIC_LAST_YEAR,
+    ANALYTIC_MAX_ERROR_DEGREES,
+    ANALYTIC_MAX_DAILY_MOTION_ERROR_DEGREES,
+    analytic_longitudes
+)
+
+class EphemerisBackend:
+    """
+    A source of apparent geocentric ecliptic longitudes, on the true ecliptic and equinox of date.
+
+    Subclasses implement longitudes. max_error_degrees maps each body name to the largest
+    difference from the reference backend, so callers can tell when a result is too close
+    to a sign boundary to trust, and max_daily_motion_error_degrees bounds the error of the
+    change in longitude over a day, which tells when a planet is too close to a station.
+    Both are empty or 0 for the reference backend.
+    """
+    name = "backend"
+    reference = False
+    max_error_degrees: Dict[str, float] = {}
+    max_daily_motion_error_degrees = 0.0
+
+    def longitudes(self, bodies: Sequence[str], times: TimesLike) -> np.ndarray:
+        """
+        Calculate the ecliptic longitudes of bodies over an array of instants.
+
+        Parameters:
+        bodies (Sequence[str]): The body names.
+        times (TimesLike): The instants. See time_scales.ephem_dates_from_times.
+
+        Returns:
+        np.ndarray: A (time x body) matrix of longitudes in degrees, 0-360.
+        """
+        raise NotImplementedError
+
+    def speeds(self, bodies: Sequence[str], times: TimesLike) -> np.ndarray:
+        """
+        Calculate the speeds of the bodies in ecliptic longitude, from the change over the day around each instant.
+
+        Parameters:
+        bodies (Sequence[str]): The body names.
+        times (TimesLike): The instants. See time_scales.ephem_dates_from_times.
+
+        Returns:
+        np.ndarray: A (time x body) matrix of speeds in degrees per day, negative for retrograde motion.
+        """
+        ephem_dates = ephem_dates_from_times(times)
+        before = self.longitudes(bodies, ephem_dates - 0.5)
+        after = self.longitudes(bodies, ephem_dates + 0.5)
+
+        # Wrap the change so that crossing 0 degrees Aries does not look like a jump backwards
+        return (after - before + 180) % 360 - 180
+
+    def max_error(self, body: str) -> float:
+        """
+        Get the error bound of a body's longitudes in degrees, 0 for the reference backend.
+        """
+        return self.max_error_degrees.get(body.lower(), 0.0)
+
+    def sign_longitudes(self, bodies: Sequence[str], times: TimesLike) -> np.ndarray:
+        """
+        Calculate longitudes as longitudes does, recomputing with the reference backend those within
+        the error bound of a sign boundary, so that the sign of every longitude is the reference sign.
+
+        Parameters:
+        bodies (Sequence[str]): The body names.
+        times (TimesLike): The instants. See time_scales.ephem_dates_from_times.
+
+        Returns:
+        np.ndarray: A (time x body) matrix of longitudes in degrees, 0-360.
+        """
+        longitudes = self.longitudes(bodies, times)
+
+        if self.reference:
+            return longitudes
+
+        near = near_sign_boundary(longitudes, np.array([self.max_error(body) for body in bodies]))
+
+        if near.any():
+            rows = np.flatnonzero(near.any(axis=1))
+            columns = np.flatnonzero(near.any(axis=0))
+            block = np.ix_(rows, columns)
+
+            reference_longitudes = EPHEMERIS_BACKENDS["ephem"].longitudes(
+                [bodies[column] for column in columns],
+                ephem_dates_from_times(times)[rows]
+            )
+            longitudes[block] = np.where(near[block], reference_longitudes, longitudes[block])
+
+        return longitudes
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+class EphemBackend(EphemerisBackend):
+    """
+    The reference backend: each body and instant is computed by ephem.
+    The error bounds of the other backends are measured against it.
+    """
+    name = "ephem"
+    reference = True
+
+    def longitudes(self, bodies: Sequence[str], times: TimesLike) -> np.ndarray:
+        from .calculate_ecliptic_longitudes import calculate_ecliptic_longitudes
+
+        return calculate_ecliptic_longitudes(list(bodies), times, backend=self)
+
+class AnalyticBackend(EphemerisBackend):
+    """
+    A vectorized NumPy backend evaluating truncated series, for large batches of instants.
+
+    The Sun follows Meeus chapter 25, the Moon the main terms of Meeus chapter 47, and Mercury
+    through Saturn Standish's Keplerian elements with light time, precession, nutation and
+    aberration. Between ANALYTIC_FIRST_YEAR and ANALYTIC_LAST_YEAR the longitudes stay within
+    ANALYTIC_MAX_ERROR_DEGREES of ephem: under an arcminute for the Sun, Moon and Mercury,
+    about 2' for Venus, 5' for Mars, 12' for Jupiter and 24' for Saturn. Daily motions stay
+    within ANALYTIC_MAX_DAILY_MOTION_ERROR_DEGREES, 9 arcseconds.
+
+    Instants outside those years, and bodies without an analytic theory, are computed by the
+    reference backend instead.
+    """
+    name = "analytic"
+
+    max_error_degrees = ANALYTIC_MAX_ERROR_DEGREES
+    max_daily_motion_error_degrees = ANALYTIC_MAX_DAILY_MOTION_ERROR_DEGREES
+
+    def longitudes(self, bodies: Sequence[str], times: TimesLike) -> np.ndarray:
+        bodies = [body.lower() for body in bodies]
+        times = ephem_dates_from_times(times)
+        longitudes = np.empty((len(times), len(bodies)), dtype=np.float64)
+
+        # Split the instants and bodies into those the series cover and the rest
+        first, last = ephem_dates_from_times([datetime(ANALYTIC_FIRST_YEAR, 1, 1), datetime(ANALYTIC_LAST_YEAR, 1, 1)])
+        covered_times = (times >= first) & (times < last)
+        covered_bodies = np.array([body in self.max_error_degrees for body in bodies], dtype=bool)
+
+        if covered_times.any() and covered_bodies.any():
+            T = julian_centuries(times[covered_times])
+            longitudes[np.ix_(covered_times, covered_bodies)] = analytic_longitudes(
+                [body for body, covered in zip(bodies, covered_bodies) if covered],
+                T
+            )
+
+        # Fill in the rest from the reference backend
+        reference = EPHEMERIS_BACKENDS["ephem"]
+
+        if not covered_bodies.all() and len(times):
+            uncovered = ~covered_bodies
+            longitudes[:, uncovered] = reference.longitudes([body for body, covered in zip(bodies, uncovered) if covered], times)
+
+        if not covered_times.all() and covered_bodies.any():
+            longitudes[np.ix_(~covered_times, covered_bodies)] = reference.longitudes(
+                [body for body, covered in zip(bodies, covered_bodies) if covered],
+                times[~covered_times]
+            )
+
+        return longitudes
+
+def near_sign_boundary(longitudes: np.ndarray, margin: np.ndarray) -> np.ndarray:
+    """
+    Check which longitudes are within a margin of a sign boundary, where an error of that size could change their sign.
+
+    Parameters:
+    longitudes (np.ndarray): Longitudes in degrees.
+    margin (np.ndarray): The margin in degrees, broadcast against the longitudes.
+
+    Returns:
+    np.ndarray: True where a longitude is near a boundary.
+    """
+    offset = np.asarray(longitudes) % 30
+
+    return (offset < margin) | (offset > 30 - np.asarray(margin))
+
+class ChebyshevBackend(EphemerisBackend):
+    """
+    A backend interpolating piecewise Chebyshev fits of the reference longitudes, for repeated queries in a bounded window.
+
+    The fits cover a calendar year at a time. They are built from the reference backend the first
+    time a year is queried and kept in memory, for the last CHEBYSHEV_CACHE_YEARS years used, and in
+    a file per year in the cache directory, so that later processes load them instead. Longitudes
+    stay within 0.001 degrees (3.6 arcseconds) of ephem, so every query costs a polynomial evaluation.
+    Speeds stay within 0.001 degrees per day of ephem's, except within a day or so of a planet's
+    conjunction with the Sun, where ephem's light deflection switches off at the solar limb and its
+    longitude jumps by up to 2 arcseconds. The fits smooth the jump over, and their speeds there
+    are off by up to 0.006 degrees per day. Bodies without fits are computed by the reference backend.
+    """
+    name = "chebyshev"
+    max_error_degrees = {body: 0.001 for body in CHEBYSHEV_SEGMENT_DAYS}
+
+    # Worst error against ephem's hourly central difference over 1990-2040, 0.006 at solar conjunctions, with a margin
+    max_daily_motion_error_degrees = 0.0075
+
+    def __init__(self, cache_directory: Optional[str] = None, cache_years: int = CHEBYSHEV_CACHE_YEARS):
+        """
+        Parameters:
+        cache_directory (str, optional): The directory of the year files. Defaults to the MOON_PHASE_CHEBYSHEV_CACHE
+            environment variable or CHEBYSHEV_CACHE_DIRECTORY. An empty string keeps the fits in memory only.
+        cache_years (int, optional): The number of years of fits kept in memory. Defaults to CHEBYSHEV_CACHE_YEARS.
+        """
+        self.cache_directory = cache_directory
+        self.cache_years = cache_years
+        self._years: "OrderedDict[int, ChebyshevYear]" = OrderedDict()
+        self._lock = Lock()
+
+    def __getstate__(self):
+        # Worker processes start with an empty memory cache and share the files
+        return {"cache_directory": self.cache_directory, "cache_years": self.cache_years}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def year_path(self, year: int) -> Optional[str]:
+        """
+        Get the file holding a year's fits, or None if they are kept in memory only.
+        """
+        directory = self.cache_directory
+
+        if directory is None:
+            directory = os.environ.get(CHEBYSHEV_CACHE_VARIABLE, CHEBYSHEV_CACHE_DIRECTORY)
+
+        if not directory:
+            return None
+
+        return os.path.join(os.path.expanduser(directory), f"longitudes_{year}.bin")
+
+    def fits_for_year(self, year: int) -> ChebyshevYear:
+        """
+        Get the fits of a year from memory, from its file, or by building and saving them.
+        """
+        with self._lock:
+            fits = self._years.get(year)
+
+            if fits is not None:
+                self._years.move_to_end(year)
+                return fits
+
+        path = self.year_path(year)
+        fits = None
+
+        if path is not None and os.path.exists(path):
+            try:
+                fits = ChebyshevYear.load(path)
+            except (OSError, ValueError, KeyError):
+                fits = None
+
+            # Rebuild files fitted with other settings
+            if fits is not None and (fits.degree != CHEBYSHEV_DEGREE or fits.segment_days != {
+                    body: float(days) for body, days in CHEBYSHEV_SEGMENT_DAYS.items()}):
+                fits = None
+
+        if fits is None:
+            fits = build_chebyshev_year(year)
+
+            if path is not None:
+                try:
+                    # Write to a temporary file and rename it, so that other processes never read a partial file
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    temporary_path = f"{path}.{os.getpid()}.tmp"
+                    fits.save(temporary_path)
+                    os.replace(temporary_path, path)
+                except OSError:
+                    pass
+
+        with self._lock:
+            self._years[year] = fits
+
+            while len(self._years) > self.cache_years:
+                self._years.popitem(last=False)
+
+        return fits
+
+    def clear_cache(self):
+        """
+        Forget the fits kept in memory. Files in the cache directory are kept.
+        """
+        with self._lock:
+            self._years.clear()
+
+    def longitudes_and_speeds(self, bodies: Sequence[str], times: TimesLike) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate the longitudes and speeds of the bodies.
+
+        Parameters:
+        bodies (Sequence[str]): The body names.
+        times (TimesLike): The instants. See time_scales.ephem_dates_from_times.
+
+        Returns:
+        Tuple[np.ndarray, np.ndarray]: (time x body) matrices of longitudes in degrees (0-360) and speeds in degrees per day.
+        """
+        bodies = [body.lower() for body in bodies]
+        ephem_dates = ephem_dates_from_times(times)
+        longitudes = np.empty((len(ephem_dates), len(bodies)), dtype=np.float64)
+        speeds = np.empty_like(longitudes)
+
+        # Evaluate the instants of each year with that year's fits
+        years = utc_years_from_ephem_dates(ephem_dates)
+        fitted = [j for j, body in enumerate(bodies) if body in CHEBYSHEV_SEGMENT_DAYS]
+
+        for year in np.unique(years) if fitted else []:
+            rows = years == year
+            fits = self.fits_for_year(int(year))
+
+            for j in fitted:
+                longitudes[rows, j], speeds[rows, j] = fits.evaluate(bodies[j], ephem_dates[rows])
+
+        # Fill in the rest from the reference backend
+        unfitted = [j for j in range(len(bodies)) if j not in fitted]
+
+        if unfitted and len(ephem_dates):
+            reference = EPHEMERIS_BACKENDS["ephem"]
+            longitudes[:, unfitted] = reference.longitudes([bodies[j] for j in unfitted], ephem_dates)
+            speeds[:, unfitted] = reference.speeds([bodies[j] for j in unfitted], ephem_dates)
+
+        return longitudes, speeds
+
+    def longitudes(self, bodies: Sequence[str], times: TimesLike) -> np.ndarray:
+        return self.longitudes_and_speeds(bodies, times)[0]
+
+    def speeds(self, bodies: Sequence[str], times: TimesLike) -> np.ndarray:
+        return self.longitudes_and_speeds(bodies, times)[1]
+
+# Backends selectable by name
+EPHEMERIS_BACKENDS: Dict[str, EphemerisBackend] = {
+    "ephem": EphemBackend(),
+    "analytic": AnalyticBackend(),
+    "chebyshev": ChebyshevBackend()
+}
+
+_backend: EphemerisBackend = EPHEMERIS_BACKENDS["ephem"]
+
+def set_ephemeris_backend(backend: Union[EphemerisBackend, str, None]):
+    """
+    Set the ephemeris backend used by calls that do not pass one.
+
+    Parameters:
+    backend (Union[EphemerisBackend, str, None]): A backend, the name of one in EPHEMERIS_BACKENDS, or None for ephem.
+    """
+    global _backend
+    _backend = resolve_ephemeris_backend(backend or "ephem")
+
+def get_ephemeris_backend() -> EphemerisBackend:
+    """
+    Get the ephemeris backend used by calls that do not pass one.
+
+    Returns:
+    EphemerisBackend: The backend.
+    """
+    return _backend
+
+def resolve_ephemeris_backend(backend: Union[EphemerisBackend, str, None] = None) -> EphemerisBackend:
+    """
+    Resolve the backend argument of a call: a backend, a backend name, or None for the global backend.
+
+    Raises:
+    ValueError: If no backend has the given name.
+    """
+    if backend is None:
+        return _backend
+
+    if isinstance(backend, EphemerisBackend):
+        return backend
+
+    try:
+        return EPHEMERIS_BACKENDS[backend.lower()]
+    except KeyError:
+        raise ValueError(f"unknown ephemeris backend: {backend}, expected one of {sorted(EPHEMERIS_BACKENDS)}")
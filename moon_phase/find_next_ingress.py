@@ -0,0 +1,134 @@
+from datetime import datetime, date, timedelta
+from typing import Tuple, Union
+from zoneinfo import ZoneInfo
+import ephem
+import numpy as np
+
+from .constants import ZODIAC_SIGNS, MAX_LONGITUDE_SPEED, MIN_INGRESS_STEP
+from .create_ephem_body import create_ephem_body
+from .calculate_ecliptic_longitudes import calculate_ecliptic_longitudes
+from .process_time import process_time
+from .observer_session import ObserverSession, resolve_session
+
+def next_ingress_ephem_date(
+        body: ephem.Body,
+        t: float,
+        tolerance_days: float = 1 / 86400,
+        max_evaluations: int = 1000) -> Tuple[float, int]:
+    """
+    Find the next sign ingress of a celestial body after an ephem.Date value.
+
+    The search steps forward by the time the body needs to reach the nearest sign boundary
+    at its maximum speed, so no boundary crossing is skipped, including retrograde re-crossings
+    of the sign it started in. Once a crossing is bracketed, the ingress is refined by bisection
+    until the bracket is narrower than the tolerance, stops shrinking, or max_evaluations is reached.
+
+    Parameters:
+    body (ephem.Body): The celestial body.
+    t (float): The ephem.Date value (days since 1899-12-31 12:00 UTC) to search from.
+    tolerance_days (float, optional): The precision of the returned instant in days. Defaults to one second.
+    max_evaluations (int, optional): The maximum number of longitude evaluations, coarse steps and bisection together. Defaults to 1000.
+
+    Returns:
+    Tuple[float, int]: The ephem.Date value of the first instant found in the new sign and the index of that sign.
+
+    Raises:
+    ValueError: If tolerance_days is not positive.
+    RuntimeError: If no ingress is found within max_evaluations longitude evaluations.
+    """
+    if not tolerance_days > 0:
+        raise ValueError(f"tolerance must be positive, got {tolerance_days} days")
+
+    body_name = body.name.lower()
+    max_speed = MAX_LONGITUDE_SPEED[body_name]
+    min_step = MIN_INGRESS_STEP[body_name]
+
+    # Ingresses are found with the reference backend, so that their times are exact
+    def longitude(t: float) -> float:
+        return calculate_ecliptic_longitudes(body, np.array([t]), backend="ephem")[0]
+
+    current_longitude = longitude(t)
+    current_sign = int(current_longitude // 30)
+    evaluations = 1
+
+    # Step forward no further than the body can travel before reaching either boundary of its sign
+    while True:
+        distance = min(current_longitude - current_sign * 30, (current_sign + 1) * 30 - current_longitude)
+        t_next = t + max(distance / max_speed, min_step)
+        next_longitude = longitude(t_next)
+        evaluations += 1
+
+        if int(next_longitude // 30) != current_sign:
+            break
+
+        if evaluations >= max_evaluations:
+            raise RuntimeError(f"no ingress of {body.name} found within {max_evaluations} evaluations")
+
+        t, current_longitude = t_next, next_longitude
+
+    # Bisect the bracket until it is narrower than the tolerance, floating point stops it shrinking, or the evaluations run out
+    while t_next - t > tolerance_days and evaluations < max_evaluations:
+        t_mid = (t + t_next) / 2
+
+        if t_mid in (t, t_next):
+            break
+
+        mid_longitude = longitude(t_mid)
+        evaluations += 1
+
+        if int(mid_longitude // 30) == current_sign:
+            t = t_mid
+        else:
+            t_next, next_longitude = t_mid, mid_longitude
+
+    return t_next, int(next_longitude // 30) % 12
+
+def find_next_ingress(
+        body: Union[ephem.Body, str],
+        dt: Union[ephem.Date, datetime, date, str] = None,
+        timezone: Union[ZoneInfo, str] = None,
+        lat: float = None,
+        lon: float = None,
+        tolerance: timedelta = timedelta(seconds=1),
+        max_evaluations: int = 1000,
+        session: ObserverSession = None) -> Tuple[datetime, str]:
+    """
+    Find the next instant at which a celestial body enters a new tropical zodiac sign.
+
+    Parameters:
+    body (Union[ephem.Body, str]): The celestial body. Can be an ephem.Body object or a string.
+    dt (Union[ephem.Date, datetime, date, str], optional): The instant to search from. Defaults to None.
+    timezone (Union[ZoneInfo, str], optional): The timezone of the given date and time and of the result. Defaults to None.
+    lat (float, optional): The latitude of the observer. Defaults to None.
+    lon (float, optional): The longitude of the observer. Defaults to None.
+    tolerance (timedelta, optional): The precision of the returned instant. Defaults to one second.
+    max_evaluations (int, optional): The maximum number of longitude evaluations, coarse steps and bisection together. Defaults to 1000.
+    session (ObserverSession, optional): The observer session to take the timezone, latitude and longitude from. Defaults to None.
+
+    Returns:
+    Tuple[datetime, str]: The instant of the ingress in the given timezone and the sign entered.
+
+    Raises:
+    ValueError: If tolerance is not positive.
+    RuntimeError: If no ingress is found within max_evaluations longitude evaluations.
+    """
+    # Take the timezone and coordinates from the session, if one is given
+    timezone, lat, lon = resolve_session(session, timezone, lat, lon)
+
+    # If the body is provided as a string, create an ephem.Body object
+    if isinstance(body, str):
+        body = create_ephem_body(body)
+
+    # Process the date and time, and adjust for the provided timezone
+    dt, timezone = process_time(dt, timezone, lat, lon)
+
+    t, sign_index = next_ingress_ephem_date(
+        body=body,
+        t=float(ephem.Date(dt)),
+        tolerance_days=tolerance.total_seconds() / 86400,
+        max_evaluations=max_evaluations
+    )
+
+    ingress = ephem.Date(t).datetime().replace(tzinfo=ZoneInfo("UTC")).astimezone(timezone)
+
+    return ingress, ZODIAC_SIGNS[sign_index]
@@ -5,13 +5,18 @@ import ephem
 
 from .process_time import process_time
 from .upcoming_phases import upcoming_phases
+from .lunation_catalog import get_lunation_catalog
+from .observer_session import ObserverSession, resolve_session
+from .instrumentation import timed
 
 
+@timed()
 def find_next_phase(
         dt: Union[ephem.Date, datetime, date, str] = None,
         timezone: Union[ZoneInfo, str] = None,
         lat: float = None,
-        lon: float = None) -> tuple[str, datetime]:
+        lon: float = None,
+        session: ObserverSession = None) -> tuple[str, datetime]:
     """
     Calculates the next moon phase: New, First Quarter, Full, or
     Last Quarter.
@@ -22,22 +27,30 @@ def find_next_phase(
         timezone: The timezone for the output datetime. Defaults to the timezone of the input date/time.
         lat: The latitude for the location to determine the moon phase.
         lon: The longitude for the location to determine the moon phase.
+        session: The observer session to take the timezone, latitude and longitude from.
 
     Returns:
         A tuple containing the name of the next lunation and its datetime.
     """
+    # Take the timezone and coordinates from the session, if one is given
+    timezone, lat, lon = resolve_session(session, timezone, lat, lon)
 
     dt, timezone = process_time(dt, timezone, lat, lon)
 
-    df = upcoming_phases(dt, timezone, lat, lon)  # Use only future dates
+    # Look the next phase up in the lunation catalog if it covers the given time
+    catalog = get_lunation_catalog()
 
-    # Filter for datetimes strictly greater than the input datetime
-    # (This might be redundant now, but it's good to keep for safety)
-    # df_future = df[df['datetime'] > dt]
-    next_phase_row = df.iloc[0]  # Get the first row after filtering
+    if catalog is not None:
+        next_phases = catalog.next_phases(dt.timestamp())
+
+        if next_phases is not None:
+            phase_name, unix_seconds = next_phases[0]
+            return phase_name, datetime.fromtimestamp(unix_seconds, timezone)
+
+    # Use the lightweight tuple output and take the earliest upcoming phase
+    phase_name, phase_datetime = upcoming_phases(dt, timezone, lat, lon, output="tuples")[0]
 
     # Remove "Next " prefix from the lunation name
-    phase_name = next_phase_row['lunation'].replace("Next ", "")
-    phase_datetime = next_phase_row['datetime']
+    phase_name = phase_name.replace("Next ", "")
 
     return phase_name, phase_datetime
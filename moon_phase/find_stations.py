@@ -0,0 +1,139 @@
+from datetime import datetime, date, timedelta
+from typing import List, Tuple, Union
+from zoneinfo import ZoneInfo
+import ephem
+import numpy as np
+
+from .constants import STATION_SCAN_STEP
+from .create_ephem_body import create_ephem_body
+from .calculate_ecliptic_longitudes import calculate_ecliptic_longitudes
+from .process_time import process_time
+from .observer_session import ObserverSession, resolve_session
+
+def longitude_speed_ephem_dates(
+        body: ephem.Body,
+        ephem_dates: np.ndarray,
+        step_days: float = 1 / 24) -> np.ndarray:
+    """
+    Calculate the geocentric ecliptic longitude speed of a body by central differences.
+
+    Parameters:
+    body (ephem.Body): The celestial body.
+    ephem_dates (np.ndarray): ephem.Date values (days since 1899-12-31 12:00 UTC).
+    step_days (float, optional): Half the width of the difference in days. Defaults to one hour.
+
+    Returns:
+    np.ndarray: The longitude speed in degrees per day, negative when the body is retrograde.
+    """
+    ephem_dates = np.asarray(ephem_dates, dtype=np.float64)
+
+    # Stations are found with the reference backend, so that the retrograde periods built from them are exact
+    longitudes = calculate_ecliptic_longitudes(
+        body,
+        np.concatenate([ephem_dates - step_days, ephem_dates + step_days]),
+        backend="ephem"
+    )
+    before, after = np.split(longitudes, 2)
+
+    # Wrap the difference so that crossing 0 degrees Aries does not look like a jump backwards
+    difference = (after - before + 180) % 360 - 180
+
+    return difference / (2 * step_days)
+
+def find_station_ephem_dates(
+        body: ephem.Body,
+        start: float,
+        end: float,
+        tolerance_days: float = 1 / 1440) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the stations of a body between two ephem.Date values.
+
+    Parameters:
+    body (ephem.Body): The celestial body.
+    start (float): The ephem.Date value to search from.
+    end (float): The ephem.Date value to search to.
+    tolerance_days (float, optional): The precision of the station times in days. Defaults to one minute.
+
+    Returns:
+    Tuple[np.ndarray, np.ndarray]: The ephem.Date values of the stations and, for each, True if the
+                                   body turns retrograde there or False if it turns direct.
+    """
+    step = STATION_SCAN_STEP[body.name.lower()]
+
+    # Scan the longitude speed on a coarse grid as one batch
+    grid = np.append(np.arange(start, end, step), end)
+    retrograde = longitude_speed_ephem_dates(body, grid) < 0
+    changes = np.flatnonzero(retrograde[1:] != retrograde[:-1])
+
+    stations = []
+
+    # Bisect each change of direction until it is narrower than the tolerance
+    for i in changes:
+        low, high = grid[i], grid[i + 1]
+        low_retrograde = retrograde[i]
+
+        while high - low > tolerance_days:
+            mid = (low + high) / 2
+
+            if (longitude_speed_ephem_dates(body, np.array([mid]))[0] < 0) == low_retrograde:
+                low = mid
+            else:
+                high = mid
+
+        stations.append((low + high) / 2)
+
+    return np.array(stations, dtype=np.float64), ~retrograde[changes]
+
+def find_stations(
+        body: Union[ephem.Body, str],
+        start: Union[ephem.Date, datetime, date, str] = None,
+        end: Union[ephem.Date, datetime, date, str] = None,
+        timezone: Union[ZoneInfo, str] = None,
+        lat: float = None,
+        lon: float = None,
+        tolerance: timedelta = timedelta(minutes=1),
+        session: ObserverSession = None) -> List[Tuple[datetime, str]]:
+    """
+    Find the stationary points of a planet, where its ecliptic longitude speed crosses zero.
+
+    Parameters:
+    body (Union[ephem.Body, str]): The celestial body. Can be an ephem.Body object or a string.
+    start (Union[ephem.Date, datetime, date, str], optional): The start of the search. Defaults to None.
+    end (Union[ephem.Date, datetime, date, str], optional): The end of the search. Defaults to one year after the start.
+    timezone (Union[ZoneInfo, str], optional): The timezone of the given dates and of the results. Defaults to None.
+    lat (float, optional): The latitude of the observer. Defaults to None.
+    lon (float, optional): The longitude of the observer. Defaults to None.
+    tolerance (timedelta, optional): The precision of the station times. Defaults to one minute.
+    session (ObserverSession, optional): The observer session to take the timezone, latitude and longitude from. Defaults to None.
+
+    Returns:
+    List[Tuple[datetime, str]]: The instant of each station and "retrograde" or "direct" for the motion that follows it.
+    """
+    # Take the timezone and coordinates from the session, if one is given
+    timezone, lat, lon = resolve_session(session, timezone, lat, lon)
+
+    # If the body is provided as a string, create an ephem.Body object
+    if isinstance(body, str):
+        body = create_ephem_body(body)
+
+    start, timezone = process_time(start, timezone, lat, lon)
+
+    if end is None:
+        end = start + timedelta(days=365)
+
+    end, timezone = process_time(end, timezone, lat, lon)
+
+    station_dates, turns_retrograde = find_station_ephem_dates(
+        body=body,
+        start=float(ephem.Date(start)),
+        end=float(ephem.Date(end)),
+        tolerance_days=tolerance.total_seconds() / 86400
+    )
+
+    return [
+        (
+            ephem.Date(t).datetime().replace(tzinfo=ZoneInfo("UTC")).astimezone(timezone),
+            "retrograde" if retrograde else "direct"
+        )
+        for t, retrograde in zip(station_dates, turns_retrograde)
+    ]
@@ -1,8 +1,116 @@
-from timezonefinder import TimezoneFinder
+from functools import lru_cache
+from threading import Lock
+from typing import Optional
 from zoneinfo import ZoneInfo
 
+from .constants import TIMEZONE_CACHE_SIZE, TIMEZONE_QUANTUM_DEGREES
 from .locate_device import locate_device
+from .instrumentation import count, timed
 
+_timezone_finder = None
+_timezone_finder_in_memory = False
+_timezone_finder_lock = Lock()
+
+def get_timezone_finder(in_memory: bool = None):
+    """
+    Get the TimezoneFinder shared by every timezone lookup, creating it on first use.
+
+    Args:
+        in_memory (bool, optional): Load the timezone polygons into memory instead of reading
+            them from file on each lookup. Changing this replaces the shared finder. Defaults to
+            keeping the current mode, which starts out as reading from file.
+
+    Returns:
+        TimezoneFinder: The shared finder.
+    """
+    global _timezone_finder, _timezone_finder_in_memory
+
+    with _timezone_finder_lock:
+        if in_memory is not None and in_memory != _timezone_finder_in_memory:
+            _timezone_finder = None
+            _timezone_finder_in_memory = in_memory
+            timezone_name_at_cell.cache_clear()
+
+        if _timezone_finder is None:
+            from timezonefinder import TimezoneFinder
+            _timezone_finder = TimezoneFinder(in_memory=_timezone_finder_in_memory)
+
+        return _timezone_finder
+
+def quantize_coordinate(degrees: float) -> int:
+    """
+    Map a latitude or longitude to the index of its cell on the timezone cache grid.
+    """
+    return round(degrees / TIMEZONE_QUANTUM_DEGREES)
+
+def nautical_timezone_name(lon: float) -> str:
+    """
+    Name the Etc/GMT zone of a longitude's 15-degree nautical band, used where no timezone is mapped.
+    """
+    offset = int(round(lon / 15))
+
+    # Etc/GMT zones are named with the sign of the offset inverted
+    return "Etc/GMT" if offset == 0 else f"Etc/GMT{-offset:+d}"
+
+def timezone_name_at_point(lat: float, lon: float) -> str:
+    """
+    Find the name of the timezone at a point with the shared TimezoneFinder.
+
+    Args:
+        lat (float): The latitude of the point.
+        lon (float): The longitude of the point.
+
+    Returns:
+        str: The IANA timezone name, or the nautical Etc/GMT zone where no timezone is mapped.
+    """
+    count("timezonefinder.timezone_at")
+
+    return get_timezone_finder().timezone_at(lng=lon, lat=lat) or nautical_timezone_name(lon)
+
+@lru_cache(maxsize=TIMEZONE_CACHE_SIZE)
+def timezone_name_at_cell(lat_cell: int, lon_cell: int) -> Optional[str]:
+    """
+    Find the name of the timezone covering a cell of the timezone cache grid.
+
+    Args:
+        lat_cell (int): The latitude index of the cell.
+        lon_cell (int): The longitude index of the cell.
+
+    Returns:
+        Optional[str]: The IANA timezone name if it is the same at all four corners of the cell,
+        or None if the cell straddles a timezone border and its points must be looked up exactly.
+    """
+    lat = lat_cell * TIMEZONE_QUANTUM_DEGREES
+    lon = lon_cell * TIMEZONE_QUANTUM_DEGREES
+    half = TIMEZONE_QUANTUM_DEGREES / 2
+
+    names = {
+        timezone_name_at_point(lat + lat_offset, lon + lon_offset)
+        for lat_offset in (-half, half)
+        for lon_offset in (-half, half)
+    }
+
+    return names.pop() if len(names) == 1 else None
+
+def timezone_name_at(lat: float, lon: float) -> str:
+    """
+    Find the name of the timezone at a point, from its cache grid cell unless the cell straddles a border.
+
+    Args:
+        lat (float): The latitude of the point.
+        lon (float): The longitude of the point.
+
+    Returns:
+        str: The IANA timezone name.
+    """
+    name = timezone_name_at_cell(quantize_coordinate(lat), quantize_coordinate(lon))
+
+    if name is None:
+        name = timezone_name_at_point(lat, lon)
+
+    return name
+
+@timed()
 def find_timezone(
         lat: float = None,
         lon: float = None) -> ZoneInfo:
@@ -12,6 +120,10 @@ def find_timezone(
     If latitude and longitude are not provided, the function will
     attempt to get the current location's coordinates.
 
+    Coordinates are snapped to a grid of TIMEZONE_QUANTUM_DEGREES and the timezone of
+    each grid cell is looked up once with the shared TimezoneFinder. Points in cells that
+    straddle a timezone border are looked up exactly.
+
     Args:
         lat (float, optional): Latitude of the location. Defaults to None.
         lon (float, optional): Longitude of the location. Defaults to None.
@@ -23,7 +135,7 @@ def find_timezone(
         # Get the current location's coordinates if not provided
         lat, lon = locate_device()
 
-    # Find the timezone using the provided or obtained coordinates
-    timezone = ZoneInfo(TimezoneFinder().timezone_at(lng=lon, lat=lat))
+    # Find the timezone of the grid cell holding the provided or obtained coordinates
+    timezone = ZoneInfo(timezone_name_at(lat, lon))
 
-    return timezone
\ No newline at end of file
+    return timezone
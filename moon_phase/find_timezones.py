@@ -0,0 +1,48 @@
+from typing import List, Sequence
+from zoneinfo import ZoneInfo
+import numpy as np
+
+from .constants import TIMEZONE_QUANTUM_DEGREES
+from .find_timezone import timezone_name_at_cell, timezone_name_at_point
+
+def find_timezones(
+        lats: Sequence[float],
+        lons: Sequence[float]) -> List[ZoneInfo]:
+    """
+    Find the timezones for arrays of latitudes and longitudes.
+
+    The points are snapped to the grid used by find_timezone and each distinct
+    grid cell is resolved once, so many users at a few locations cost a few lookups.
+    Points in cells that straddle a timezone border are looked up exactly.
+
+    Args:
+        lats (Sequence[float]): Latitudes of the locations.
+        lons (Sequence[float]): Longitudes of the locations.
+
+    Returns:
+        List[ZoneInfo]: The timezone of each location, in order.
+    """
+    lats = np.asarray(lats, dtype=np.float64).ravel()
+    lons = np.asarray(lons, dtype=np.float64).ravel()
+
+    if lats.shape != lons.shape:
+        raise ValueError(f"got {len(lats)} latitudes and {len(lons)} longitudes")
+
+    # Snap the points to grid cells and find the distinct cells
+    cells = np.stack([
+        np.round(lats / TIMEZONE_QUANTUM_DEGREES),
+        np.round(lons / TIMEZONE_QUANTUM_DEGREES)
+    ], axis=1).astype(np.int64)
+
+    unique_cells, inverse = np.unique(cells, axis=0, return_inverse=True)
+
+    # Resolve each distinct cell once
+    cell_names = [timezone_name_at_cell(int(lat_cell), int(lon_cell)) for lat_cell, lon_cell in unique_cells]
+    names = [cell_names[i] for i in inverse.ravel()]
+
+    # Look up the points of border cells exactly
+    for i, name in enumerate(names):
+        if name is None:
+            names[i] = timezone_name_at_point(float(lats[i]), float(lons[i]))
+
+    return [ZoneInfo(name) for name in names]
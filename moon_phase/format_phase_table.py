@@ -0,0 +1,40 @@
+from datetime import datetime
+from typing import List, Tuple
+from zoneinfo import ZoneInfo
+import numpy as np
+
+# Structured NumPy layout of a phase table, with datetimes in UTC
+PHASE_TABLE_DTYPE = np.dtype([("lunation", "U24"), ("datetime", "datetime64[us]")])
+
+def format_phase_table(phases: List[Tuple[str, datetime]], output: str = "dataframe"):
+    """
+    Format a list of lunations in the requested output type.
+
+    Args:
+        phases: The lunation names and their timezone-aware datetimes, sorted by datetime.
+        output: "dataframe" for a pandas DataFrame with 'lunation' and 'datetime' columns,
+            "tuples" for the list of (lunation, datetime) tuples itself, or
+            "array" for a structured NumPy array with UTC datetimes.
+
+    Returns:
+        The lunations in the requested output type.
+
+    Raises:
+        ValueError: If the output type is unknown.
+    """
+    if output == "tuples":
+        return phases
+    elif output == "array":
+        return np.array(
+            [(name, np.datetime64(dt.astimezone(ZoneInfo("UTC")).replace(tzinfo=None), "us")) for name, dt in phases],
+            dtype=PHASE_TABLE_DTYPE
+        )
+    elif output == "dataframe":
+        import pandas as pd
+
+        return pd.DataFrame({
+            'lunation': [name for name, _ in phases],
+            'datetime': [dt for _, dt in phases]
+        })
+    else:
+        raise ValueError(f"Unknown output type: {output}")
@@ -4,8 +4,11 @@ from zoneinfo import ZoneInfo
 
 import ephem
 
+from .lunation_catalog import get_lunation_catalog
+from .observer_session import ObserverSession, resolve_session
+from .instrumentation import count
 
-def full_moons_in_month(year: Optional[int] = None, month: Optional[int] = None, tz: Optional[str] = None) -> list[datetime]:
+def full_moons_in_month(year: Optional[int] = None, month: Optional[int] = None, tz: Optional[str] = None, session: ObserverSession = None) -> list[datetime]:
     """
     Calculates the dates of all full moons occurring in a given month and year.
     Defaults to the current month and year in the local timezone.
@@ -15,29 +18,51 @@ def full_moons_in_month(year: Optional[int] = None, month: Optional[int] = None,
         month: The month (1-12). Defaults to the current month.
         tz: The timezone for the output dates. If None (default),
             it uses the local timezone.
+        session: The observer session to take the timezone from if tz is None.
 
     Returns:
         A list of datetime objects representing the full moons in the specified month.
     """
+    # Take the timezone from the session, if one is given
+    tz, _, _ = resolve_session(session, tz)
 
     if year is None:
         year = datetime.now().year
     if month is None:
         month = datetime.now().month
     if tz is None:
-        tz = datetime.now().astimezone().tzinfo.zone  # Get local timezone name
-
-    timezone = ZoneInfo(tz)
+        timezone = datetime.now().astimezone().tzinfo  # Get local timezone
+    elif isinstance(tz, ZoneInfo):
+        timezone = tz
+    else:
+        timezone = ZoneInfo(tz)
 
     # Start with the first day of the month
     dt = datetime(year, month, 1, tzinfo=timezone)
+
+    # Look the full moons up in the lunation catalog if it covers the month
+    catalog = get_lunation_catalog()
+
+    if catalog is not None:
+        month_end = datetime(year + month // 12, month % 12 + 1, 1, tzinfo=timezone)
+        phases = catalog.phases_between(dt.timestamp(), month_end.timestamp())
+
+        if phases is not None:
+            return [datetime.fromtimestamp(unix_seconds, timezone) for phase_name, unix_seconds in phases if phase_name == "Full"]
+
     dt = ephem.Date(dt)
 
     full_moons = []
 
+    count("ephem.search")
     full_moon_date = ephem.next_full_moon(dt).datetime().replace(tzinfo=ZoneInfo("UTC")).astimezone(timezone)
+    # February can pass without a full moon
+    if full_moon_date.month != month:
+        return full_moons
+
     full_moons.append(full_moon_date)
 
+    count("ephem.search")
     next_full_moon_date = ephem.next_full_moon(ephem.Date(full_moon_date + timedelta(days=1))).datetime().replace(tzinfo=ZoneInfo("UTC")).astimezone(timezone)
 
     if next_full_moon_date.month == month:
@@ -1,5 +1,4 @@
 from datetime import datetime
-from pyluach.dates import HebrewDate
 
 def generate_hebrew_date_string(dt: datetime = None) -> str:
     """
@@ -17,6 +16,8 @@ def generate_hebrew_date_string(dt: datetime = None) -> str:
         # If no date is provided, use the current date
         dt = datetime.now()
 
+    from pyluach.dates import HebrewDate
+
     # Convert the Gregorian date to a Hebrew date
     hebrew_date = HebrewDate.from_pydate(dt)
     
@@ -1,18 +1,38 @@
-from .generate_moon_name import generate_moon_name
+from datetime import datetime, date
+from typing import Union
+from zoneinfo import ZoneInfo
+import ephem
 
-def generate_moon_name_emoji(moon_name: str = None) -> str:
+from .generate_moon_name import generate_moon_name
+from .observer_session import ObserverSession, resolve_session
+
+def generate_moon_name_emoji(
+        moon_name: str = None,
+        d: Union[ephem.Date, datetime, date, str] = None,
+        timezone: Union[ZoneInfo, str] = None,
+        lat: float = None,
+        lon: float = None,
+        session: ObserverSession = None) -> str:
     """
     Returns an emoji corresponding to the given moon name.
 
     Args:
         moon_name: The name of the moon as a string (without "Moon").
+            If None, the moon name of the given date is read from the year's almanac.
+        d: The date to name the moon for if no moon name is given. Defaults to the current date.
+        timezone: The timezone of the given date.
+        lat: The latitude of the location.
+        lon: The longitude of the location.
+        session: The observer session to take the timezone, latitude and longitude from.
 
     Returns:
         An emoji representing the moon name.
     """
+    # Take the timezone and coordinates from the session, if one is given
+    timezone, lat, lon = resolve_session(session, timezone, lat, lon)
 
     if moon_name is None:
-        moon_name = generate_moon_name(include_moon=False)
+        moon_name = generate_moon_name(d, timezone, lat, lon, include_moon=False)
 
     if moon_name.endswith(" Moon"):
         moon_name = moon_name[:-5]
@@ -0,0 +1,227 @@
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from threading import Lock
+from typing import Any, Callable, Dict, Iterator
+import sys
+import time
+
+# Whether counters and timers record anything. Checked first on every instrumented call, so a disabled build pays one global lookup
+_enabled = False
+
+_lock = Lock()
+_counters: Counter = Counter()
+_calls: Counter = Counter()
+_seconds: Dict[str, float] = defaultdict(float)
+
+# Hit and miss counts of the caches when the stats were last reset, subtracted from their running totals
+_cache_baseline: Dict[str, Dict[str, int]] = {}
+
+# Memoized functions whose hits and misses are reported, by name, as (module, function)
+LRU_CACHES = {
+    "timezone": ("moon_phase.find_timezone", "timezone_name_at_cell"),
+    "timestamp": ("moon_phase.parse_timestamp", "parse_free_form_timestamp"),
+    "day_snapshot": ("moon_phase.day_snapshot", "day_snapshot_in_timezone"),
+    "year_almanac": ("moon_phase.year_almanac", "get_year_almanac"),
+    "retrograde_index": ("moon_phase.retrograde_index", "retrograde_index_for_year")
+}
+
+def enable_instrumentation(enabled: bool = True):
+    """
+    Turn the call counters and timers on or off. Turning them on resets the stats.
+
+    Parameters:
+    enabled (bool, optional): Whether to record stats. Defaults to True.
+    """
+    global _enabled
+
+    if enabled and not _enabled:
+        reset_stats()
+
+    _enabled = enabled
+
+def is_instrumentation_enabled() -> bool:
+    """
+    Check whether the call counters and timers are recording.
+
+    Returns:
+    bool: True if instrumentation is on.
+    """
+    return _enabled
+
+def count(name: str, n: int = 1):
+    """
+    Add to a named counter if instrumentation is on.
+
+    Parameters:
+    name (str): The counter, e.g. "ephem.compute".
+    n (int, optional): The amount to add. Defaults to 1.
+    """
+    if not _enabled:
+        return
+
+    with _lock:
+        _counters[name] += n
+
+def timed(name: str = None) -> Callable:
+    """
+    Decorate a function to count its calls and add up the time spent in them if instrumentation is on.
+
+    Times are inclusive: a call made from another timed function counts toward both.
+
+    Parameters:
+    name (str, optional): The timer name. Defaults to the function's name.
+
+    Returns:
+    Callable: The decorator.
+    """
+    def decorator(function: Callable) -> Callable:
+        timer = name or function.__name__
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+
+            start = time.perf_counter()
+
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+
+                with _lock:
+                    _calls[timer] += 1
+                    _seconds[timer] += elapsed
+
+        return wrapper
+
+    return decorator
+
+def cache_totals() -> Dict[str, Dict[str, int]]:
+    """
+    Read the running hit and miss totals of the reported caches whose modules are loaded.
+    """
+    totals = {}
+
+    for cache_name, (module_name, function_name) in LRU_CACHES.items():
+        module = sys.modules.get(module_name)
+        function = getattr(module, function_name, None)
+
+        if function is not None and hasattr(function, "cache_info"):
+            info = function.cache_info()
+            totals[cache_name] = {"hits": info.hits, "misses": info.misses}
+
+    longitude_cache = sys.modules.get("moon_phase.longitude_cache")
+
+    if longitude_cache is not None:
+        info = longitude_cache.longitude_cache_info()
+        totals["longitude"] = {"hits": info["hits"], "misses": info["misses"]}
+
+    return totals
+
+def reset_stats():
+    """
+    Zero the counters and timers, and count cache hits and misses from now on.
+    """
+    global _cache_baseline
+
+    with _lock:
+        _counters.clear()
+        _calls.clear()
+        _seconds.clear()
+        _cache_baseline = cache_totals()
+
+def get_stats() -> Dict[str, Any]:
+    """
+    Report the stats recorded since instrumentation was turned on or last reset.
+
+    Returns:
+    Dict[str, Any]: "counters" maps counter names to counts, "timers" maps function names
+    to their number of calls and cumulative seconds, and "caches" maps cache names to hits and misses.
+    """
+    with _lock:
+        counters = dict(_counters)
+        timers = {timer: {"calls": _calls[timer], "seconds": _seconds[timer]} for timer in _calls}
+        baseline = dict(_cache_baseline)
+
+    caches = {}
+
+    for cache_name, totals in cache_totals().items():
+        start = baseline.get(cache_name, {"hits": 0, "misses": 0})
+        hits = totals["hits"] - start["hits"]
+        misses = totals["misses"] - start["misses"]
+
+        # Clearing a cache resets its totals, in which case they are all since the reset
+        if hits < 0 or misses < 0:
+            hits, misses = totals["hits"], totals["misses"]
+
+        caches[cache_name] = {"hits": hits, "misses": misses}
+
+    for counter, n in counters.items():
+        if counter.startswith("cache.") and counter.rsplit(".", 1)[-1] in ("hits", "misses"):
+            _, cache_name, outcome = counter.split(".", 2)
+            caches.setdefault(cache_name, {"hits": 0, "misses": 0})[outcome] += n
+
+    return {
+        "counters": {counter: n for counter, n in counters.items() if not counter.startswith("cache.")},
+        "timers": timers,
+        "caches": caches
+    }
+
+@contextmanager
+def collect_stats() -> Iterator[Dict[str, Any]]:
+    """
+    Record stats for the calls made in a with block, filling the yielded dictionary as the block exits.
+
+    Example:
+        with collect_stats() as stats:
+            status_on_date(...)
+        print(stats["counters"]["ephem.compute"])
+    """
+    was_enabled = _enabled
+    stats: Dict[str, Any] = {}
+
+    enable_instrumentation(False)
+    enable_instrumentation(True)
+
+    try:
+        yield stats
+    finally:
+        stats.update(get_stats())
+        enable_instrumentation(was_enabled)
+
+def format_stats(stats: Dict[str, Any]) -> str:
+    """
+    Render stats from get_stats as a plain text table.
+
+    Parameters:
+    stats (Dict[str, Any]): The stats.
+
+    Returns:
+    str: The table, with timers sorted by cumulative time.
+    """
+    lines = []
+
+    if stats["timers"]:
+        lines.append(f"{'function':<32}{'calls':>8}{'total ms':>12}{'per call ms':>14}")
+
+        for timer, timing in sorted(stats["timers"].items(), key=lambda item: -item[1]["seconds"]):
+            per_call = timing["seconds"] / timing["calls"] if timing["calls"] else 0
+            lines.append(f"{timer:<32}{timing['calls']:>8}{timing['seconds'] * 1e3:>12.3f}{per_call * 1e3:>14.3f}")
+
+    if stats["counters"]:
+        lines.append("")
+        lines.append(f"{'counter':<32}{'count':>8}")
+
+        for counter, n in sorted(stats["counters"].items()):
+            lines.append(f"{counter:<32}{n:>8}")
+
+    if stats["caches"]:
+        lines.append("")
+        lines.append(f"{'cache':<32}{'hits':>8}{'misses':>8}")
+
+        for cache_name, outcomes in sorted(stats["caches"].items()):
+            lines.append(f"{cache_name:<32}{outcomes['hits']:>8}{outcomes['misses']:>8}")
+
+    return "\n".join(lines)
@@ -1,38 +1,57 @@
 from typing import Union
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, timezone as dt_timezone
 from zoneinfo import ZoneInfo
 import ephem
 
+from .constants import RETROGRADE_BODIES
 from .process_time import process_time
 from .locate_device import locate_device
 from .create_ephem_body import create_ephem_body
-from .calculate_ecliptic_longitude import calculate_ecliptic_longitude
+from .retrograde_index import retrograde_index_for_year
+from .observer_session import ObserverSession, resolve_session
+from .ephemeris_backend import EphemerisBackend, resolve_ephemeris_backend
+from .instrumentation import timed
 
+@timed()
 def is_retrograde(
         body: Union[ephem.Body, str],
         dt: Union[datetime, date, str] = None,
         timezone: Union[ZoneInfo, str] = None,
         lat: float = None,
-        lon: float = None) -> bool:
+        lon: float = None,
+        session: ObserverSession = None,
+        backend: Union[EphemerisBackend, str] = None) -> bool:
     """
     Determine if a celestial body is in retrograde motion.
 
+    The instant is looked up in the body's retrograde periods for its year,
+    which are found once from the stations where its longitude speed crosses zero.
+    An approximate backend instead decides from the body's speed in longitude,
+    unless the speed is within the backend's error of zero.
+
     Parameters:
     body (Union[ephem.Body, str]): The celestial body to check. Can be an ephem.Body object or a string.
     dt (Union[datetime, date, str], optional): The date and time to check. Defaults to None.
     timezone (Union[ZoneInfo, str], optional): The timezone of the location. Defaults to None.
     lat (float, optional): The latitude of the location. Defaults to None.
     lon (float, optional): The longitude of the location. Defaults to None.
+    session (ObserverSession, optional): The observer session to take the timezone, latitude and longitude from. Defaults to None.
+    backend (Union[EphemerisBackend, str], optional): The ephemeris backend, or its name. Defaults to the global backend.
 
     Returns:
     bool: True if the body is in retrograde motion, False otherwise.
     """
+    # Take the timezone and coordinates from the session, if one is given
+    timezone, lat, lon = resolve_session(session, timezone, lat, lon)
+
     # If the body is provided as a string, create an ephem.Body object
     if isinstance(body, str):
         body = create_ephem_body(body)
 
     # Check if the body is one of the planets that can be in retrograde motion
-    if not isinstance(body, (ephem.Mercury, ephem.Venus, ephem.Mars, ephem.Jupiter, ephem.Saturn)):
+    body_name = body.name.lower()
+
+    if body_name not in RETROGRADE_BODIES:
         return False
 
     # If latitude or longitude is not provided, locate the device to get the coordinates
@@ -42,14 +61,16 @@ def is_retrograde(
     # Process the date, time, and timezone
     dt, timezone = process_time(dt, timezone, lat, lon)
 
-    # Calculate the ecliptic longitude for the given date and the previous day
-    ecliptic_longitude_degrees = calculate_ecliptic_longitude(body, dt, timezone, lat, lon)
-    previous_day_ecliptic_longitude_degrees = calculate_ecliptic_longitude(body, dt - timedelta(days=1), timezone, lat, lon)
+    backend = resolve_ephemeris_backend(backend)
+
+    # Let an approximate backend decide from the planet's speed, unless it is too close to a station
+    if not backend.reference:
+        speed = backend.speeds([body_name], [dt])[0, 0]
 
-    # Determine the difference in ecliptic longitude between the two days
-    difference = ecliptic_longitude_degrees - previous_day_ecliptic_longitude_degrees
+        if abs(speed) > backend.max_daily_motion_error_degrees:
+            return bool(speed < 0)
 
-    # If the difference is negative, the body is in retrograde motion
-    is_retrograde = difference < 0
+    # Look the instant up in the retrograde periods of its year
+    index = retrograde_index_for_year(body_name, dt.astimezone(dt_timezone.utc).year)
 
-    return is_retrograde
+    return index.is_retrograde(body_name, dt.timestamp())
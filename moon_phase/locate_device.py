@@ -1,16 +1,194 @@
-import geocoder
+from typing import Callable, List, Optional, Tuple
+from threading import Lock
+import json
+import os
+import time
 
+from .constants import (
+    LOCATION_CACHE_TTL,
+    LOCATION_FILE,
+    LATITUDE_VARIABLE,
+    LONGITUDE_VARIABLE,
+    LOCATION_FILE_VARIABLE,
+    OFFLINE_VARIABLE
+)
+from .instrumentation import count, timed
+
+_explicit_location = None
+_offline = None
+_cached_location = None
+_cached_at = None
+_lock = Lock()
+
+def set_device_location(lat: float = None, lon: float = None):
+    """
+    Set the device's position explicitly, or clear it by passing no coordinates.
+
+    Args:
+        lat (float, optional): Latitude of the device. Defaults to None.
+        lon (float, optional): Longitude of the device. Defaults to None.
+    """
+    global _explicit_location
+
+    if (lat is None) != (lon is None):
+        raise ValueError("latitude and longitude must be given together")
+
+    _explicit_location = None if lat is None else (float(lat), float(lon))
+    clear_location_cache()
+
+def set_offline_mode(offline: Optional[bool] = True):
+    """
+    Turn the strict offline mode on or off.
+
+    In offline mode the device is never located over the network. Passing None
+    defers to the MOON_PHASE_OFFLINE environment variable.
+
+    Args:
+        offline (Optional[bool], optional): Whether to stay offline. Defaults to True.
+    """
+    global _offline
+    _offline = offline
+    clear_location_cache()
+
+def is_offline() -> bool:
+    """
+    Check whether the strict offline mode is on.
+
+    Returns:
+        bool: True if the device must not be located over the network.
+    """
+    if _offline is not None:
+        return _offline
+
+    return os.environ.get(OFFLINE_VARIABLE, "").strip().lower() in ("1", "true", "yes", "on")
+
+def clear_location_cache():
+    """
+    Forget the cached position so the next call to locate_device runs the providers again.
+    """
+    global _cached_location, _cached_at
+
+    with _lock:
+        _cached_location = None
+        _cached_at = None
+
+def location_from_explicit() -> Optional[Tuple[float, float]]:
+    """
+    Provide the position set with set_device_location.
+
+    Returns:
+        Optional[Tuple[float, float]]: The latitude and longitude, or None if none was set.
+    """
+    return _explicit_location
+
+def location_from_environment() -> Optional[Tuple[float, float]]:
+    """
+    Provide the position from the MOON_PHASE_LAT and MOON_PHASE_LON environment variables.
+
+    Returns:
+        Optional[Tuple[float, float]]: The latitude and longitude, or None if they are not both set.
+    """
+    lat = os.environ.get(LATITUDE_VARIABLE)
+    lon = os.environ.get(LONGITUDE_VARIABLE)
+
+    if not lat or not lon:
+        return None
+
+    return float(lat), float(lon)
+
+def location_from_file() -> Optional[Tuple[float, float]]:
+    """
+    Provide the position from a local file.
+
+    The file is named by the MOON_PHASE_LOCATION_FILE environment variable, or is
+    ~/.moon_phase_location, and holds either a JSON object with "lat" and "lon"
+    or the latitude and longitude separated by a comma.
+
+    Returns:
+        Optional[Tuple[float, float]]: The latitude and longitude, or None if there is no file.
+    """
+    path = os.path.expanduser(os.environ.get(LOCATION_FILE_VARIABLE, LOCATION_FILE))
+
+    if not os.path.isfile(path):
+        return None
+
+    with open(path) as file:
+        text = file.read().strip()
+
+    if text.startswith("{"):
+        location = json.loads(text)
+        return float(location["lat"]), float(location["lon"])
+
+    lat, lon = text.split(",")
+
+    return float(lat), float(lon)
+
+def location_from_ip() -> Optional[Tuple[float, float]]:
+    """
+    Provide the position from IP geolocation, unless offline mode is on.
+
+    Returns:
+        Optional[Tuple[float, float]]: The latitude and longitude, or None if offline or the lookup failed.
+    """
+    if is_offline():
+        return None
+
+    import geocoder
+
+    count("geocoder.ip")
+    latlng = geocoder.ip('me').latlng
+
+    if not latlng:
+        return None
+
+    lat, lon = latlng
+
+    return lat, lon
+
+# Providers tried in order until one returns a position
+LOCATION_PROVIDERS: List[Callable[[], Optional[Tuple[float, float]]]] = [
+    location_from_explicit,
+    location_from_environment,
+    location_from_file,
+    location_from_ip
+]
+
+@timed()
 def locate_device() -> tuple:
     """
-    Locate the device's current position using IP geolocation.
+    Locate the device's current position.
 
-    This function uses the geocoder library to get the latitude and longitude
-    of the device based on its IP address.
+    The providers in LOCATION_PROVIDERS are tried in order: coordinates set with
+    set_device_location, the MOON_PHASE_LAT and MOON_PHASE_LON environment variables,
+    a local location file, then IP geolocation with the geocoder library. The position
+    found is cached for LOCATION_CACHE_TTL seconds.
 
     Returns:
         tuple: A tuple containing the latitude and longitude of the device.
+
+    Raises:
+        RuntimeError: If no provider could locate the device.
     """
-    # Get the latitude and longitude of the device using IP geolocation
-    lat, lon = geocoder.ip('me').latlng
+    global _cached_location, _cached_at
 
-    return lat, lon
+    with _lock:
+        if _cached_location is not None and time.monotonic() - _cached_at < LOCATION_CACHE_TTL:
+            return _cached_location
+
+        # Try each provider in turn until one finds the device
+        for provider in LOCATION_PROVIDERS:
+            location = provider()
+
+            if location is not None:
+                _cached_location = location
+                _cached_at = time.monotonic()
+
+                return location
+
+    if is_offline():
+        raise RuntimeError(
+            f"cannot locate the device offline: pass lat and lon, call set_device_location, "
+            f"or set {LATITUDE_VARIABLE} and {LONGITUDE_VARIABLE}"
+        )
+
+    raise RuntimeError("cannot locate the device")
@@ -0,0 +1,129 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Hashable, Optional
+
+from .constants import LONGITUDE_CACHE_SIZE
+
+class LongitudeCache:
+    """
+    A thread-safe memo of ecliptic longitudes with least-recently-used eviction.
+
+    Keys are (body name, UTC instant) pairs, the instant being whole microseconds since the
+    Unix epoch, so the same moment given in different timezones shares one entry.
+    """
+    def __init__(self, maxsize: int = LONGITUDE_CACHE_SIZE):
+        if maxsize < 0:
+            raise ValueError(f"Cache size must not be negative: {maxsize}")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Optional[float]:
+        """
+        Look up a longitude and mark it as recently used.
+
+        Parameters:
+        key (Hashable): The (body name, UTC instant) key.
+
+        Returns:
+        Optional[float]: The cached longitude in degrees, or None if it is not cached.
+        """
+        with self._lock:
+            longitude = self._entries.get(key)
+
+            if longitude is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+            return longitude
+
+    def put(self, key: Hashable, longitude: float):
+        """
+        Store a longitude, evicting the least recently used entries beyond the cache size.
+
+        Parameters:
+        key (Hashable): The (body name, UTC instant) key.
+        longitude (float): The ecliptic longitude in degrees.
+        """
+        with self._lock:
+            if self.maxsize == 0:
+                return
+
+            self._entries[key] = longitude
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def resize(self, maxsize: int):
+        """
+        Change the cache size, evicting the least recently used entries if it shrinks.
+
+        Parameters:
+        maxsize (int): The maximum number of entries. 0 disables caching.
+        """
+        if maxsize < 0:
+            raise ValueError(f"Cache size must not be negative: {maxsize}")
+
+        with self._lock:
+            self.maxsize = maxsize
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Remove every entry and reset the hit and miss counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        """
+        Report the cache statistics.
+
+        Returns:
+        Dict[str, int]: The hits, misses, current size and maximum size of the cache.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize
+            }
+
+# The process-wide cache used by calculate_ecliptic_longitude
+longitude_cache = LongitudeCache()
+
+def longitude_cache_info() -> Dict[str, int]:
+    """
+    Report the statistics of the ecliptic longitude cache.
+
+    Returns:
+    Dict[str, int]: The hits, misses, current size and maximum size of the cache.
+    """
+    return longitude_cache.info()
+
+def clear_longitude_cache():
+    """
+    Empty the ecliptic longitude cache and reset its counters.
+    """
+    longitude_cache.clear()
+
+def set_longitude_cache_size(maxsize: int):
+    """
+    Set the maximum number of ecliptic longitudes kept in the cache.
+
+    Parameters:
+    maxsize (int): The maximum number of entries. 0 disables caching.
+    """
+    longitude_cache.resize(maxsize)
@@ -0,0 +1,209 @@
+from typing import List, Optional, Tuple, Union
+from datetime import datetime, date, time
+import argparse
+import numpy as np
+import ephem
+
+from .constants import PRINCIPAL_PHASES
+from .time_scales import ephem_dates_from_times, unix_seconds_from_ephem_dates
+from .array_store import write_array_store, read_array_store
+
+LUNATION_CATALOG_KIND = "lunation_catalog"
+LUNATION_CATALOG_VERSION = 1
+
+# ephem searches for each principal phase, in the order of PRINCIPAL_PHASES
+PHASE_SEARCHES = [
+    ephem.next_new_moon,
+    ephem.next_first_quarter_moon,
+    ephem.next_full_moon,
+    ephem.next_last_quarter_moon
+]
+
+class LunationCatalog:
+    """
+    Sorted instants of every principal moon phase over a fixed range, for binary-search phase lookups.
+
+    times holds seconds since the Unix epoch (int64) and phases holds the index into
+    PRINCIPAL_PHASES (int8) of the phase at that time.
+    """
+    def __init__(
+            self,
+            times: np.ndarray,
+            phases: np.ndarray):
+        self.times = times
+        self.phases = phases
+
+    def next_phases(self, unix_seconds: float, count: int = 1) -> Optional[List[Tuple[str, int]]]:
+        """
+        Find the principal phases strictly after a given time.
+
+        Parameters:
+        unix_seconds (float): The time in seconds since the Unix epoch.
+        count (int, optional): The number of phases to return. Defaults to 1.
+
+        Returns:
+        Optional[List[Tuple[str, int]]]: The name and Unix time of each phase in order,
+                                         or None if the catalog does not cover the query.
+        """
+        i = int(np.searchsorted(self.times, unix_seconds, side="right"))
+
+        if i == 0 or i + count > len(self.times):
+            return None
+
+        return [(PRINCIPAL_PHASES[self.phases[j]], int(self.times[j])) for j in range(i, i + count)]
+
+    def previous_phases(self, unix_seconds: float, count: int = 1) -> Optional[List[Tuple[str, int]]]:
+        """
+        Find the principal phases strictly before a given time.
+
+        Parameters:
+        unix_seconds (float): The time in seconds since the Unix epoch.
+        count (int, optional): The number of phases to return. Defaults to 1.
+
+        Returns:
+        Optional[List[Tuple[str, int]]]: The name and Unix time of each phase in order,
+                                         or None if the catalog does not cover the query.
+        """
+        i = int(np.searchsorted(self.times, unix_seconds, side="left"))
+
+        if i - count < 0 or i == len(self.times):
+            return None
+
+        return [(PRINCIPAL_PHASES[self.phases[j]], int(self.times[j])) for j in range(i - count, i)]
+
+    def phases_between(self, start: float, end: float) -> Optional[List[Tuple[str, int]]]:
+        """
+        Find the principal phases in a range of time.
+
+        Parameters:
+        start (float): The start of the range in seconds since the Unix epoch, inclusive.
+        end (float): The end of the range in seconds since the Unix epoch, exclusive.
+
+        Returns:
+        Optional[List[Tuple[str, int]]]: The name and Unix time of each phase in order,
+                                         or None if the catalog does not cover the range.
+        """
+        first = int(np.searchsorted(self.times, start, side="left"))
+        last = int(np.searchsorted(self.times, end, side="left"))
+
+        if first == 0 or last == len(self.times):
+            return None
+
+        return [(PRINCIPAL_PHASES[self.phases[j]], int(self.times[j])) for j in range(first, last)]
+
+    def save(self, path: str):
+        """
+        Write the catalog to a file that can be memory-mapped by load.
+
+        Parameters:
+        path (str): The file to write.
+        """
+        arrays = {
+            "times": np.asarray(self.times, dtype=np.int64),
+            "phases": np.asarray(self.phases, dtype=np.int8)
+        }
+
+        write_array_store(path, LUNATION_CATALOG_KIND, LUNATION_CATALOG_VERSION, arrays)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "LunationCatalog":
+        """
+        Read a catalog written by save.
+
+        Parameters:
+        path (str): The file to read.
+        mmap (bool, optional): Memory-map the arrays instead of loading them. Defaults to True.
+
+        Returns:
+        LunationCatalog: The loaded catalog.
+        """
+        arrays, _ = read_array_store(path, LUNATION_CATALOG_KIND, LUNATION_CATALOG_VERSION, mmap=mmap)
+
+        return cls(arrays["times"], arrays["phases"])
+
+def build_lunation_catalog(
+        start: Union[datetime, date],
+        end: Union[datetime, date]) -> LunationCatalog:
+    """
+    Compute every New, First Quarter, Full and Last Quarter moon over a range of time.
+
+    Parameters:
+    start (Union[datetime, date]): The start of the range. Naive values are taken to be UTC.
+    end (Union[datetime, date]): The end of the range. Naive values are taken to be UTC.
+
+    Returns:
+    LunationCatalog: The catalog of principal phases.
+    """
+    if not isinstance(start, datetime):
+        start = datetime.combine(start, time.min)
+
+    if not isinstance(end, datetime):
+        end = datetime.combine(end, time.min)
+
+    start_date, end_date = ephem_dates_from_times([start, end])
+
+    dates = []
+    phases = []
+
+    for phase_index, search in enumerate(PHASE_SEARCHES):
+        t = search(start_date)
+
+        while t < end_date:
+            dates.append(float(t))
+            phases.append(phase_index)
+            t = search(t)
+
+    order = np.argsort(dates)
+    times = np.round(unix_seconds_from_ephem_dates(np.array(dates)[order])).astype(np.int64)
+
+    return LunationCatalog(times, np.array(phases, dtype=np.int8)[order])
+
+_lunation_catalog = None
+
+def set_lunation_catalog(catalog: Optional[LunationCatalog]):
+    """
+    Set the lunation catalog used by the moon phase functions, or None to always use the live ephemeris.
+
+    Parameters:
+    catalog (Optional[LunationCatalog]): The catalog to use.
+    """
+    global _lunation_catalog
+    _lunation_catalog = catalog
+
+def get_lunation_catalog() -> Optional[LunationCatalog]:
+    """
+    Get the lunation catalog used by the moon phase functions.
+
+    Returns:
+    Optional[LunationCatalog]: The catalog in use, or None if there is none.
+    """
+    return _lunation_catalog
+
+def load_lunation_catalog(path: str, mmap: bool = True) -> LunationCatalog:
+    """
+    Load a lunation catalog from a file and use it in the moon phase functions.
+
+    Parameters:
+    path (str): The file written by LunationCatalog.save.
+    mmap (bool, optional): Memory-map the arrays instead of loading them. Defaults to True.
+
+    Returns:
+    LunationCatalog: The loaded catalog.
+    """
+    catalog = LunationCatalog.load(path, mmap=mmap)
+    set_lunation_catalog(catalog)
+
+    return catalog
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a lunation catalog file.")
+    parser.add_argument("output", help="the catalog file to write")
+    parser.add_argument("--start", type=int, default=1900, help="the first year of the catalog")
+    parser.add_argument("--end", type=int, default=2100, help="the year the catalog ends at the start of")
+    args = parser.parse_args()
+
+    catalog = build_lunation_catalog(date(args.start, 1, 1), date(args.end, 1, 1))
+    catalog.save(args.output)
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,137 @@
-from .recent_phases import recent_phases
-from .upcoming_phases import upcoming_phases
-from .find_next_phase import find_next_phase
-from .determine_moon_phase import determine_moon_phase
-from .generate_moon_phase_emoji import generate_moon_phase_emoji
-from .full_moons_in_month import full_moons_in_month
-from .generate_moon_name import generate_moon_name
-from .determine_moon_sign import determine
-from .moon_status_at_time import moon_status_at_time
-from .moon_status_on_date import moon_status_on_date
-from .generate_moon_name_emoji import generate_moon_name_emoji
-from .determine_sun_sign import determine_sun_sign
-from .sun_status_at_time import sun_status_at_time
-from .sun_status_on_date import sun_status_on_date
-from .generate_zodiac_emoji import generate_zodiac_emoji
-from .generate_hebrew_date_string import generate_hebrew_date_string
-from .generate_roman_date_string import generate_roman_date_string
-from .status_at_time import status_at_time
-from .status_on_date import status_on_date
-from .locate_device import locate_device
-from .determine_sign import determine_sign
-from .next_sign import next_sign
+from importlib import import_module
+
+# Public names of the package and the modules defining them, imported on first use
+EXPORTS = {
+    "recent_phases": "recent_phases",
+    "upcoming_phases": "upcoming_phases",
+    "find_next_phase": "find_next_phase",
+    "determine_moon_phase": "determine_moon_phase",
+    "generate_moon_phase_emoji": "generate_moon_phase_emoji",
+    "full_moons_in_month": "full_moons_in_month",
+    "generate_moon_name": "generate_moon_name",
+    "determine": "determine_moon_sign",
+    "moon_status_at_time": "moon_status_at_time",
+    "moon_status_on_date": "moon_status_on_date",
+    "generate_moon_name_emoji": "generate_moon_name_emoji",
+    "determine_sun_sign": "determine_sun_sign",
+    "sun_status_at_time": "sun_status_at_time",
+    "sun_status_on_date": "sun_status_on_date",
+    "generate_zodiac_emoji": "generate_zodiac_emoji",
+    "generate_hebrew_date_string": "generate_hebrew_date_string",
+    "generate_roman_date_string": "generate_roman_date_string",
+    "status_at_time": "status_at_time",
+    "status_on_date": "status_on_date",
+    "locate_device": "locate_device",
+    "set_device_location": "locate_device",
+    "set_offline_mode": "locate_device",
+    "clear_location_cache": "locate_device",
+    "determine_sign": "determine_sign",
+    "next_sign": "next_sign",
+    "calculate_ecliptic_longitude": "calculate_ecliptic_longitude",
+    "calculate_ecliptic_longitudes": "calculate_ecliptic_longitudes",
+    "to_utc_datetime64": "time_scales",
+    "julian_dates": "time_scales",
+    "terrestrial_julian_dates": "time_scales",
+    "julian_centuries": "time_scales",
+    "delta_t": "time_scales",
+    "mean_obliquity": "time_scales",
+    "nutation": "time_scales",
+    "true_obliquity": "time_scales",
+    "find_next_ingress": "find_next_ingress",
+    "SignIngressIndex": "sign_ingress_index",
+    "build_sign_ingress_index": "sign_ingress_index",
+    "load_sign_ingress_index": "sign_ingress_index",
+    "set_sign_ingress_index": "sign_ingress_index",
+    "get_sign_ingress_index": "sign_ingress_index",
+    "is_retrograde": "is_retrograde",
+    "find_stations": "find_stations",
+    "RetrogradeIndex": "retrograde_index",
+    "build_retrograde_index": "retrograde_index",
+    "retrograde_periods": "retrograde_index",
+    "LunationCatalog": "lunation_catalog",
+    "build_lunation_catalog": "lunation_catalog",
+    "load_lunation_catalog": "lunation_catalog",
+    "set_lunation_catalog": "lunation_catalog",
+    "get_lunation_catalog": "lunation_catalog",
+    "phases_between": "phases_between",
+    "YearAlmanac": "year_almanac",
+    "get_year_almanac": "year_almanac",
+    "LongitudeCache": "longitude_cache",
+    "longitude_cache_info": "longitude_cache",
+    "clear_longitude_cache": "longitude_cache",
+    "set_longitude_cache_size": "longitude_cache",
+    "find_timezone": "find_timezone",
+    "get_timezone_finder": "find_timezone",
+    "find_timezones": "find_timezones",
+    "ObserverSession": "observer_session",
+    "DaySnapshot": "day_snapshot",
+    "take_day_snapshot": "day_snapshot",
+    "status_over_range": "status_over_range",
+    "StatusRequest": "batch_status",
+    "batch_status": "batch_status",
+    "status_for_observers": "status_for_observers",
+    "set_async_executor": "async_api",
+    "get_async_executor": "async_api",
+    "alocate_device": "async_api",
+    "afind_timezone": "async_api",
+    "astatus_on_date": "async_api",
+    "astatus_at_time": "async_api",
+    "adetermine_moon_phase": "async_api",
+    "afind_next_phase": "async_api",
+    "agenerate_moon_name": "async_api",
+    "adetermine_sign": "async_api",
+    "ais_retrograde": "async_api",
+    "anext_sign": "async_api",
+    "aupcoming_phases": "async_api",
+    "arecent_phases": "async_api",
+    "enable_instrumentation": "instrumentation",
+    "is_instrumentation_enabled": "instrumentation",
+    "reset_stats": "instrumentation",
+    "get_stats": "instrumentation",
+    "collect_stats": "instrumentation",
+    "format_stats": "instrumentation",
+    "EphemerisBackend": "ephemeris_backend",
+    "EphemBackend": "ephemeris_backend",
+    "AnalyticBackend": "ephemeris_backend",
+    "ChebyshevBackend": "ephemeris_backend",
+    "set_ephemeris_backend": "ephemeris_backend",
+    "get_ephemeris_backend": "ephemeris_backend",
+    "analytic_longitudes": "analytic_ephemeris",
+    "ChebyshevYear": "chebyshev_ephemeris",
+    "build_chebyshev_year": "chebyshev_ephemeris",
+    "MoonPhaseStates": "moon_phase_angles",
+    "moon_phase_states": "moon_phase_angles",
+    "moon_elongations": "moon_phase_angles",
+    "moon_illuminations": "moon_phase_angles",
+    "moon_ages": "moon_phase_angles",
+    "classify_moon_phases": "moon_phase_angles"
+}
+
+__all__ = list(EXPORTS)
+
+def load_export(name: str):
+    """
+    Import the module defining a public name and return the named object.
+
+    Parameters:
+    name (str): The public name.
+
+    Returns:
+    The function, class or value with that name.
+
+    Raises:
+    AttributeError: If the name is not public.
+    """
+    if name not in EXPORTS:
+        raise AttributeError(f"module {__package__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{EXPORTS[name]}", __package__), name)
+    globals()[name] = value
+
+    return value
+
+def __getattr__(name: str):
+    return load_export(name)
+
+def __dir__():
+    return sorted(set(globals()) | set(EXPORTS))
@@ -0,0 +1,138 @@
+from typing import NamedTuple, Union
+import numpy as np
+
+from .constants import PRINCIPAL_PHASES, INTERMEDIATE_PHASES, MEAN_ELONGATION_RATE
+from .time_scales import TimesLike, ephem_dates_from_times
+from .ephemeris_backend import EphemerisBackend, resolve_ephemeris_backend
+from .instrumentation import timed
+
+# Newton steps taken back to the last New Moon, each shrinking the error about fivefold
+AGE_ITERATIONS = 6
+
+class MoonPhaseStates(NamedTuple):
+    """
+    The phase of the Moon at each of an array of instants.
+
+    elongation is the Moon's ecliptic longitude minus the Sun's in degrees (0 at New Moon,
+    90 at First Quarter, 180 at Full Moon, 270 at Last Quarter), illumination the illuminated
+    fraction of the disk from 0 to 1, and age the days since the last New Moon.
+    """
+    elongation: np.ndarray
+    illumination: np.ndarray
+    age: np.ndarray
+
+def moon_elongations(
+        times: TimesLike,
+        backend: Union[EphemerisBackend, str] = None) -> np.ndarray:
+    """
+    Calculate the Moon's elongation from the Sun in ecliptic longitude over an array of instants.
+
+    Parameters:
+    times (TimesLike): The instants. See time_scales.ephem_dates_from_times.
+    backend (Union[EphemerisBackend, str], optional): The ephemeris backend, or its name. Defaults to the global backend.
+
+    Returns:
+    np.ndarray: The elongations in degrees, 0-360, increasing through each lunation.
+    """
+    longitudes = resolve_ephemeris_backend(backend).longitudes(["sun", "moon"], times)
+
+    return (longitudes[:, 1] - longitudes[:, 0]) % 360
+
+def moon_illuminations(elongations: np.ndarray) -> np.ndarray:
+    """
+    Calculate the illuminated fraction of the Moon's disk from its elongation.
+
+    The Sun is taken to be infinitely far and the Moon's latitude is ignored, which keeps
+    the fraction within about 0.005 of the true one.
+
+    Parameters:
+    elongations (np.ndarray): The elongations in degrees.
+
+    Returns:
+    np.ndarray: The illuminated fractions, 0 at New Moon and 1 at Full Moon.
+    """
+    return (1 - np.cos(np.radians(elongations))) / 2
+
+@timed()
+def moon_ages(
+        times: TimesLike,
+        backend: Union[EphemerisBackend, str] = None,
+        elongations: np.ndarray = None) -> np.ndarray:
+    """
+    Calculate the days since the last New Moon over an array of instants.
+
+    The New Moon before each instant is found by Newton's method on the elongation,
+    starting from the mean rate of the Moon's elongation.
+
+    Parameters:
+    times (TimesLike): The instants. See time_scales.ephem_dates_from_times.
+    backend (Union[EphemerisBackend, str], optional): The ephemeris backend, or its name. Defaults to the global backend.
+    elongations (np.ndarray, optional): The elongations at the instants, if already calculated. Defaults to None.
+
+    Returns:
+    np.ndarray: The ages in days.
+    """
+    backend = resolve_ephemeris_backend(backend)
+    ephem_dates = ephem_dates_from_times(times)
+
+    if elongations is None:
+        elongations = moon_elongations(ephem_dates, backend)
+
+    # Step back by the elongation at the mean rate, then correct by the elongation left at each estimate
+    new_moons = ephem_dates - elongations / MEAN_ELONGATION_RATE
+
+    for _ in range(AGE_ITERATIONS):
+        remaining = (moon_elongations(new_moons, backend) + 180) % 360 - 180
+        new_moons -= remaining / MEAN_ELONGATION_RATE
+
+    return ephem_dates - new_moons
+
+@timed()
+def moon_phase_states(
+        times: TimesLike,
+        backend: Union[EphemerisBackend, str] = None) -> MoonPhaseStates:
+    """
+    Calculate the elongation, illuminated fraction and age of the Moon over an array of instants.
+
+    Parameters:
+    times (TimesLike): The instants. See time_scales.ephem_dates_from_times.
+    backend (Union[EphemerisBackend, str], optional): The ephemeris backend, or its name. Defaults to the global backend.
+
+    Returns:
+    MoonPhaseStates: The elongations in degrees, illuminated fractions and ages in days.
+    """
+    ephem_dates = ephem_dates_from_times(times)
+    elongations = moon_elongations(ephem_dates, backend)
+
+    return MoonPhaseStates(
+        elongation=elongations,
+        illumination=moon_illuminations(elongations),
+        age=moon_ages(ephem_dates, backend, elongations)
+    )
+
+def classify_moon_phases(elongations: np.ndarray, later_elongations: np.ndarray) -> np.ndarray:
+    """
+    Name the moon phase at each instant from the elongation then and at the end of its day.
+
+    A principal phase is named if the elongation reaches its multiple of 90 degrees after the
+    instant and by the end of the day. Otherwise the intermediate phase of the elongation's
+    quadrant is named. This matches determine_moon_phase's search for the next principal phase.
+
+    Parameters:
+    elongations (np.ndarray): The elongations at the instants in degrees.
+    later_elongations (np.ndarray): The elongations at the ends of their days in degrees.
+
+    Returns:
+    np.ndarray: The phase names.
+    """
+    elongations = np.asarray(elongations, dtype=np.float64) % 360
+    quadrants = (elongations // 90).astype(np.int64) % 4
+
+    # The elongation only increases, by less than a quadrant a day
+    advance = (np.asarray(later_elongations, dtype=np.float64) - elongations) % 360
+    reaches_next = elongations + advance >= (quadrants + 1) * 90
+
+    principal = np.array(PRINCIPAL_PHASES, dtype=object)[(quadrants + 1) % 4]
+    intermediate = np.array(INTERMEDIATE_PHASES, dtype=object)[quadrants]
+
+    return np.where(reaches_next, principal, intermediate)
@@ -12,12 +12,16 @@ from .generate_zodiac_emoji import generate_zodiac_emoji
 from .parse_timestamp import parse_timestamp
 from .locate_device import locate_device
 from .process_time import process_time
+from .observer_session import ObserverSession, resolve_session
+from .instrumentation import timed
 
+@timed()
 def moon_status_at_time(
         dt: Union[ephem.Date, datetime, date, str] = None,
         timezone: Union[ZoneInfo, str] = None,
         lat: float = None,
-        lon: float = None) -> str:
+        lon: float = None,
+        session: ObserverSession = None) -> str:
     """
     Generate a string describing the moon's status at a given time and location.
 
@@ -26,10 +30,14 @@ def moon_status_at_time(
     timezone (Union[ZoneInfo, str]): The timezone for the given date and time.
     lat (float): The latitude of the location.
     lon (float): The longitude of the location.
+    session (ObserverSession, optional): The observer session to take the timezone, latitude and longitude from. Defaults to None.
 
     Returns:
     str: A string describing the moon's phase, name, and zodiac sign with corresponding emojis.
     """
+    # Take the timezone and coordinates from the session, if one is given
+    timezone, lat, lon = resolve_session(session, timezone, lat, lon)
+
     # If latitude and longitude are not provided, locate the device
     if lat is None or lon is None:
         lat, lon = locate_device()
@@ -38,15 +46,15 @@ def moon_status_at_time(
     dt, timezone = process_time(dt, timezone, lat, lon) 
 
     # Generate moon name and corresponding emoji
-    name = generate_moon_name(dt, include_moon=False)
+    name = generate_moon_name(dt, timezone, lat, lon, include_moon=False, session=session)
     moon_name_emoji = generate_moon_name_emoji(name)
 
     # Get moon phase and corresponding emoji
-    phase = determine_moon_phase(dt)
+    phase = determine_moon_phase(dt, timezone, lat, lon, session=session)
     moon_phase_emoji = generate_moon_phase_emoji(phase)
 
     # Get moon sign and corresponding zodiac emoji
-    sign = determine(dt, lat=lat, lon=lon)
+    sign = determine(dt, timezone=timezone, lat=lat, lon=lon, session=session)
     zodiac_emoji = generate_zodiac_emoji(sign)
 
     # Return the formatted string
@@ -1,5 +1,5 @@
 from typing import Union
-from datetime import datetime, timedelta, date
+from datetime import datetime, date
 from zoneinfo import ZoneInfo
 import ephem
 
@@ -7,16 +7,21 @@ from .generate_moon_phase_emoji import generate_moon_phase_emoji
 from .determine_moon_phase import determine_moon_phase
 from .generate_moon_name import generate_moon_name
 from .generate_moon_name_emoji import generate_moon_name_emoji
-from .determine_moon_sign import determine
+from .day_snapshot import DaySnapshot, take_day_snapshot
 from .generate_zodiac_emoji import generate_zodiac_emoji
 from .locate_device import locate_device
 from .process_date import process_date
+from .observer_session import ObserverSession, resolve_session
+from .instrumentation import timed
 
+@timed()
 def moon_status_on_date(
         d: Union[ephem.Date, datetime, date, str] = None,
         timezone: Union[ZoneInfo, str] = None,
         lat: float = None,
-        lon: float = None) -> str:
+        lon: float = None,
+        session: ObserverSession = None,
+        snapshot: DaySnapshot = None) -> str:
     """
     Returns a string describing the moon's status on a given date.
 
@@ -25,10 +30,15 @@ def moon_status_on_date(
     timezone (Union[ZoneInfo, str], optional): The timezone for the date. Defaults to None.
     lat (float, optional): The latitude for the location. Defaults to None.
     lon (float, optional): The longitude for the location. Defaults to None.
+    session (ObserverSession, optional): The observer session to take the timezone, latitude and longitude from. Defaults to None.
+    snapshot (DaySnapshot, optional): The snapshot of the date, if it has already been taken. Defaults to None.
 
     Returns:
     str: A string describing the moon's phase, name, and zodiac sign.
     """
+    # Take the timezone and coordinates from the session, if one is given
+    timezone, lat, lon = resolve_session(session, timezone, lat, lon)
+
     # If latitude and longitude are not provided, locate the device to get them
     if lat is None or lon is None:
         lat, lon = locate_device()
@@ -37,28 +47,20 @@ def moon_status_on_date(
     d, timezone = process_date(d, timezone, lat, lon) 
 
     # Generate the moon's name and corresponding emoji
-    name = generate_moon_name(d, include_moon=False)
+    name = generate_moon_name(d, timezone, lat, lon, include_moon=False, session=session)
     moon_name_emoji = generate_moon_name_emoji(name)
 
     # Get the moon's phase and corresponding emoji
-    phase = determine_moon_phase(d)
+    phase = determine_moon_phase(d, timezone, lat, lon, session=session)
     moon_phase_emoji = generate_moon_phase_emoji(phase)
 
-    # Get the moon's zodiac sign and corresponding emoji
-    sign = determine(d, lat=lat, lon=lon)
-    zodiac_emoji = generate_zodiac_emoji(sign)
-    
-    # Determine the moon's zodiac sign for the previous and next day
-    yesterday_sign = determine(d - timedelta(days=1), lat=lat, lon=lon)
-    tomorrow_sign = determine(d + timedelta(days=1), lat=lat, lon=lon)
+    # Read the moon's zodiac sign and its movement through the zodiac from the snapshot of the day
+    if snapshot is None:
+        snapshot = take_day_snapshot(d, timezone, lat, lon)
 
-    # Determine the movement of the moon in the zodiac
-    if yesterday_sign != sign:
-        movement_string = "enters"
-    elif tomorrow_sign != sign:
-        movement_string = "leaves"
-    else:
-        movement_string = "in"
+    sign = snapshot.sign("Moon")
+    zodiac_emoji = generate_zodiac_emoji(sign)
+    movement_string = snapshot.movement("Moon")
 
     # Return the formatted string describing the moon's status
     return f"{moon_name_emoji}{moon_phase_emoji}{zodiac_emoji} {phase} {name} Moon {movement_string} {sign}"
\ No newline at end of file
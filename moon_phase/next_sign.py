@@ -1,26 +1,47 @@
-from datetime import datetime, date, timedelta
-from typing import Union
+from datetime import datetime, date, time, timedelta
+from typing import Tuple, Union
 from zoneinfo import ZoneInfo
-import geocoder
-import dateparser
 import ephem
-import numpy as np
 
-from .constants import *
 from .locate_device import locate_device
-from .find_timezone import find_timezone
 from .create_ephem_body import create_ephem_body
-from .calculate_ecliptic_longitude import calculate_ecliptic_longitude
-from .tropical_zodiac_from_ecliptic_longitude import tropical_zodiac_from_ecliptic_longitude
 from .determine_sign import determine_sign
+from .find_next_ingress import find_next_ingress
 from .process_date import process_date
+from .process_time import process_time
+from .observer_session import ObserverSession, resolve_session
+from .instrumentation import timed
 
+@timed()
 def next_sign(
         body: ephem.Body,
         current_date: Union[date, str] = None,
         timezone: Union[ZoneInfo, str] = None,
         lat: float = None,
-        lon: float = None) -> str:
+        lon: float = None,
+        exact: bool = False,
+        tolerance: timedelta = timedelta(seconds=1),
+        session: ObserverSession = None) -> Tuple[Union[date, datetime], str]:
+    """
+    Find the next change of tropical zodiac sign of a celestial body.
+
+    Parameters:
+    body (ephem.Body): The celestial body. Can be an ephem.Body object or a string.
+    current_date (Union[date, str], optional): The date to search from. Defaults to None.
+    timezone (Union[ZoneInfo, str], optional): The timezone of the given date. Defaults to None.
+    lat (float, optional): The latitude of the observer. Defaults to None.
+    lon (float, optional): The longitude of the observer. Defaults to None.
+    exact (bool, optional): Return the instant of the ingress instead of the first date whose
+                            local midnight falls in the new sign. Defaults to False.
+    tolerance (timedelta, optional): The precision of the ingress instant. Defaults to one second.
+    session (ObserverSession, optional): The observer session to take the timezone, latitude and longitude from. Defaults to None.
+
+    Returns:
+    Tuple[Union[date, datetime], str]: The date (or instant, if exact) of the change and the new sign.
+    """
+    # Take the timezone and coordinates from the session, if one is given
+    timezone, lat, lon = resolve_session(session, timezone, lat, lon)
+
     if isinstance(body, str):
         body = create_ephem_body(body)
 
@@ -28,13 +49,27 @@ def next_sign(
         lat, lon = locate_device()
 
     current_date, timezone = process_date(current_date, timezone, lat, lon)
-    
+    start, timezone = process_time(current_date, timezone, lat, lon)
+
+    if exact:
+        return find_next_ingress(body, start, timezone, lat, lon, tolerance)
+
     current_sign = determine_sign(body, current_date, timezone, lat, lon)
-    sign = current_sign
-    d = current_date
+    t = start
 
-    while sign == current_sign:
-        d += timedelta(days=1)
+    while True:
+        ingress, sign = find_next_ingress(body, t, timezone, lat, lon, tolerance)
+
+        # The first local midnight at or after the ingress
+        d = ingress.date()
+
+        if ingress.timetz().replace(tzinfo=None) != time.min:
+            d += timedelta(days=1)
+
+        # The body may have re-crossed into its original sign before that midnight
         sign = determine_sign(body, d, timezone, lat, lon)
 
-    return d, sign
+        if sign != current_sign:
+            return d, sign
+
+        t, timezone = process_time(d, timezone, lat, lon)
@@ -0,0 +1,176 @@
+from typing import Any, Optional, Tuple, Union
+from collections import OrderedDict
+from datetime import datetime, date
+from threading import Lock, local
+from zoneinfo import ZoneInfo
+import ephem
+
+from .locate_device import locate_device
+from .find_timezone import find_timezone
+from .instrumentation import count
+from .constants import SESSION_CACHE_SIZE
+
+class SessionCache:
+    """
+    A thread-safe mapping of results that keeps the most recently used entries.
+
+    Used for each session's results, and by the HTTP service for its sessions and responses.
+    """
+    def __init__(self, maxsize: int = SESSION_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._entries
+
+    def __getitem__(self, key: Any) -> Any:
+        with self._lock:
+            value = self._entries[key]
+            self._entries.move_to_end(key)
+
+            return value
+
+    def __setitem__(self, key: Any, value: Any):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+class ObserverSession:
+    """
+    An observer whose location and timezone are resolved once and reused across calls.
+
+    Pass a session to any public function with session=... instead of timezone, lat and lon.
+    Loose arguments given alongside a session take precedence over it. The session also holds
+    an ephem.Observer for each thread and a cache of results shared by the calls made with it.
+    The cache keeps the cache_size most recently used results, and can be emptied with clear_cache.
+    """
+    def __init__(
+            self,
+            lat: float = None,
+            lon: float = None,
+            timezone: Union[ZoneInfo, str] = None,
+            cache_size: int = SESSION_CACHE_SIZE):
+        # If latitude or longitude is not provided, locate the device to get the coordinates
+        if lat is None or lon is None:
+            lat, lon = locate_device()
+
+        # If timezone is not provided, find the timezone based on latitude and longitude
+        if timezone is None:
+            timezone = find_timezone(lat, lon)
+
+        # If timezone is given by name, look it up
+        if isinstance(timezone, str):
+            timezone = ZoneInfo(timezone)
+
+        self.lat = float(lat)
+        self.lon = float(lon)
+        self.timezone = timezone
+        self.cache = SessionCache(cache_size)
+        self._local = local()
+
+    def __repr__(self) -> str:
+        return f"ObserverSession(lat={self.lat}, lon={self.lon}, timezone={self.timezone.key!r})"
+
+    @property
+    def observer(self) -> ephem.Observer:
+        """
+        The ephem.Observer at the session's location, one per thread so that setting its date is safe.
+        """
+        observer = getattr(self._local, "observer", None)
+
+        if observer is None:
+            observer = ephem.Observer()
+            observer.lat = str(self.lat)
+            observer.lon = str(self.lon)
+            self._local.observer = observer
+
+        return observer
+
+    def observer_at(self, dt: Union[ephem.Date, datetime]) -> ephem.Observer:
+        """
+        Get the session's ephem.Observer set to a given time.
+
+        Parameters:
+        dt (Union[ephem.Date, datetime]): The time. Naive datetimes are taken to be UTC.
+
+        Returns:
+        ephem.Observer: The observer of the current thread.
+        """
+        observer = self.observer
+        observer.date = dt
+
+        return observer
+
+    def cached(self, key: Any, compute):
+        """
+        Look up a result in the session's cache, computing and storing it if it is missing.
+
+        Parameters:
+        key (Any): The hashable key of the result.
+        compute (Callable[[], Any]): Computes the result.
+
+        Returns:
+        Any: The cached or computed result.
+        """
+        try:
+            value = self.cache[key]
+            count("cache.session.hits")
+
+            return value
+        except KeyError:
+            count("cache.session.misses")
+            value = compute()
+            self.cache[key] = value
+
+            return value
+
+    def clear_cache(self):
+        """
+        Empty the session's cache of results.
+        """
+        self.cache.clear()
+
+def resolve_session(
+        session: Optional[ObserverSession],
+        timezone: Union[ZoneInfo, str] = None,
+        lat: float = None,
+        lon: float = None) -> Tuple[Union[ZoneInfo, str], float, float]:
+    """
+    Fill in the timezone and coordinates that were not given from a session.
+
+    Parameters:
+    session (Optional[ObserverSession]): The session, or None to leave the arguments unchanged.
+    timezone (Union[ZoneInfo, str], optional): The timezone given. Defaults to None.
+    lat (float, optional): The latitude given. Defaults to None.
+    lon (float, optional): The longitude given. Defaults to None.
+
+    Returns:
+    Tuple[Union[ZoneInfo, str], float, float]: The timezone, latitude and longitude to use.
+    """
+    if session is None:
+        return timezone, lat, lon
+
+    if timezone is None:
+        timezone = session.timezone
+
+    if lat is None or lon is None:
+        lat, lon = session.lat, session.lon
+
+    return timezone, lat, lon
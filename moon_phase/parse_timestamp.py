@@ -1,11 +1,77 @@
-from typing import Union, Tuple
-from datetime import datetime, date
-import dateparser
+from typing import Optional, Union, Tuple
+from datetime import datetime, date, timezone as dt_timezone
+from functools import lru_cache
 from zoneinfo import ZoneInfo
+import re
 
+from .constants import TIMESTAMP_CACHE_SIZE
 from .locate_device import locate_device
 from .find_timezone import find_timezone
+from .instrumentation import count, timed
 
+# ISO 8601 calendar date, e.g. 2024-05-01
+ISO_DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# ISO 8601 / RFC 3339 date and time, e.g. 2024-05-01T12:30, 2024-05-01 12:30:00.5Z, 2024-05-01T12:30:00+02:00
+ISO_DATETIME_PATTERN = re.compile(
+    r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(:\d{2}(\.\d{1,6})?)?(Z|[+-]\d{2}:?\d{2})?",
+    re.IGNORECASE
+)
+
+# Seconds since the Unix epoch with at least 9 integer digits, so that compact dates are not mistaken for one
+EPOCH_PATTERN = re.compile(r"@?[+-]?\d{9,}(\.\d+)?")
+
+# Words whose meaning depends on the current time, so parses containing them are not cached
+RELATIVE_PATTERN = re.compile(
+    r"\b(now|ago|in|hence|today|tonight|tomorrow|yesterday|"
+    r"secs?|seconds?|mins?|minutes?|hrs?|hours?|days?|weeks?|months?|years?)\b",
+    re.IGNORECASE
+)
+
+def parse_machine_timestamp(timestamp: str) -> Optional[Union[datetime, date]]:
+    """
+    Parse an ISO 8601 date, an ISO 8601 or RFC 3339 date and time, or epoch seconds without dateparser.
+
+    Args:
+        timestamp (str): The stripped timestamp string.
+
+    Returns:
+        Optional[Union[datetime, date]]: A date for a date without a time, a datetime otherwise
+        (timezone-aware if an offset or epoch seconds were given), or None if the format is not recognized.
+    """
+    try:
+        if ISO_DATE_PATTERN.fullmatch(timestamp):
+            return date.fromisoformat(timestamp)
+
+        if ISO_DATETIME_PATTERN.fullmatch(timestamp):
+            return datetime.fromisoformat(timestamp.upper())
+
+        if EPOCH_PATTERN.fullmatch(timestamp):
+            return datetime.fromtimestamp(float(timestamp.lstrip("@")), dt_timezone.utc)
+    except (ValueError, OverflowError, OSError):
+        return None
+
+    return None
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def parse_free_form_timestamp(timestamp: str, today: date) -> Optional[datetime]:
+    """
+    Parse a free-form timestamp with dateparser, caching the result for the current day.
+
+    Args:
+        timestamp (str): The timestamp string.
+        today (date): The current date, which keys the cache so that strings such as "May 1" or "monday" resolve afresh each day.
+
+    Returns:
+        Optional[datetime]: The parsed datetime, or None if dateparser could not parse it.
+    """
+    import dateparser
+
+    count("dateparser.parse")
+
+    return dateparser.parse(timestamp)
+
+@timed()
 def parse_timestamp(
         timestamp: str,
         timezone: Union[ZoneInfo, str] = None,
@@ -16,6 +82,9 @@ def parse_timestamp(
     even if the time is midnight. Returns a date object if no time is given.
     Also returns the timezone used.
 
+    ISO 8601 dates, ISO 8601 and RFC 3339 dates and times, and epoch seconds are parsed
+    directly. Other strings are parsed with dateparser.
+
     Args:
         timestamp (str): The timestamp string to parse.
         timezone (Union[ZoneInfo, str], optional): The timezone to use. Defaults to None.
@@ -29,13 +98,34 @@ def parse_timestamp(
     if not isinstance(timestamp, str):
         timestamp = str(timestamp)
 
-    # Parse the timestamp string into a datetime object
-    dt = dateparser.parse(timestamp)
+    timestamp = timestamp.strip()
+
+    # Parse machine-generated timestamps directly, where the format tells whether a time is given
+    dt = parse_machine_timestamp(timestamp)
+
+    if dt is not None:
+        has_time = isinstance(dt, datetime)
+
+        if not has_time:
+            dt = datetime.combine(dt, datetime.min.time())
+    else:
+        # Parse other timestamps with dateparser, caching those that do not depend on the current time
+        if RELATIVE_PATTERN.search(timestamp):
+            import dateparser
+            count("dateparser.parse")
+            dt = dateparser.parse(timestamp)
+        else:
+            dt = parse_free_form_timestamp(timestamp, date.today())
+
+        if dt is None:
+            raise ValueError(f"unable to parse timestamp: {timestamp}")
+
+        # Check if the time is exactly midnight and no time component is present in the string
+        has_time = not (dt.time() == datetime.min.time() and timestamp.count(':') == 0)
 
     # If the parsed datetime has timezone info and no explicit timezone is provided
     if dt.tzinfo is not None and timezone is None:
-        # Check if the time is exactly midnight and no time component is present in the string
-        if dt.time() == datetime.min.time() and timestamp.strip().count(':') == 0:
+        if not has_time:
             return dt.date(), dt.tzinfo
         return dt, dt.tzinfo
     elif timezone is None:
@@ -44,15 +134,18 @@ def parse_timestamp(
             lat, lon = locate_device()
 
         timezone = find_timezone(lat, lon)
-    else:
-        # Use the provided timezone
+    elif isinstance(timezone, str):
+        # Look up the provided timezone by name
         timezone = ZoneInfo(timezone)
 
-    # Replace the timezone info in the parsed datetime
-    dt = dt.replace(tzinfo=timezone)
+    if dt.tzinfo is not None:
+        # Convert a parsed instant to the provided timezone
+        dt = dt.astimezone(timezone)
+    else:
+        # Set the timezone of a parsed wall-clock time
+        dt = dt.replace(tzinfo=timezone)
 
-    # Check if the time is exactly midnight and no time component is present in the string
-    if dt.time() == datetime.min.time() and timestamp.strip().count(':') == 0:
+    if not has_time:
         return dt.date(), timezone
-    
-    return dt, timezone
\ No newline at end of file
+
+    return dt, timezone
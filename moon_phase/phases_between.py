@@ -0,0 +1,76 @@
+from datetime import datetime, date
+from typing import Iterator, Tuple, Union
+from zoneinfo import ZoneInfo
+import ephem
+
+from .constants import PRINCIPAL_PHASES
+from .process_time import process_time
+from .lunation_catalog import get_lunation_catalog, PHASE_SEARCHES
+from .time_scales import unix_seconds_from_ephem_dates, ephem_dates_from_unix_seconds
+from .observer_session import ObserverSession, resolve_session
+
+def phases_between(
+        start: Union[ephem.Date, datetime, date, str] = None,
+        end: Union[ephem.Date, datetime, date, str] = None,
+        timezone: Union[ZoneInfo, str] = None,
+        lat: float = None,
+        lon: float = None,
+        session: ObserverSession = None) -> Iterator[Tuple[str, datetime]]:
+    """
+    Walks the lunations forward from a start time and yields each principal
+    moon phase (New, First Quarter, Full, Last Quarter) once, in order, until
+    the end time.
+
+    Phases are read from the lunation catalog where it covers the range and
+    found with one ephem search per phase elsewhere, so the generator can be
+    used lazily over ranges spanning decades.
+
+    Args:
+        start: The datetime to start from. Defaults to the present time.
+        end: The datetime to stop before. If None, the generator does not end.
+        timezone: The timezone for the given and output dates.
+        lat: The latitude for the observer's location. Optional.
+        lon: The longitude for the observer's location. Optional.
+        session: The observer session to take the timezone, latitude and longitude from. Optional.
+
+    Yields:
+        The name of each phase and its datetime in the given timezone.
+    """
+    # Take the timezone and coordinates from the session, if one is given
+    timezone, lat, lon = resolve_session(session, timezone, lat, lon)
+
+    start, timezone = process_time(start, timezone, lat, lon)
+
+    if end is not None:
+        end, timezone = process_time(end, timezone, lat, lon)
+        end = ephem.Date(end)
+
+    t = ephem.Date(start)
+    unix_time = start.timestamp()
+    phase_index = None
+    catalog = get_lunation_catalog()
+
+    while True:
+        # Read the next phase from the lunation catalog if it covers the current time
+        next_phases = None if catalog is None else catalog.next_phases(unix_time)
+
+        if next_phases is not None:
+            phase_name, unix_time = next_phases[0]
+            phase_index = PRINCIPAL_PHASES.index(phase_name)
+            t = ephem.Date(float(ephem_dates_from_unix_seconds(unix_time)))
+        elif phase_index is None:
+            # Search for all four phases once to find which comes first
+            candidates = [search(t) for search in PHASE_SEARCHES]
+            phase_index = min(range(len(candidates)), key=lambda i: candidates[i])
+            t = candidates[phase_index]
+            unix_time = float(unix_seconds_from_ephem_dates(t))
+        else:
+            # The phases follow each other in order, so only the next one needs to be searched for
+            phase_index = (phase_index + 1) % len(PHASE_SEARCHES)
+            t = PHASE_SEARCHES[phase_index](t)
+            unix_time = float(unix_seconds_from_ephem_dates(t))
+
+        if end is not None and t >= end:
+            return
+
+        yield PRINCIPAL_PHASES[phase_index], t.datetime().replace(tzinfo=ZoneInfo("UTC")).astimezone(timezone)
@@ -5,12 +5,16 @@ import numpy as np
 import ephem
 
 from .process_time import process_time
+from .observer_session import ObserverSession, resolve_session
+from .instrumentation import timed
 
+@timed()
 def process_date(
         d: Union[ephem.Date, datetime, date, str] = None,
         timezone: Union[ZoneInfo, str] = None,
         lat: float = None,
-        lon: float = None) -> Tuple[date, ZoneInfo]:
+        lon: float = None,
+        session: ObserverSession = None) -> Tuple[date, ZoneInfo]:
     """
     Process the input date and return a date object.
 
@@ -19,10 +23,14 @@ def process_date(
     timezone (Union[ZoneInfo, str], optional): The timezone information.
     lat (float, optional): Latitude for location-based processing.
     lon (float, optional): Longitude for location-based processing.
+    session (ObserverSession, optional): The observer session to take the timezone, latitude and longitude from. Defaults to None.
 
     Returns:
     date: The processed date object.
     """
+    # Take the timezone and coordinates from the session, if one is given
+    timezone, lat, lon = resolve_session(session, timezone, lat, lon)
+
     if d is None:
         # If no date is provided, use the current date
         d = datetime.now().date()
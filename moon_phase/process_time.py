@@ -8,12 +8,16 @@ from .create_ephem_body import create_ephem_body
 from .parse_timestamp import parse_timestamp
 from .locate_device import locate_device
 from .find_timezone import find_timezone
+from .observer_session import ObserverSession, resolve_session
+from .instrumentation import timed
 
+@timed()
 def process_time(
         dt: Union[ephem.Date, datetime, date, str] = None,
         timezone: Union[ZoneInfo, str] = None,
         lat: float = None,
-        lon: float = None) -> Tuple[datetime, ZoneInfo]:
+        lon: float = None,
+        session: ObserverSession = None) -> Tuple[datetime, ZoneInfo]:
     """
     Process the given time and timezone information, and return a datetime object with the appropriate timezone.
 
@@ -22,10 +26,14 @@ def process_time(
     timezone (Union[ZoneInfo, str], optional): The timezone information. Defaults to None.
     lat (float, optional): Latitude for location-based timezone determination. Defaults to None.
     lon (float, optional): Longitude for location-based timezone determination. Defaults to None.
+    session (ObserverSession, optional): The observer session to take the timezone, latitude and longitude from. Defaults to None.
 
     Returns:
     Tuple[datetime, ZoneInfo]: A tuple containing the processed datetime object and the timezone.
     """
+    # Take the timezone and coordinates from the session, if one is given
+    timezone, lat, lon = resolve_session(session, timezone, lat, lon)
+
     # If latitude or longitude is not provided, locate the device to get them
     if lat is None or lon is None:
         lat, lon = locate_device()
@@ -49,6 +57,10 @@ def process_time(
     # If timezone is not provided, find the timezone based on latitude and longitude
     if timezone is None:
         timezone = find_timezone(lat, lon)
+
+    # If timezone is given by name, look it up
+    if isinstance(timezone, str):
+        timezone = ZoneInfo(timezone)
     
     # If datetime is a datetime object and does not have timezone info, set the timezone
     if isinstance(dt, datetime) and dt.tzinfo is None:
@@ -0,0 +1,208 @@
+from datetime import datetime, date, time, timedelta
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from zoneinfo import ZoneInfo
+import ephem
+import numpy as np
+
+from .constants import RETROGRADE_BODIES, MAX_RETROGRADE_DAYS
+from .create_ephem_body import create_ephem_body
+from .find_stations import find_station_ephem_dates
+from .process_time import process_time
+from .time_scales import ephem_dates_from_times, unix_seconds_from_ephem_dates, ephem_dates_from_unix_seconds
+from .observer_session import ObserverSession, resolve_session
+
+class RetrogradeIndex:
+    """
+    Sorted retrograde intervals of planets over a fixed range, for binary-search retrograde lookups.
+
+    For each body, starts and ends hold the seconds since the Unix epoch of the stations that
+    begin and end each retrograde period. Periods that overlap the edges of the range are complete.
+    """
+    def __init__(
+            self,
+            start: float,
+            end: float,
+            starts: Dict[str, np.ndarray],
+            ends: Dict[str, np.ndarray]):
+        self.start = float(start)
+        self.end = float(end)
+        self.starts = starts
+        self.ends = ends
+
+    def covers(self, body_name: str, unix_seconds: float) -> bool:
+        """
+        Check whether the index can answer a query for a body at a given time.
+
+        Parameters:
+        body_name (str): The name of the body, case-insensitive.
+        unix_seconds (float): The time in seconds since the Unix epoch.
+
+        Returns:
+        bool: True if the body is indexed and the time falls inside the indexed range.
+        """
+        return body_name.lower() in self.starts and self.start <= unix_seconds < self.end
+
+    def is_retrograde(self, body_name: str, unix_seconds: float) -> Optional[bool]:
+        """
+        Look up whether a body is retrograde at a given time.
+
+        Parameters:
+        body_name (str): The name of the body, case-insensitive.
+        unix_seconds (float): The time in seconds since the Unix epoch.
+
+        Returns:
+        Optional[bool]: True if the body is retrograde, or None if the index does not cover the query.
+        """
+        if not self.covers(body_name, unix_seconds):
+            return None
+
+        body_name = body_name.lower()
+        i = np.searchsorted(self.starts[body_name], unix_seconds, side="right") - 1
+
+        return bool(i >= 0 and unix_seconds < self.ends[body_name][i])
+
+    def periods(self, body_name: str, start: float, end: float) -> List[Tuple[float, float]]:
+        """
+        List the retrograde periods of a body that overlap a range of time.
+
+        Parameters:
+        body_name (str): The name of the body, case-insensitive.
+        start (float): The start of the range in seconds since the Unix epoch.
+        end (float): The end of the range in seconds since the Unix epoch.
+
+        Returns:
+        List[Tuple[float, float]]: The start and end of each period in seconds since the Unix epoch.
+        """
+        body_name = body_name.lower()
+        starts = self.starts[body_name]
+        ends = self.ends[body_name]
+
+        first = np.searchsorted(ends, start, side="right")
+        last = np.searchsorted(starts, end, side="left")
+
+        return [(float(starts[i]), float(ends[i])) for i in range(first, last)]
+
+def build_retrograde_index(
+        start: Union[datetime, date],
+        end: Union[datetime, date],
+        bodies: Sequence[Union[ephem.Body, str]] = RETROGRADE_BODIES) -> RetrogradeIndex:
+    """
+    Find every retrograde period of the given planets that overlaps a range of time.
+
+    Parameters:
+    start (Union[datetime, date]): The start of the range. Naive values are taken to be UTC.
+    end (Union[datetime, date]): The end of the range. Naive values are taken to be UTC.
+    bodies (Sequence[Union[ephem.Body, str]], optional): The planets to index. Defaults to Mercury through Saturn.
+
+    Returns:
+    RetrogradeIndex: The index of retrograde periods.
+    """
+    if not isinstance(start, datetime):
+        start = datetime.combine(start, time.min)
+
+    if not isinstance(end, datetime):
+        end = datetime.combine(end, time.min)
+
+    start_date, end_date = ephem_dates_from_times([start, end])
+
+    starts = {}
+    ends = {}
+
+    for body in bodies:
+        # If the body is provided as a string, create an ephem.Body object
+        if isinstance(body, str):
+            body = create_ephem_body(body)
+
+        body_name = body.name.lower()
+
+        # Widen the search so that periods overlapping the edges of the range are complete
+        margin = MAX_RETROGRADE_DAYS[body_name]
+        search_start = start_date - margin
+        search_end = end_date + margin
+
+        station_dates, turns_retrograde = find_station_ephem_dates(body, search_start, search_end)
+
+        period_starts = station_dates[turns_retrograde]
+        period_ends = station_dates[~turns_retrograde]
+
+        # Drop a period that ends before the first station in the search window begins one
+        if len(period_ends) > 0 and (len(period_starts) == 0 or period_ends[0] < period_starts[0]):
+            period_ends = period_ends[1:]
+
+        # Drop a period that begins after the last station in the search window ends one
+        period_starts = period_starts[:len(period_ends)]
+
+        # Keep the periods that overlap the range
+        overlapping = (period_ends > start_date) & (period_starts < end_date)
+
+        starts[body_name] = unix_seconds_from_ephem_dates(period_starts[overlapping])
+        ends[body_name] = unix_seconds_from_ephem_dates(period_ends[overlapping])
+
+    start_seconds, end_seconds = unix_seconds_from_ephem_dates([start_date, end_date])
+
+    return RetrogradeIndex(start_seconds, end_seconds, starts, ends)
+
+@lru_cache(maxsize=256)
+def retrograde_index_for_year(body_name: str, year: int) -> RetrogradeIndex:
+    """
+    Build and cache the retrograde index of a planet for one UTC calendar year.
+
+    Parameters:
+    body_name (str): The name of the planet, lowercase.
+    year (int): The calendar year.
+
+    Returns:
+    RetrogradeIndex: The index of the planet's retrograde periods overlapping the year.
+    """
+    return build_retrograde_index(date(year, 1, 1), date(year + 1, 1, 1), [body_name])
+
+def retrograde_periods(
+        body: Union[ephem.Body, str],
+        start: Union[ephem.Date, datetime, date, str] = None,
+        end: Union[ephem.Date, datetime, date, str] = None,
+        timezone: Union[ZoneInfo, str] = None,
+        lat: float = None,
+        lon: float = None,
+        session: ObserverSession = None) -> List[Tuple[datetime, datetime]]:
+    """
+    List the retrograde periods of a planet that overlap a range of dates.
+
+    Parameters:
+    body (Union[ephem.Body, str]): The celestial body. Can be an ephem.Body object or a string.
+    start (Union[ephem.Date, datetime, date, str], optional): The start of the range. Defaults to None.
+    end (Union[ephem.Date, datetime, date, str], optional): The end of the range. Defaults to one year after the start.
+    timezone (Union[ZoneInfo, str], optional): The timezone of the given dates and of the results. Defaults to None.
+    lat (float, optional): The latitude of the observer. Defaults to None.
+    lon (float, optional): The longitude of the observer. Defaults to None.
+    session (ObserverSession, optional): The observer session to take the timezone, latitude and longitude from. Defaults to None.
+
+    Returns:
+    List[Tuple[datetime, datetime]]: The stations beginning and ending each retrograde period.
+    """
+    # Take the timezone and coordinates from the session, if one is given
+    timezone, lat, lon = resolve_session(session, timezone, lat, lon)
+
+    # If the body is provided as a string, create an ephem.Body object
+    if isinstance(body, str):
+        body = create_ephem_body(body)
+
+    if body.name.lower() not in RETROGRADE_BODIES:
+        return []
+
+    start, timezone = process_time(start, timezone, lat, lon)
+
+    if end is None:
+        end = start + timedelta(days=365)
+
+    end, timezone = process_time(end, timezone, lat, lon)
+
+    index = build_retrograde_index(start, end, [body])
+    periods = index.periods(body.name, start.timestamp(), end.timestamp())
+
+    def to_datetime(unix_seconds: float) -> datetime:
+        t = ephem_dates_from_unix_seconds(unix_seconds)
+
+        return ephem.Date(float(t)).datetime().replace(tzinfo=ZoneInfo("UTC")).astimezone(timezone)
+
+    return [(to_datetime(period_start), to_datetime(period_end)) for period_start, period_end in periods]
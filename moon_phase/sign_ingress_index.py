@@ -0,0 +1,219 @@
+from typing import Dict, List, Optional, Sequence, Union
+from datetime import datetime, date, time
+import argparse
+import numpy as np
+import ephem
+
+from .create_ephem_body import create_ephem_body
+from .calculate_ecliptic_longitudes import calculate_ecliptic_longitudes
+from .find_next_ingress import next_ingress_ephem_date
+from .time_scales import ephem_dates_from_times, unix_seconds_from_ephem_dates
+from .array_store import write_array_store, read_array_store
+
+SIGN_INGRESS_INDEX_KIND = "sign_ingress_index"
+SIGN_INGRESS_INDEX_VERSION = 1
+
+DEFAULT_INDEX_BODIES = ["Sun", "Moon", "Mercury", "Venus", "Mars", "Jupiter", "Saturn"]
+
+class SignIngressIndex:
+    """
+    Sorted sign ingress times of celestial bodies over a fixed range, for binary-search sign lookups.
+
+    For each body, times holds seconds since the Unix epoch (int64) and signs holds the index
+    into ZODIAC_SIGNS (int8) of the sign entered at that time. The first entry of each body
+    is the start of the range and the sign the body was in at that time.
+    """
+    def __init__(
+            self,
+            start: int,
+            end: int,
+            times: Dict[str, np.ndarray],
+            signs: Dict[str, np.ndarray]):
+        self.start = int(start)
+        self.end = int(end)
+        self.times = times
+        self.signs = signs
+
+    @property
+    def bodies(self) -> List[str]:
+        return list(self.times.keys())
+
+    def covers(self, body_name: str, unix_seconds: float) -> bool:
+        """
+        Check whether the index can answer a query for a body at a given time.
+
+        Parameters:
+        body_name (str): The name of the body, case-insensitive.
+        unix_seconds (float): The time in seconds since the Unix epoch.
+
+        Returns:
+        bool: True if the body is indexed and the time falls inside the indexed range.
+        """
+        return body_name.lower() in self.times and self.start <= unix_seconds < self.end
+
+    def lookup(self, body_name: str, unix_seconds: float) -> Optional[int]:
+        """
+        Look up the sign of a body at a given time.
+
+        Parameters:
+        body_name (str): The name of the body, case-insensitive.
+        unix_seconds (float): The time in seconds since the Unix epoch.
+
+        Returns:
+        Optional[int]: The index into ZODIAC_SIGNS, or None if the index does not cover the query.
+        """
+        if not self.covers(body_name, unix_seconds):
+            return None
+
+        body_name = body_name.lower()
+        i = np.searchsorted(self.times[body_name], unix_seconds, side="right") - 1
+
+        return int(self.signs[body_name][i])
+
+    def save(self, path: str):
+        """
+        Write the index to a file that can be memory-mapped by load.
+
+        Parameters:
+        path (str): The file to write.
+        """
+        arrays = {}
+
+        for body_name in self.bodies:
+            arrays[f"{body_name}_times"] = np.asarray(self.times[body_name], dtype=np.int64)
+            arrays[f"{body_name}_signs"] = np.asarray(self.signs[body_name], dtype=np.int8)
+
+        metadata = {
+            "start": self.start,
+            "end": self.end,
+            "bodies": self.bodies
+        }
+
+        write_array_store(path, SIGN_INGRESS_INDEX_KIND, SIGN_INGRESS_INDEX_VERSION, arrays, metadata)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "SignIngressIndex":
+        """
+        Read an index written by save.
+
+        Parameters:
+        path (str): The file to read.
+        mmap (bool, optional): Memory-map the arrays instead of loading them. Defaults to True.
+
+        Returns:
+        SignIngressIndex: The loaded index.
+        """
+        arrays, metadata = read_array_store(path, SIGN_INGRESS_INDEX_KIND, SIGN_INGRESS_INDEX_VERSION, mmap=mmap)
+
+        times = {body_name: arrays[f"{body_name}_times"] for body_name in metadata["bodies"]}
+        signs = {body_name: arrays[f"{body_name}_signs"] for body_name in metadata["bodies"]}
+
+        return cls(metadata["start"], metadata["end"], times, signs)
+
+def build_sign_ingress_index(
+        start: Union[datetime, date],
+        end: Union[datetime, date],
+        bodies: Sequence[Union[ephem.Body, str]] = DEFAULT_INDEX_BODIES) -> SignIngressIndex:
+    """
+    Compute every sign ingress of the given bodies over a range of time.
+
+    Parameters:
+    start (Union[datetime, date]): The start of the range. Naive values are taken to be UTC.
+    end (Union[datetime, date]): The end of the range. Naive values are taken to be UTC.
+    bodies (Sequence[Union[ephem.Body, str]], optional): The bodies to index. Defaults to the Sun, Moon and Mercury through Saturn.
+
+    Returns:
+    SignIngressIndex: The index of ingresses.
+    """
+    if not isinstance(start, datetime):
+        start = datetime.combine(start, time.min)
+
+    if not isinstance(end, datetime):
+        end = datetime.combine(end, time.min)
+
+    start_date, end_date = ephem_dates_from_times([start, end])
+    tolerance_days = 1 / 86400
+
+    times = {}
+    signs = {}
+
+    for body in bodies:
+        # If the body is provided as a string, create an ephem.Body object
+        if isinstance(body, str):
+            body = create_ephem_body(body)
+
+        ingress_dates = [start_date]
+        ingress_signs = [int(calculate_ecliptic_longitudes(body, np.array([start_date]), backend="ephem")[0] // 30) % 12]
+        t = start_date
+
+        while True:
+            t, sign_index = next_ingress_ephem_date(body, t, tolerance_days)
+
+            if t >= end_date:
+                break
+
+            if sign_index != ingress_signs[-1]:
+                ingress_dates.append(t)
+                ingress_signs.append(sign_index)
+
+            # Resume just past the ingress so the same crossing is not found again
+            t += tolerance_days
+
+        body_name = body.name.lower()
+        times[body_name] = np.round(unix_seconds_from_ephem_dates(ingress_dates)).astype(np.int64)
+        signs[body_name] = np.array(ingress_signs, dtype=np.int8)
+
+    start_seconds, end_seconds = np.round(unix_seconds_from_ephem_dates([start_date, end_date])).astype(np.int64)
+
+    return SignIngressIndex(start_seconds, end_seconds, times, signs)
+
+_sign_ingress_index = None
+
+def set_sign_ingress_index(index: Optional[SignIngressIndex]):
+    """
+    Set the sign ingress index used by determine_sign, or None to always use the live ephemeris.
+
+    Parameters:
+    index (Optional[SignIngressIndex]): The index to use.
+    """
+    global _sign_ingress_index
+    _sign_ingress_index = index
+
+def get_sign_ingress_index() -> Optional[SignIngressIndex]:
+    """
+    Get the sign ingress index used by determine_sign.
+
+    Returns:
+    Optional[SignIngressIndex]: The index in use, or None if there is none.
+    """
+    return _sign_ingress_index
+
+def load_sign_ingress_index(path: str, mmap: bool = True) -> SignIngressIndex:
+    """
+    Load a sign ingress index from a file and use it in determine_sign.
+
+    Parameters:
+    path (str): The file written by SignIngressIndex.save.
+    mmap (bool, optional): Memory-map the arrays instead of loading them. Defaults to True.
+
+    Returns:
+    SignIngressIndex: The loaded index.
+    """
+    index = SignIngressIndex.load(path, mmap=mmap)
+    set_sign_ingress_index(index)
+
+    return index
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a sign ingress index file.")
+    parser.add_argument("output", help="the index file to write")
+    parser.add_argument("--start", type=int, default=1900, help="the first year of the index")
+    parser.add_argument("--end", type=int, default=2100, help="the year the index ends at the start of")
+    parser.add_argument("--bodies", nargs="+", default=DEFAULT_INDEX_BODIES, help="the bodies to index")
+    args = parser.parse_args()
+
+    index = build_sign_ingress_index(date(args.start, 1, 1), date(args.end, 1, 1), args.bodies)
+    index.save(args.output)
+
+if __name__ == "__main__":
+    main()
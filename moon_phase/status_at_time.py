@@ -1,7 +1,6 @@
 from typing import Optional, Union
 from datetime import datetime, date, timedelta
 from zoneinfo import ZoneInfo
-import dateparser
 import ephem
 
 from .is_retrograde import is_retrograde
@@ -13,19 +12,27 @@ from .moon_status_at_time import moon_status_at_time
 from .sun_status_at_time import sun_status_at_time
 from .determine_sign import determine_sign
 from .process_time import process_time
+from .observer_session import ObserverSession, resolve_session
+from .instrumentation import timed
 
+@timed()
 def status_at_time(
         dt: Union[ephem.Date, datetime, date, str] = None,
         timezone: Union[ZoneInfo, str] = None,
         lat: float = None,
-        lon: float = None) -> str:
+        lon: float = None,
+        session: ObserverSession = None) -> str:
+    # Take the timezone and coordinates from the session, if one is given
+    timezone, lat, lon = resolve_session(session, timezone, lat, lon)
+
     dt, timezone = process_time(dt, timezone, lat, lon)
 
     sun_status = sun_status_at_time(
         dt=dt,
         timezone=timezone,
         lat=lat, 
-        lon=lon
+        lon=lon,
+        session=session
     )
     
     roman_date = generate_roman_date_string(dt)
@@ -34,7 +41,8 @@ def status_at_time(
         dt=dt, 
         timezone=timezone,
         lat=lat, 
-        lon=lon
+        lon=lon,
+        session=session
     )
     
     hebrew_date = generate_hebrew_date_string(dt)
@@ -48,11 +56,12 @@ def status_at_time(
             dt=dt, 
             timezone=timezone,
             lat=lat, 
-            lon=lon
+            lon=lon,
+            session=session
         )
         
         sign_emoji = generate_zodiac_emoji(sign)
-        retrograde = is_retrograde(planet, dt, lat=lat, lon=lon)
+        retrograde = is_retrograde(planet, dt, lat=lat, lon=lon, session=session)
         retrograde_string = 'Retrograde ' if retrograde else ''
 
         status += f"\n{planet_emoji}{sign_emoji} {planet} {retrograde_string}in {sign}"
@@ -0,0 +1,85 @@
+from typing import Dict, Hashable, Iterable, List, Union
+
+from .constants import BATCH_CHUNK_SIZE
+from .batch_status import StatusRequest, STATUS_FUNCTIONS, batch_status
+from .find_timezones import find_timezones
+from .locate_device import locate_device
+from .process_date import process_date
+from .process_time import process_time
+
+def status_for_observers(
+        requests: Iterable[Union[StatusRequest, tuple]],
+        function_name: str = "status_on_date",
+        workers: int = 0,
+        chunk_size: int = BATCH_CHUNK_SIZE,
+        max_in_flight: int = None) -> List[str]:
+    """
+    Render status reports for many observers, computing each distinct report once.
+
+    Positions are geocentric, so a report depends on the observer only through the timezone,
+    which places local midnight and the local date, and the hemisphere, which selects the moon
+    names. Requests are grouped by their date (or UTC instant for status_at_time), timezone
+    and hemisphere. One report is rendered per group and shared by every request in it.
+
+    Parameters:
+    requests (Iterable[Union[StatusRequest, tuple]]): The requests, as StatusRequest objects or (dt, timezone, lat, lon) tuples.
+    function_name (str, optional): "status_on_date" or "status_at_time". Defaults to "status_on_date".
+    workers (int, optional): The number of worker processes rendering the distinct reports, passed to batch_status. Defaults to 0, rendering in this process.
+    chunk_size (int, optional): The number of distinct requests sent to a worker at once. Defaults to BATCH_CHUNK_SIZE.
+    max_in_flight (int, optional): The maximum number of chunks submitted and not yet returned. Defaults to twice the number of workers.
+
+    Returns:
+    List[str]: The report of each request, in order.
+    """
+    if function_name not in STATUS_FUNCTIONS:
+        raise ValueError(f"unknown status function: {function_name}")
+
+    requests = [StatusRequest(*request) for request in requests]
+
+    # Locate the device once for the requests without coordinates
+    if any(request.lat is None or request.lon is None for request in requests):
+        device_lat, device_lon = locate_device()
+        requests = [
+            request._replace(lat=device_lat, lon=device_lon) if request.lat is None or request.lon is None else request
+            for request in requests
+        ]
+
+    # Resolve the timezones of the requests without one in bulk
+    missing = [i for i, request in enumerate(requests) if request.timezone is None]
+
+    if missing:
+        timezones = find_timezones([requests[i].lat for i in missing], [requests[i].lon for i in missing])
+
+        for i, timezone in zip(missing, timezones):
+            requests[i] = requests[i]._replace(timezone=timezone)
+
+    # Group the requests by the date or instant, timezone and hemisphere that decide their report
+    groups: Dict[Hashable, int] = {}
+    distinct_requests = []
+    group_indices = []
+
+    for request in requests:
+        if function_name == "status_on_date":
+            d, timezone = process_date(request.dt, request.timezone, request.lat, request.lon)
+            _, timezone = process_time(d, timezone, request.lat, request.lon)
+            key = (d, timezone, request.lat < 0)
+        else:
+            d, timezone = process_time(request.dt, request.timezone, request.lat, request.lon)
+            key = (d.timestamp(), timezone, request.lat < 0)
+
+        if key not in groups:
+            groups[key] = len(distinct_requests)
+            distinct_requests.append(StatusRequest(d, timezone, request.lat, request.lon))
+
+        group_indices.append(groups[key])
+
+    # Render each distinct report once and fan it out to the requests sharing it
+    distinct_statuses = list(batch_status(
+        distinct_requests,
+        function_name=function_name,
+        workers=workers,
+        chunk_size=chunk_size,
+        max_in_flight=max_in_flight
+    ))
+
+    return [distinct_statuses[i] for i in group_indices]
@@ -0,0 +1,75 @@
+from collections import deque
+from datetime import datetime, date, time, timedelta
+from typing import Iterator, Tuple, Union
+from zoneinfo import ZoneInfo
+import numpy as np
+import ephem
+
+from .constants import SNAPSHOT_BODIES
+from .day_snapshot import DaySnapshot
+from .process_date import process_date
+from .process_time import process_time
+from .status_on_date import status_on_date
+from .observer_session import ObserverSession, resolve_session
+from .ephemeris_backend import resolve_ephemeris_backend
+
+def status_over_range(
+        start: Union[ephem.Date, datetime, date, str] = None,
+        end: Union[ephem.Date, datetime, date, str] = None,
+        timezone: Union[ZoneInfo, str] = None,
+        lat: float = None,
+        lon: float = None,
+        session: ObserverSession = None) -> Iterator[Tuple[date, str]]:
+    """
+    Generate the status report of each date in a range, one date at a time.
+
+    The longitudes of the bodies at each local midnight are computed once and kept in a
+    ring buffer of three days, serving as the next date of one report, the date of the
+    following report, and the previous date of the one after. Memory does not grow with
+    the length of the range.
+
+    Parameters:
+    start (Union[ephem.Date, datetime, date, str], optional): The first date. Defaults to today.
+    end (Union[ephem.Date, datetime, date, str], optional): The last date, included. If None, the generator does not end.
+    timezone (Union[ZoneInfo, str], optional): The timezone of the dates. Defaults to None.
+    lat (float, optional): The latitude for the location. Defaults to None.
+    lon (float, optional): The longitude for the location. Defaults to None.
+    session (ObserverSession, optional): The observer session to take the timezone, latitude and longitude from. Defaults to None.
+
+    Yields:
+    Tuple[date, str]: Each date and its status report, as returned by status_on_date.
+    """
+    # Take the timezone and coordinates from the session, if one is given
+    timezone, lat, lon = resolve_session(session, timezone, lat, lon)
+
+    # Process the dates, and find the timezone of their midnights
+    start, timezone = process_date(start, timezone, lat, lon)
+    _, timezone = process_time(start, timezone, lat, lon)
+
+    if end is not None:
+        end, _ = process_date(end, timezone, lat, lon)
+
+    bodies = tuple(body.lower() for body in SNAPSHOT_BODIES)
+    backend = resolve_ephemeris_backend()
+
+    def midnight_longitudes(d: date) -> np.ndarray:
+        midnight = datetime.combine(d, time.min, tzinfo=timezone)
+
+        return backend.sign_longitudes(list(bodies), [midnight])[0]
+
+    # Fill the ring buffer with the midnights before and of the first date
+    window = deque(maxlen=3)
+    window.append(midnight_longitudes(start - timedelta(days=1)))
+    window.append(midnight_longitudes(start))
+
+    d = start
+
+    while end is None or d <= end:
+        # Compute the next midnight, dropping the oldest one from the buffer
+        window.append(midnight_longitudes(d + timedelta(days=1)))
+
+        snapshot = DaySnapshot(d, timezone, bodies, np.stack(window))
+
+        yield d, status_on_date(d, timezone, lat, lon, session=session, snapshot=snapshot)
+
+        d += timedelta(days=1)
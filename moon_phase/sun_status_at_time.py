@@ -6,15 +6,22 @@ import ephem
 from .determine_sun_sign import determine_sun_sign
 from .generate_zodiac_emoji import generate_zodiac_emoji
 from .process_time import process_time
+from .observer_session import ObserverSession, resolve_session
+from .instrumentation import timed
 
+@timed()
 def sun_status_at_time(
         dt: Union[ephem.Date, datetime, time, str] = None,
         timezone: Union[ZoneInfo, str] = None,
         lat: float = None,
-        lon: float = None) -> str:
+        lon: float = None,
+        session: ObserverSession = None) -> str:
+    # Take the timezone and coordinates from the session, if one is given
+    timezone, lat, lon = resolve_session(session, timezone, lat, lon)
+
     dt, timezone = process_time(dt, timezone, lat, lon)
 
-    sign = determine_sun_sign(dt, lat=lat, lon=lon)
+    sign = determine_sun_sign(dt, timezone=timezone, lat=lat, lon=lon, session=session)
     emoji = generate_zodiac_emoji(sign)
 
     return f"🌞{emoji} Sun in {sign}"
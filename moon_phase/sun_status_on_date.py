@@ -1,30 +1,33 @@
 from typing import Union
-from datetime import datetime, timedelta, time
+from datetime import datetime, time
 from zoneinfo import ZoneInfo
 import ephem
 
-from .determine_sun_sign import determine_sun_sign
+from .day_snapshot import DaySnapshot, take_day_snapshot
 from .generate_zodiac_emoji import generate_zodiac_emoji
 from .process_date import process_date
+from .observer_session import ObserverSession, resolve_session
+from .instrumentation import timed
 
+@timed()
 def sun_status_on_date(
         d: Union[ephem.Date, datetime, time, str] = None,
         timezone: Union[ZoneInfo, str] = None,
         lat: float = None,
-        lon: float = None) -> str:
-    d, timezone = process_date(d, timezone, lat, lon)
+        lon: float = None,
+        session: ObserverSession = None,
+        snapshot: DaySnapshot = None) -> str:
+    # Take the timezone and coordinates from the session, if one is given
+    timezone, lat, lon = resolve_session(session, timezone, lat, lon)
 
-    sign = determine_sun_sign(d, lat=lat, lon=lon)
-    emoji = generate_zodiac_emoji(sign)
+    d, timezone = process_date(d, timezone, lat, lon)
 
-    yesterday_sign = determine_sun_sign(d - timedelta(days=1), lat=lat, lon=lon)
-    tomorrow_sign = determine_sun_sign(d + timedelta(days=1), lat=lat, lon=lon)
+    # Read the sun's sign and movement from the snapshot of the day
+    if snapshot is None:
+        snapshot = take_day_snapshot(d, timezone, lat, lon)
 
-    if yesterday_sign != sign:
-        movement_string = "enters"
-    elif tomorrow_sign != sign:
-        movement_string = "leaves"
-    else:
-        movement_string = "in"
+    sign = snapshot.sign("Sun")
+    emoji = generate_zodiac_emoji(sign)
+    movement_string = snapshot.movement("Sun")
 
     return f"🌞{emoji} Sun {movement_string} {sign}"
@@ -0,0 +1,321 @@
+from typing import TYPE_CHECKING, Sequence, Tuple, Union
+from datetime import datetime, date, time, timezone
+import numpy as np
+import ephem
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# ephem.Date values count days from 1899-12-31 12:00 UTC (Dublin Julian Date)
+EPHEM_EPOCH = np.datetime64("1899-12-31T12:00:00", "us")
+DUBLIN_JULIAN_DATE_OFFSET = 2415020.0
+UNIX_EPOCH_EPHEM_DATE = 25567.5
+J2000_JULIAN_DATE = 2451545.0
+DAYS_PER_JULIAN_CENTURY = 36525.0
+MICROSECONDS_PER_DAY = 86400 * 10 ** 6
+SECONDS_PER_DAY = 86400.0
+
+# Observed Delta T (TT - UT) in seconds at the start of each listed year
+DELTA_T_YEARS = np.array([
+    1700, 1750, 1800, 1810, 1820, 1830, 1840, 1850, 1860, 1870, 1880, 1890,
+    1900, 1910, 1920, 1930, 1940, 1950, 1960, 1970, 1980, 1990, 2000, 2010, 2020, 2025
+], dtype=np.float64)
+
+DELTA_T_SECONDS = np.array([
+    9.0, 13.0, 13.7, 12.5, 11.9, 7.1, 5.4, 6.8, 7.7, 1.6, -5.4, -5.9,
+    -2.7, 10.5, 21.2, 24.0, 24.3, 29.1, 33.2, 40.2, 50.5, 56.9, 63.8, 66.1, 69.4, 69.2
+], dtype=np.float64)
+
+# Periodic terms of the IAU 1980 nutation series with amplitudes above 0.0010 arcseconds (Meeus, table 22.A)
+# Columns: multiples of D, M, M', F, Omega; longitude sine coefficient and its rate; obliquity cosine coefficient and its rate.
+# Coefficients are in units of 0.0001 arcseconds (per Julian century for the rates).
+NUTATION_TERMS = np.array([
+    [0, 0, 0, 0, 1, -171996, -174.2, 92025, 8.9],
+    [-2, 0, 0, 2, 2, -13187, -1.6, 5736, -3.1],
+    [0, 0, 0, 2, 2, -2274, -0.2, 977, -0.5],
+    [0, 0, 0, 0, 2, 2062, 0.2, -895, 0.5],
+    [0, 1, 0, 0, 0, 1426, -3.4, 54, -0.1],
+    [0, 0, 1, 0, 0, 712, 0.1, -7, 0],
+    [-2, 1, 0, 2, 2, -517, 1.2, 224, -0.6],
+    [0, 0, 0, 2, 1, -386, -0.4, 200, 0],
+    [0, 0, 1, 2, 2, -301, 0, 129, -0.1],
+    [-2, -1, 0, 2, 2, 217, -0.5, -95, 0.3],
+    [-2, 0, 1, 0, 0, -158, 0, 0, 0],
+    [-2, 0, 0, 2, 1, 129, 0.1, -70, 0],
+    [0, 0, -1, 2, 2, 123, 0, -53, 0],
+    [2, 0, 0, 0, 0, 63, 0, 0, 0],
+    [0, 0, 1, 0, 1, 63, 0.1, -33, 0],
+    [2, 0, -1, 2, 2, -59, 0, 26, 0],
+    [0, 0, -1, 0, 1, -58, -0.1, 32, 0],
+    [0, 0, 1, 2, 1, -51, 0, 27, 0],
+    [-2, 0, 2, 0, 0, 48, 0, 0, 0],
+    [0, 0, -2, 2, 1, 46, 0, -24, 0],
+    [2, 0, 0, 2, 2, -38, 0, 16, 0],
+    [0, 0, 2, 2, 2, -31, 0, 13, 0],
+    [0, 0, 2, 0, 0, 29, 0, 0, 0],
+    [-2, 0, 1, 2, 2, 29, 0, -12, 0],
+    [0, 0, 0, 2, 0, 26, 0, 0, 0],
+    [-2, 0, 0, 2, 0, -22, 0, 0, 0],
+    [0, 0, -1, 2, 1, 21, 0, -10, 0],
+    [0, 2, 0, 0, 0, 17, -0.1, 0, 0],
+    [2, 0, -1, 0, 1, 16, 0, -8, 0],
+    [-2, 2, 0, 2, 2, -16, 0.1, 7, 0],
+    [0, 1, 0, 0, 1, -15, 0, 9, 0],
+    [-2, 0, 1, 0, 1, -13, 0, 7, 0],
+    [0, -1, 0, 0, 1, -12, 0, 6, 0]
+], dtype=np.float64)
+
+TimesLike = Union[np.ndarray, "pd.DatetimeIndex", Sequence[datetime], datetime, date, ephem.Date]
+
+def to_utc_datetime64(times: TimesLike) -> np.ndarray:
+    """
+    Convert instants to a UTC datetime64[us] array.
+
+    Parameters:
+    times (TimesLike): A datetime64 array, a pandas DatetimeIndex, a sequence of datetimes,
+                       or a single datetime, date or ephem.Date.
+                       Timezone-aware values are converted to UTC. Naive values are taken to be UTC.
+
+    Returns:
+    np.ndarray: A one-dimensional datetime64[us] array of UTC instants.
+    """
+    # An ephem.Date is a float counting days from the ephem epoch in UTC
+    if isinstance(times, ephem.Date):
+        times = [times.datetime()]
+
+    # Wrap single dates and datetimes so they can be handled like arrays
+    if isinstance(times, (datetime, date, np.datetime64)):
+        times = [times]
+
+    # datetime64 arrays only need their unit changed
+    if isinstance(times, np.ndarray) and np.issubdtype(times.dtype, np.datetime64):
+        return times.astype("datetime64[us]").ravel()
+
+    # Convert a timezone-aware pandas DatetimeIndex to UTC and drop the timezone
+    if getattr(times, "tz", None) is not None:
+        times = times.tz_convert("UTC").tz_localize(None)
+
+    if isinstance(times, np.ndarray) or hasattr(times, "to_numpy"):
+        values = np.asarray(times)
+
+        if np.issubdtype(values.dtype, np.datetime64):
+            return values.astype("datetime64[us]").ravel()
+
+        times = values.ravel()
+
+    # Convert timezone-aware datetimes to UTC and drop the timezone, and dates to midnight
+    def to_naive_utc(t):
+        if isinstance(t, datetime):
+            if t.tzinfo is not None:
+                t = t.astimezone(timezone.utc).replace(tzinfo=None)
+        elif isinstance(t, date):
+            t = datetime.combine(t, time.min)
+
+        return t
+
+    return np.array([to_naive_utc(t) for t in times], dtype="datetime64[us]")
+
+def ephem_dates_from_times(times: TimesLike) -> np.ndarray:
+    """
+    Convert instants to ephem.Date values (days since 1899-12-31 12:00 UTC).
+
+    Parameters:
+    times (TimesLike): The instants to convert. See to_utc_datetime64.
+                       Numeric arrays are taken to be ephem.Date values already and are returned as float64.
+
+    Returns:
+    np.ndarray: A float64 array of ephem.Date values.
+    """
+    if isinstance(times, np.ndarray) and np.issubdtype(times.dtype, np.number):
+        return times.astype(np.float64)
+
+    # Count in microseconds so that offsets of more than 292 years do not overflow
+    microseconds = (to_utc_datetime64(times) - EPHEM_EPOCH).astype(np.int64)
+
+    return microseconds / MICROSECONDS_PER_DAY
+
+def unix_seconds_from_ephem_dates(ephem_dates: np.ndarray) -> np.ndarray:
+    """
+    Convert ephem.Date values to seconds since the Unix epoch.
+
+    Parameters:
+    ephem_dates (np.ndarray): ephem.Date values (days since 1899-12-31 12:00 UTC).
+
+    Returns:
+    np.ndarray: A float64 array of seconds since 1970-01-01 00:00 UTC.
+    """
+    return (np.asarray(ephem_dates, dtype=np.float64) - UNIX_EPOCH_EPHEM_DATE) * SECONDS_PER_DAY
+
+def ephem_dates_from_unix_seconds(seconds: np.ndarray) -> np.ndarray:
+    """
+    Convert seconds since the Unix epoch to ephem.Date values.
+
+    Parameters:
+    seconds (np.ndarray): Seconds since 1970-01-01 00:00 UTC.
+
+    Returns:
+    np.ndarray: A float64 array of ephem.Date values (days since 1899-12-31 12:00 UTC).
+    """
+    return np.asarray(seconds, dtype=np.float64) / SECONDS_PER_DAY + UNIX_EPOCH_EPHEM_DATE
+
+def utc_years_from_ephem_dates(ephem_dates: np.ndarray) -> np.ndarray:
+    """
+    Find the UTC calendar year of each ephem.Date value.
+
+    Parameters:
+    ephem_dates (np.ndarray): ephem.Date values (days since 1899-12-31 12:00 UTC).
+
+    Returns:
+    np.ndarray: An int64 array of years.
+    """
+    microseconds = np.round(np.asarray(ephem_dates, dtype=np.float64) * MICROSECONDS_PER_DAY).astype(np.int64)
+    times = EPHEM_EPOCH + microseconds.astype("timedelta64[us]")
+
+    return times.astype("datetime64[Y]").astype(np.int64) + 1970
+
+def julian_dates(times: TimesLike) -> np.ndarray:
+    """
+    Calculate the Julian Date (UT) of each instant.
+
+    Parameters:
+    times (TimesLike): The instants to convert. See ephem_dates_from_times.
+
+    Returns:
+    np.ndarray: A float64 array of Julian Dates.
+    """
+    return ephem_dates_from_times(times) + DUBLIN_JULIAN_DATE_OFFSET
+
+def delta_t(jd: np.ndarray) -> np.ndarray:
+    """
+    Estimate Delta T (TT - UT) in seconds for an array of Julian Dates.
+
+    Observed values are interpolated between 1700 and 2025.
+    Later dates use the Espenak-Meeus polynomials, shifted to join the last observed value,
+    and earlier dates use the Morrison-Stephenson parabola.
+
+    Parameters:
+    jd (np.ndarray): Julian Dates (UT).
+
+    Returns:
+    np.ndarray: Delta T in seconds.
+    """
+    jd = np.asarray(jd, dtype=np.float64)
+    year = 2000.0 + (jd - J2000_JULIAN_DATE) / 365.25
+
+    # Long-term parabola of Morrison and Stephenson
+    u = (year - 1820.0) / 100.0
+    long_term = -20.0 + 32.0 * u ** 2
+
+    # Espenak-Meeus extrapolation for 2025-2050
+    def espenak_meeus(year):
+        t = year - 2000.0
+        return 62.92 + 0.32217 * t + 0.005589 * t ** 2
+
+    # Shift it to continue from the last observed value, tapering the shift out by 2050 where it meets the next polynomial
+    last_year = DELTA_T_YEARS[-1]
+    offset = DELTA_T_SECONDS[-1] - espenak_meeus(last_year)
+    near_future = espenak_meeus(year) + offset * np.clip((2050.0 - year) / (2050.0 - last_year), 0.0, 1.0)
+
+    # Espenak-Meeus extrapolation for 2050-2150, joining the long-term parabola
+    far_future = long_term - 0.5628 * (2150.0 - year)
+
+    observed = np.interp(year, DELTA_T_YEARS, DELTA_T_SECONDS)
+
+    return np.select(
+        [year < DELTA_T_YEARS[0], year <= DELTA_T_YEARS[-1], year <= 2050.0, year <= 2150.0],
+        [long_term, observed, near_future, far_future],
+        default=long_term
+    )
+
+def terrestrial_julian_dates(times: TimesLike) -> np.ndarray:
+    """
+    Calculate the Julian Ephemeris Date (TT) of each instant.
+
+    Parameters:
+    times (TimesLike): The instants to convert. See ephem_dates_from_times.
+
+    Returns:
+    np.ndarray: A float64 array of Julian Ephemeris Dates.
+    """
+    jd = julian_dates(times)
+
+    return jd + delta_t(jd) / SECONDS_PER_DAY
+
+def julian_centuries(times: TimesLike, terrestrial: bool = True) -> np.ndarray:
+    """
+    Calculate Julian centuries since J2000.0 for each instant.
+
+    Parameters:
+    times (TimesLike): The instants to convert. See ephem_dates_from_times.
+    terrestrial (bool, optional): Count from the Terrestrial Time (TT) Julian Date instead of UT. Defaults to True.
+
+    Returns:
+    np.ndarray: A float64 array of Julian centuries.
+    """
+    jd = terrestrial_julian_dates(times) if terrestrial else julian_dates(times)
+
+    return (jd - J2000_JULIAN_DATE) / DAYS_PER_JULIAN_CENTURY
+
+def mean_obliquity(T: np.ndarray) -> np.ndarray:
+    """
+    Calculate the mean obliquity of the ecliptic (IAU 2006).
+
+    Parameters:
+    T (np.ndarray): Julian centuries (TT) since J2000.0.
+
+    Returns:
+    np.ndarray: The mean obliquity of the ecliptic in degrees.
+    """
+    T = np.asarray(T, dtype=np.float64)
+
+    # Mean obliquity of the ecliptic in arcseconds
+    epsilon = 84381.406 - (46.836769 * T) - (0.0001831 * T**2) + (0.000000093 * T**3) - (0.0000000002 * T**4)
+
+    return epsilon / 3600.0
+
+def nutation(T: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the nutation in longitude and in obliquity from the IAU 1980 series.
+
+    Terms smaller than 0.0010 arcseconds are omitted, which keeps the error below 0.01 arcseconds.
+
+    Parameters:
+    T (np.ndarray): Julian centuries (TT) since J2000.0.
+
+    Returns:
+    Tuple[np.ndarray, np.ndarray]: The nutation in longitude and the nutation in obliquity in degrees.
+    """
+    T = np.asarray(T, dtype=np.float64)
+
+    # Fundamental arguments in degrees
+    D = 297.85036 + 445267.111480 * T - 0.0019142 * T**2 + T**3 / 189474.0
+    M = 357.52772 + 35999.050340 * T - 0.0001603 * T**2 - T**3 / 300000.0
+    M_prime = 134.96298 + 477198.867398 * T + 0.0086972 * T**2 + T**3 / 56250.0
+    F = 93.27191 + 483202.017538 * T - 0.0036825 * T**2 + T**3 / 327270.0
+    Omega = 125.04452 - 1934.136261 * T + 0.0020708 * T**2 + T**3 / 450000.0
+
+    fundamental = np.radians(np.stack([D, M, M_prime, F, Omega], axis=-1) % 360.0)
+
+    # One argument per term and instant
+    arguments = fundamental @ NUTATION_TERMS[:, :5].T
+    T_column = T[..., np.newaxis]
+
+    delta_psi = np.sum((NUTATION_TERMS[:, 5] + NUTATION_TERMS[:, 6] * T_column) * np.sin(arguments), axis=-1)
+    delta_epsilon = np.sum((NUTATION_TERMS[:, 7] + NUTATION_TERMS[:, 8] * T_column) * np.cos(arguments), axis=-1)
+
+    # Convert from 0.0001 arcseconds to degrees
+    return delta_psi / 3600.0e4, delta_epsilon / 3600.0e4
+
+def true_obliquity(T: np.ndarray) -> np.ndarray:
+    """
+    Calculate the true obliquity of the ecliptic (mean obliquity + nutation in obliquity).
+
+    Parameters:
+    T (np.ndarray): Julian centuries (TT) since J2000.0.
+
+    Returns:
+    np.ndarray: The true obliquity of the ecliptic in degrees.
+    """
+    _, delta_epsilon = nutation(T)
+
+    return mean_obliquity(T) + delta_epsilon
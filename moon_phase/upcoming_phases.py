@@ -1,18 +1,22 @@
-from datetime import datetime, timezone, date
+from datetime import datetime, date
 from zoneinfo import ZoneInfo
-from typing import Optional, Union
+from typing import Union
 import ephem
 
-import ephem
-import pandas as pd
-
 from .process_time import process_time
+from .lunation_catalog import get_lunation_catalog
+from .format_phase_table import format_phase_table
+from .observer_session import ObserverSession, resolve_session
+from .instrumentation import count, timed
 
+@timed()
 def upcoming_phases(
         dt: Union[ephem.Date, datetime, date, str] = None,
         timezone: Union[ZoneInfo, str] = None,
         lat: float = None,
-        lon: float = None) -> pd.DataFrame:
+        lon: float = None,
+        output: str = "dataframe",
+        session: ObserverSession = None):
     """
     Calculates the dates of the next new, first quarter,
     full, and last quarter moon relative to a given datetime.
@@ -25,16 +29,33 @@ def upcoming_phases(
             it uses the timezone of the input datetime.
         lat: The latitude for the observer's location. Optional.
         lon: The longitude for the observer's location. Optional.
+        output: "dataframe" (default) for a pandas DataFrame, "tuples" for a list of
+            (lunation, datetime) tuples, or "array" for a structured NumPy array.
+        session: The observer session to take the timezone, latitude and longitude from. Optional.
 
     Returns:
-        A pandas DataFrame with the lunation dates in a 'datetime' column and
-        the corresponding lunation names in a 'lunation' column, sorted
-        by datetime.
+        The lunation names and dates sorted by datetime. As a DataFrame, the
+        dates are in a 'datetime' column and the names in a 'lunation' column.
     """
+    # Take the timezone and coordinates from the session, if one is given
+    timezone, lat, lon = resolve_session(session, timezone, lat, lon)
 
     dt, timezone = process_time(dt, timezone, lat, lon)
 
+    # Look the next four phases up in the lunation catalog if it covers the given time
+    catalog = get_lunation_catalog()
+    catalog_phases = None if catalog is None else catalog.next_phases(dt.timestamp(), count=4)
+
+    if catalog_phases is not None:
+        phases = [
+            (f"Next {phase_name}", datetime.fromtimestamp(unix_seconds, timezone))
+            for phase_name, unix_seconds in catalog_phases
+        ]
+
+        return format_phase_table(phases, output)
+
     dt = ephem.Date(dt)
+    count("ephem.search", 4)
 
     data = {
         'Next New': ephem.next_new_moon(dt),
@@ -44,12 +65,12 @@ def upcoming_phases(
     }
 
     # Convert ephem.Date objects to Python datetime objects with the specified timezone
-    for key, value in data.items():
-        dt_with_tz = value.datetime().replace(tzinfo=ZoneInfo("UTC")).astimezone(timezone)
-        data[key] = dt_with_tz
+    phases = [
+        (key, value.datetime().replace(tzinfo=ZoneInfo("UTC")).astimezone(timezone))
+        for key, value in data.items()
+    ]
 
-    df = pd.DataFrame({'lunation': data.keys(), 'datetime': data.values()})
+    # Sort the lunations by datetime
+    phases.sort(key=lambda phase: phase[1])
 
-    # Sort the DataFrame by datetime
-    df.sort_values('datetime', inplace=True)
-    return df
+    return format_phase_table(phases, output)
@@ -0,0 +1,169 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import List, Optional
+from zoneinfo import ZoneInfo
+import ephem
+
+from .instrumentation import count
+
+# Basic moon names (without "Moon") by month of the full moon in the Northern Hemisphere
+MOON_NAMES = {
+    1: "Wolf",
+    2: "Snow",
+    3: "Worm",
+    4: "Pink",
+    5: "Flower",
+    6: "Strawberry",
+    7: "Buck",
+    8: "Sturgeon",
+    9: "Harvest",
+    10: "Hunter's",
+    11: "Beaver",
+    12: "Cold"
+}
+
+# Extra days of full moons kept on either side of the seasons so neighbouring lookups stay inside the almanac
+FULL_MOON_MARGIN = timedelta(days=40)
+
+def ephem_to_utc(d: ephem.Date) -> datetime:
+    """
+    Convert an ephem.Date to a timezone-aware UTC datetime.
+    """
+    return d.datetime().replace(tzinfo=ZoneInfo("UTC"))
+
+class YearAlmanac:
+    """
+    The cardinal points, full moons and full moon names of one year, computed once.
+
+    Full moons are named by their month in the caller's timezone. The Harvest Moon is the full moon closest to the
+    autumn equinox (September in the Northern Hemisphere, March in the Southern Hemisphere) and
+    the Hunter's Moon follows it. The third full moon of an astronomical season with four full
+    moons is a Blue Moon. In the Southern Hemisphere the monthly names are shifted by six months.
+    """
+    def __init__(self, year: int, hemisphere: str = "northern"):
+        if hemisphere not in ("northern", "southern"):
+            raise ValueError(f"Unknown hemisphere: {hemisphere}")
+
+        self.year = year
+        self.hemisphere = hemisphere
+
+        # Cardinal points of the year
+        count("ephem.search", 6)
+        self.march_equinox = ephem_to_utc(ephem.next_equinox(ephem.Date(datetime(year, 3, 1))))
+        self.june_solstice = ephem_to_utc(ephem.next_solstice(ephem.Date(datetime(year, 6, 1))))
+        self.september_equinox = ephem_to_utc(ephem.next_equinox(ephem.Date(datetime(year, 9, 1))))
+        self.december_solstice = ephem_to_utc(ephem.next_solstice(ephem.Date(datetime(year, 12, 1))))
+
+        # Seasons overlapping the year, from the previous December solstice to the next March equinox
+        previous_december_solstice = ephem_to_utc(ephem.next_solstice(ephem.Date(datetime(year - 1, 12, 1))))
+        next_march_equinox = ephem_to_utc(ephem.next_equinox(ephem.Date(datetime(year + 1, 3, 1))))
+
+        cardinal_points = [
+            previous_december_solstice,
+            self.march_equinox,
+            self.june_solstice,
+            self.september_equinox,
+            self.december_solstice,
+            next_march_equinox
+        ]
+
+        # Every full moon across the seasons and the margin around them
+        self.full_moons: List[datetime] = []
+        end = ephem.Date(next_march_equinox + FULL_MOON_MARGIN)
+        t = ephem.next_full_moon(ephem.Date(previous_december_solstice - FULL_MOON_MARGIN))
+
+        while t < end:
+            self.full_moons.append(ephem_to_utc(t))
+            t = ephem.next_full_moon(t)
+
+        count("ephem.search", len(self.full_moons) + 1)
+
+        # --- 1. Harvest and Hunter's Moon ---
+
+        autumn_equinox = self.september_equinox if hemisphere == "northern" else self.march_equinox
+        self.harvest_moon = min(self.full_moons, key=lambda full_moon: abs(full_moon - autumn_equinox))
+
+        # --- 2. Blue Moon ---
+
+        # If a season has four full moons, the third is a Blue Moon
+        self.blue_moons: List[datetime] = []
+
+        for start, end in zip(cardinal_points[:-1], cardinal_points[1:]):
+            season_full_moons = [full_moon for full_moon in self.full_moons if start <= full_moon < end]
+
+            if len(season_full_moons) == 4:
+                self.blue_moons.append(season_full_moons[2])
+
+    def name_month(self, month: int) -> int:
+        """
+        Map a calendar month to the month whose Northern Hemisphere moon name applies in this hemisphere.
+        """
+        if self.hemisphere == "southern":
+            return (month + 5) % 12 + 1
+
+        return month
+
+    def next_full_moon(self, dt: datetime) -> Optional[datetime]:
+        """
+        Find the first full moon after a timezone-aware datetime, or None if it is outside the almanac.
+        """
+        i = bisect_right(self.full_moons, dt)
+
+        if i == 0 or i == len(self.full_moons):
+            return None
+
+        return self.full_moons[i]
+
+    def previous_full_moon(self, dt: datetime) -> Optional[datetime]:
+        """
+        Find the last full moon before a timezone-aware datetime, or None if it is outside the almanac.
+        """
+        i = bisect_left(self.full_moons, dt)
+
+        if i == 0 or i == len(self.full_moons):
+            return None
+
+        return self.full_moons[i - 1]
+
+    def moon_name(self, full_moon: datetime, timezone: ZoneInfo = None) -> str:
+        """
+        Name a full moon of this year (without "Moon").
+
+        Parameters:
+        full_moon (datetime): The timezone-aware datetime of the full moon.
+        timezone (ZoneInfo, optional): The timezone whose calendar months name the full moons. Defaults to UTC.
+
+        Returns:
+        str: The moon name.
+        """
+        if timezone is None:
+            timezone = ZoneInfo("UTC")
+
+        if any(abs(full_moon - blue_moon) < timedelta(days=1) for blue_moon in self.blue_moons):
+            return "Blue"
+
+        moon_names = dict(MOON_NAMES)
+
+        if self.name_month(self.harvest_moon.astimezone(timezone).month) == 9:
+            moon_names[9] = "Harvest"
+            moon_names[10] = "Hunter's"
+        else:
+            moon_names[10] = "Harvest"
+            moon_names[11] = "Hunter's"
+
+        return moon_names[self.name_month(full_moon.astimezone(timezone).month)]
+
+@lru_cache(maxsize=128)
+def get_year_almanac(year: int, hemisphere: str = "northern") -> YearAlmanac:
+    """
+    Get the almanac of a year, computing it once and keeping the most recently used years.
+
+    Parameters:
+    year (int): The year.
+    hemisphere (str, optional): "northern" or "southern". Defaults to "northern".
+
+    Returns:
+    YearAlmanac: The almanac of the year.
+    """
+    return YearAlmanac(year, hemisphere)
@@ -0,0 +1,250 @@
+import argparse
+import hashlib
+import json
+import math
+from datetime import datetime, date, time, timedelta, timezone as dt_timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from moon_phase import ObserverSession, status_on_date, status_at_time, next_sign, upcoming_phases, generate_moon_name
+from moon_phase import locate_device, set_device_location
+from moon_phase.process_date import process_date
+from moon_phase.process_time import process_time
+from moon_phase.observer_session import SessionCache
+
+# Number of responses and observer sessions kept in memory
+RESPONSE_CACHE_SIZE = 4096
+SESSION_CACHE_SIZE = 1024
+
+# Coordinates are rounded to this many decimal places (about 1 km) to share sessions and cached responses
+COORDINATE_DECIMALS = 2
+
+# Times are rounded down to this step to share cached responses
+TIME_QUANTUM = timedelta(minutes=1)
+
+# Cache lifetime of responses for explicit dates, which only change if the service is upgraded
+FIXED_DATE_MAX_AGE = 86400
+
+sessions = SessionCache(SESSION_CACHE_SIZE)
+responses = SessionCache(RESPONSE_CACHE_SIZE)
+
+def get_session(query: dict) -> ObserverSession:
+    """
+    Get the observer session of the rounded coordinates and timezone of a query, resolving them once.
+    """
+    lat = query.get("lat")
+    lon = query.get("lon")
+
+    if lat is None or lon is None:
+        lat, lon = locate_device()
+
+    lat = float(lat)
+    lon = float(lon)
+
+    # Reject coordinates that cannot locate an observer, before they reach the timezone grid
+    if not (math.isfinite(lat) and -90 <= lat <= 90):
+        raise ValueError(f"latitude must be between -90 and 90: {lat}")
+
+    if not (math.isfinite(lon) and -180 <= lon <= 180):
+        raise ValueError(f"longitude must be between -180 and 180: {lon}")
+
+    lat = round(lat, COORDINATE_DECIMALS)
+    lon = round(lon, COORDINATE_DECIMALS)
+    timezone = query.get("timezone")
+    key = (lat, lon, timezone)
+
+    session = sessions.get(key)
+
+    if session is None:
+        session = ObserverSession(lat, lon, timezone)
+        sessions[key] = session
+
+    return session
+
+def next_midnight(session: ObserverSession, d: date) -> datetime:
+    return datetime.combine(d + timedelta(days=1), time.min, tzinfo=session.timezone)
+
+def resolve_date(query: dict, session: ObserverSession):
+    """
+    Find the date of a query and when the answer for it expires: the next local midnight if the date was omitted.
+    """
+    if "date" in query:
+        d, _ = process_date(query["date"], session=session)
+        return d, None
+
+    d = datetime.now(session.timezone).date()
+
+    return d, next_midnight(session, d)
+
+def resolve_time(query: dict, session: ObserverSession):
+    """
+    Find the time of a query, rounded down to TIME_QUANTUM, and when the answer for it expires: the next step if the time was omitted.
+    """
+    dt, _ = process_time(query.get("time", datetime.now(session.timezone)), session=session)
+    dt = dt.astimezone(dt_timezone.utc)
+    dt -= (dt - datetime.min.replace(tzinfo=dt_timezone.utc)) % TIME_QUANTUM
+    dt = dt.astimezone(session.timezone)
+
+    if "time" in query:
+        return dt, None
+
+    return dt, dt + TIME_QUANTUM
+
+def handle_status_on_date(query: dict, session: ObserverSession):
+    d, expires = resolve_date(query, session)
+
+    def compute():
+        return {"date": d.isoformat(), "status": status_on_date(d, session=session)}, expires
+
+    return ("status_on_date", d, expires is None), compute
+
+def handle_status_at_time(query: dict, session: ObserverSession):
+    dt, expires = resolve_time(query, session)
+
+    def compute():
+        return {"time": dt.isoformat(), "status": status_at_time(dt, session=session)}, expires
+
+    return ("status_at_time", dt.timestamp(), expires is None), compute
+
+def handle_next_sign(query: dict, session: ObserverSession):
+    body = query.get("body", "Moon")
+    d, expires = resolve_date(query, session)
+
+    def compute():
+        sign_date, sign = next_sign(body, d, session=session)
+        return {"body": body, "date": sign_date.isoformat(), "sign": sign}, expires
+
+    return ("next_sign", body.lower(), d, expires is None), compute
+
+def handle_upcoming_phases(query: dict, session: ObserverSession):
+    if "time" in query:
+        dt, _ = resolve_time(query, session)
+    else:
+        dt = None
+
+    def compute():
+        phases = upcoming_phases(dt or datetime.now(session.timezone), session=session, output="tuples")
+        payload = {"phases": [{"lunation": name, "datetime": t.isoformat()} for name, t in phases]}
+
+        # Without a given time the list stays current until the first of the phases passes
+        if dt is None:
+            return payload, min(t for _, t in phases)
+
+        return dict(time=dt.isoformat(), **payload), None
+
+    return ("upcoming_phases", dt.timestamp() if dt else None), compute
+
+def handle_moon_name(query: dict, session: ObserverSession):
+    d, expires = resolve_date(query, session)
+
+    def compute():
+        return {"date": d.isoformat(), "moon_name": generate_moon_name(d, session=session)}, expires
+
+    return ("moon_name", d, expires is None), compute
+
+ENDPOINTS = {
+    "/status_on_date": handle_status_on_date,
+    "/status_at_time": handle_status_at_time,
+    "/next_sign": handle_next_sign,
+    "/upcoming_phases": handle_upcoming_phases,
+    "/moon_name": handle_moon_name
+}
+
+class MoonPhaseRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        url = urlparse(self.path)
+        handler = ENDPOINTS.get(url.path)
+
+        if handler is None:
+            self.send_json(404, {"error": f"unknown endpoint: {url.path}", "endpoints": sorted(ENDPOINTS)})
+            return
+
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+
+        try:
+            session = get_session(query)
+            key, compute = handler(query, session)
+            # Handlers key implicit and explicit dates apart, since only implicit ones expire
+            key = key + (session.lat, session.lon, session.timezone.key)
+
+            # Serve a cached response while it is still current
+            cached = responses.get(key)
+            now = datetime.now(dt_timezone.utc)
+
+            if cached is None or (cached[2] is not None and cached[2] <= now):
+                payload, expires = compute()
+                body = json.dumps(payload).encode("utf-8")
+                etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+                cached = (body, etag, expires)
+                responses[key] = cached
+        except (ValueError, KeyError, RuntimeError) as error:
+            self.send_json(400, {"error": str(error)})
+            return
+        except Exception as error:
+            # Answer anything unexpected with a JSON error instead of dropping the connection
+            self.log_error("unexpected error: %r", error)
+            self.send_json(500, {"error": "internal error"})
+            return
+
+        body, etag, expires = cached
+
+        if expires is None:
+            max_age = FIXED_DATE_MAX_AGE
+        else:
+            max_age = max(0, int((expires - now).total_seconds()))
+
+        headers = {
+            "ETag": etag,
+            "Cache-Control": f"public, max-age={max_age}"
+        }
+
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+
+            for name, value in headers.items():
+                self.send_header(name, value)
+
+            self.end_headers()
+            return
+
+        self.send_json(200, body, headers)
+
+    def send_json(self, code: int, payload, headers: dict = None):
+        body = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+
+        self.end_headers()
+        self.wfile.write(body)
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve moon phase and status queries as JSON over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1", help="the address to listen on")
+    parser.add_argument("--port", type=int, default=8000, help="the port to listen on")
+    parser.add_argument("--lat", type=float, help="the latitude used when a query gives none")
+    parser.add_argument("--lon", type=float, help="the longitude used when a query gives none")
+    args = parser.parse_args()
+
+    if args.lat is not None and args.lon is not None:
+        set_device_location(args.lat, args.lon)
+
+    # Warm the ephemeris, timezone and almanac caches before the first request
+    status_on_date(session=get_session({}))
+
+    server = ThreadingHTTPServer((args.host, args.port), MoonPhaseRequestHandler)
+    print(f"Serving on http://{args.host}:{args.port}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
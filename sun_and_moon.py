@@ -1,20 +1,20 @@
 import sys
 from datetime import datetime, date
 
-from timezonefinder import TimezoneFinder
-import pytz
-import geocoder
-
 from moon_phase.parse_timestamp import parse_timestamp
+from moon_phase.find_timezone import find_timezone
 from moon_phase import locate_device
 from moon_phase import status_at_time
 from moon_phase import status_on_date
+from moon_phase import enable_instrumentation, get_stats, format_stats
 
 def main():
-    if len(sys.argv) > 1:
-        timestamp = sys.argv[1]
-    else:
-        timestamp = None
+    # Report the calls, timings and cache use behind the status with --profile
+    profile = "--profile" in sys.argv
+
+    if profile:
+        sys.argv.remove("--profile")
+        enable_instrumentation()
 
     if len(sys.argv) > 3:
         try:
@@ -26,7 +26,13 @@ def main():
     else:
         lat, lon = locate_device()
 
-    dt, timezone = parse_timestamp(timestamp)
+    # Take the current time on the location's clock, not the system's
+    if len(sys.argv) > 1:
+        timestamp = sys.argv[1]
+    else:
+        timestamp = datetime.now(find_timezone(lat, lon)).isoformat()
+
+    dt, timezone = parse_timestamp(timestamp, lat=lat, lon=lon)
 
     if isinstance(dt, datetime):
         print(f"Processing at time: {dt}")
@@ -51,5 +57,9 @@ def main():
     
     print(status)
 
+    if profile:
+        print()
+        print(format_stats(get_stats()))
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,14 @@
+import pytest
+
+from moon_phase import set_device_location, set_offline_mode
+
+@pytest.fixture(autouse=True, scope="session")
+def offline_device():
+    # Keep the tests off the network: never geolocate, and place the device in New York
+    set_offline_mode(True)
+    set_device_location(40.71, -74.01)
+
+    yield
+
+    set_device_location(None, None)
+    set_offline_mode(None)
@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta, timezone
+
+import ephem
+import numpy as np
+import pytest
+
+from moon_phase import determine_sign, is_retrograde
+from moon_phase.analytic_ephemeris import (
+    ANALYTIC_FIRST_YEAR,
+    ANALYTIC_LAST_YEAR,
+    ANALYTIC_MAX_ERROR_DEGREES,
+    ANALYTIC_MAX_DAILY_MOTION_ERROR_DEGREES,
+    ANALYTIC_PLANETS
+)
+from moon_phase.constants import RETROGRADE_BODIES
+from moon_phase.create_ephem_body import create_ephem_body
+from moon_phase.ephemeris_backend import EPHEMERIS_BACKENDS
+from moon_phase.find_next_ingress import next_ingress_ephem_date
+from moon_phase.find_stations import find_station_ephem_dates
+
+BODIES = list(ANALYTIC_MAX_ERROR_DEGREES)
+
+# Offsets from an ingress or station at which the approximate backend is most likely to disagree
+OFFSETS = [timedelta(minutes=minutes) for minutes in (-360, -60, -10, -1, 1, 10, 60, 360)]
+
+@pytest.fixture(scope="module")
+def sample_ephem_dates():
+    first, last = ephem.Date(datetime(ANALYTIC_FIRST_YEAR, 1, 1)), ephem.Date(datetime(ANALYTIC_LAST_YEAR, 1, 1))
+
+    return np.random.default_rng(2024).uniform(first + 1, last - 1, 2000)
+
+def utc(ephem_date: float) -> datetime:
+    return ephem.Date(ephem_date).datetime().replace(tzinfo=timezone.utc)
+
+def test_longitudes_within_error_bounds(sample_ephem_dates):
+    analytic = EPHEMERIS_BACKENDS["analytic"].longitudes(BODIES, sample_ephem_dates)
+    reference = EPHEMERIS_BACKENDS["ephem"].longitudes(BODIES, sample_ephem_dates)
+    errors = np.abs((analytic - reference + 180) % 360 - 180).max(axis=0)
+
+    for body, error in zip(BODIES, errors):
+        assert error <= ANALYTIC_MAX_ERROR_DEGREES[body], body
+
+def test_daily_motions_within_error_bound(sample_ephem_dates):
+    analytic = EPHEMERIS_BACKENDS["analytic"].speeds(BODIES, sample_ephem_dates)
+    reference = EPHEMERIS_BACKENDS["ephem"].speeds(BODIES, sample_ephem_dates)
+
+    assert np.abs(analytic - reference).max() <= ANALYTIC_MAX_DAILY_MOTION_ERROR_DEGREES
+
+def test_instants_outside_the_series_use_the_reference():
+    times = [datetime(ANALYTIC_FIRST_YEAR - 50, 6, 1), datetime(ANALYTIC_LAST_YEAR + 50, 6, 1)]
+
+    np.testing.assert_array_equal(
+        EPHEMERIS_BACKENDS["analytic"].longitudes(BODIES, times),
+        EPHEMERIS_BACKENDS["ephem"].longitudes(BODIES, times)
+    )
+
+@pytest.mark.parametrize("body_name", ["sun", "moon"] + list(ANALYTIC_PLANETS))
+def test_signs_match_the_reference_near_ingresses(body_name):
+    body = create_ephem_body(body_name)
+    t = float(ephem.Date(datetime(2024, 1, 1)))
+
+    for _ in range(4):
+        t, _ = next_ingress_ephem_date(body, t)
+
+        for offset in OFFSETS:
+            dt = utc(t) + offset
+            expected = determine_sign(body_name, dt, "UTC", 0, 0, backend="ephem")
+
+            assert determine_sign(body_name, dt, "UTC", 0, 0, backend="analytic") == expected, (body_name, dt)
+
+        t += 1
+
+@pytest.mark.parametrize("body_name", RETROGRADE_BODIES)
+def test_retrograde_matches_the_reference_near_stations(body_name):
+    body = create_ephem_body(body_name)
+    start = float(ephem.Date(datetime(2020, 1, 1)))
+    station_dates, _ = find_station_ephem_dates(body, start, start + 3 * 365)
+
+    assert len(station_dates) > 0
+
+    for t in station_dates:
+        for offset in OFFSETS:
+            dt = utc(t) + offset
+            expected = is_retrograde(body_name, dt, "UTC", 0, 0, backend="ephem")
+
+            assert is_retrograde(body_name, dt, "UTC", 0, 0, backend="analytic") == expected, (body_name, dt)
@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta, timezone
+
+import ephem
+import numpy as np
+import pytest
+
+from moon_phase import is_retrograde
+from moon_phase.constants import CHEBYSHEV_SEGMENT_DAYS, RETROGRADE_BODIES
+from moon_phase.create_ephem_body import create_ephem_body
+from moon_phase.ephemeris_backend import ChebyshevBackend, EPHEMERIS_BACKENDS
+from moon_phase.find_stations import find_station_ephem_dates, longitude_speed_ephem_dates
+
+BODIES = list(CHEBYSHEV_SEGMENT_DAYS)
+
+@pytest.fixture(scope="module")
+def backend():
+    # Keep the fits in memory, so that the tests write no cache files
+    return ChebyshevBackend(cache_directory="")
+
+@pytest.fixture(scope="module")
+def sample_ephem_dates():
+    first, last = ephem.Date(datetime(2019, 1, 1)), ephem.Date(datetime(2022, 1, 1))
+    samples = np.random.default_rng(2024).uniform(first, last, 1500)
+
+    # Saturn's and Mercury's conjunctions with the Sun, where ephem's longitude jumps at the solar limb
+    conjunctions = [ephem.Date("2020/1/13 10:00"), ephem.Date("2020/5/4 21:30")]
+    hours = np.arange(-24, 25) / 24
+
+    return np.concatenate([samples] + [t + hours for t in conjunctions])
+
+def test_longitudes_within_error_bound(backend, sample_ephem_dates):
+    fitted = backend.longitudes(BODIES, sample_ephem_dates)
+    reference = EPHEMERIS_BACKENDS["ephem"].longitudes(BODIES, sample_ephem_dates)
+    errors = np.abs((fitted - reference + 180) % 360 - 180).max(axis=0)
+
+    for body, error in zip(BODIES, errors):
+        assert error <= backend.max_error(body), body
+
+def test_speeds_within_error_bound(backend, sample_ephem_dates):
+    fitted = backend.speeds(BODIES, sample_ephem_dates)
+
+    for j, body in enumerate(BODIES):
+        reference = longitude_speed_ephem_dates(create_ephem_body(body), sample_ephem_dates)
+
+        assert np.abs(fitted[:, j] - reference).max() <= backend.max_daily_motion_error_degrees, body
+
+def test_retrograde_matches_the_reference_near_stations(backend):
+    start = float(ephem.Date(datetime(2020, 1, 1)))
+
+    for body_name in RETROGRADE_BODIES:
+        station_dates, _ = find_station_ephem_dates(create_ephem_body(body_name), start, start + 2 * 365)
+
+        for t in station_dates:
+            for minutes in (-360, -60, -1, 1, 60, 360):
+                dt = ephem.Date(t).datetime().replace(tzinfo=timezone.utc) + timedelta(minutes=minutes)
+                expected = is_retrograde(body_name, dt, "UTC", 0, 0, backend="ephem")
+
+                assert is_retrograde(body_name, dt, "UTC", 0, 0, backend=backend) == expected, (body_name, dt)
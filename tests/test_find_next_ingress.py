@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta, timezone
+
+import ephem
+import pytest
+
+from moon_phase import find_next_ingress, determine_sign
+from moon_phase.create_ephem_body import create_ephem_body
+from moon_phase.find_next_ingress import next_ingress_ephem_date
+
+def ephem_utc(ephem_date) -> datetime:
+    return ephem.Date(ephem_date).datetime().replace(tzinfo=timezone.utc)
+
+@pytest.mark.parametrize("start, search, sign", [
+    (datetime(2024, 3, 1), ephem.next_equinox, "Aries"),
+    (datetime(2024, 6, 1), ephem.next_solstice, "Cancer"),
+    (datetime(2024, 9, 1), ephem.next_equinox, "Libra"),
+    (datetime(2024, 12, 1), ephem.next_solstice, "Capricorn")
+])
+def test_sun_ingresses_at_equinoxes_and_solstices(start, search, sign):
+    ingress, ingress_sign = find_next_ingress("Sun", start, "UTC", 0, 0)
+
+    assert ingress_sign == sign
+    assert abs(ingress - ephem_utc(search(start))) < timedelta(minutes=1)
+
+def test_ingress_is_a_change_of_sign():
+    second = timedelta(seconds=1)
+
+    for body_name in ["Moon", "Mercury", "Mars"]:
+        ingress, sign = find_next_ingress(body_name, datetime(2024, 1, 1), "UTC", 0, 0)
+
+        assert determine_sign(body_name, ingress + second, "UTC", 0, 0) == sign
+        assert determine_sign(body_name, ingress - 2 * second, "UTC", 0, 0) != sign
+
+def test_mars_ingress_2024():
+    # Mars entered Pisces on 2024-03-22 23:47 UTC
+    ingress, sign = find_next_ingress("Mars", datetime(2024, 3, 1), "UTC", 0, 0)
+
+    assert sign == "Pisces"
+    assert abs(ingress - datetime(2024, 3, 22, 23, 47, tzinfo=timezone.utc)) < timedelta(minutes=1)
+
+def test_non_positive_tolerance_is_rejected():
+    with pytest.raises(ValueError):
+        find_next_ingress("Mars", datetime(2024, 3, 1), "UTC", 0, 0, tolerance=timedelta(0))
+
+    with pytest.raises(ValueError):
+        find_next_ingress("Mars", datetime(2024, 3, 1), "UTC", 0, 0, tolerance=timedelta(seconds=-1))
+
+def test_bisection_stops_without_shrinking_further():
+    t, sign_index = next_ingress_ephem_date(create_ephem_body("Mars"), float(ephem.Date(datetime(2024, 3, 1))), 1e-300)
+
+    assert sign_index == 11
+    assert abs(ephem_utc(t) - datetime(2024, 3, 22, 23, 47, tzinfo=timezone.utc)) < timedelta(minutes=1)
+
+def test_bisection_counts_against_max_evaluations():
+    # Too few evaluations to refine the bracket to a second, but the instant returned is still in the new sign
+    ingress, sign = find_next_ingress("Mars", datetime(2024, 3, 1), "UTC", 0, 0, max_evaluations=8)
+
+    assert sign == "Pisces"
+    assert determine_sign("Mars", ingress, "UTC", 0, 0) == sign
+
+def test_no_ingress_within_max_evaluations():
+    with pytest.raises(RuntimeError):
+        find_next_ingress("Saturn", datetime(2024, 6, 1), "UTC", 0, 0, max_evaluations=2)
@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta, timezone
+
+import ephem
+import numpy as np
+
+from moon_phase import find_stations, is_retrograde, retrograde_periods
+from moon_phase.create_ephem_body import create_ephem_body
+from moon_phase.find_stations import longitude_speed_ephem_dates
+from moon_phase.retrograde_index import build_retrograde_index
+
+# Mercury's retrograde period of spring 2024 (UTC)
+MERCURY_RETROGRADE_STATION = datetime(2024, 4, 1, 22, 14, tzinfo=timezone.utc)
+MERCURY_DIRECT_STATION = datetime(2024, 4, 25, 12, 54, tzinfo=timezone.utc)
+
+def test_find_stations_mercury_2024():
+    stations = find_stations("Mercury", datetime(2024, 3, 15), datetime(2024, 5, 15), "UTC", 0, 0)
+
+    assert [motion for _, motion in stations] == ["retrograde", "direct"]
+    assert abs(stations[0][0] - MERCURY_RETROGRADE_STATION) < timedelta(minutes=2)
+    assert abs(stations[1][0] - MERCURY_DIRECT_STATION) < timedelta(minutes=2)
+
+def test_stations_alternate_and_speed_changes_sign():
+    body = create_ephem_body("Mars")
+    start = float(ephem.Date(datetime(2020, 1, 1)))
+    stations = find_stations("Mars", datetime(2020, 1, 1), datetime(2025, 1, 1), "UTC", 0, 0)
+
+    assert len(stations) >= 4
+    assert all(a[1] != b[1] for a, b in zip(stations, stations[1:]))
+
+    for dt, motion in stations:
+        t = float(ephem.Date(dt.astimezone(timezone.utc).replace(tzinfo=None)))
+        before, after = longitude_speed_ephem_dates(body, np.array([t - 1, t + 1]))
+
+        assert (after < 0) == (motion == "retrograde")
+        assert (before < 0) != (after < 0)
+
+def test_retrograde_periods_mercury_2024():
+    periods = retrograde_periods("Mercury", datetime(2024, 1, 1), datetime(2024, 12, 31), "UTC", 0, 0)
+
+    # The period of December 2023 runs into the range and is listed complete
+    assert len(periods) == 4
+    assert periods[0][0].year == 2023 and periods[0][1].year == 2024
+    assert abs(periods[1][0] - MERCURY_RETROGRADE_STATION) < timedelta(minutes=2)
+    assert abs(periods[1][1] - MERCURY_DIRECT_STATION) < timedelta(minutes=2)
+
+def test_retrograde_index_lookups():
+    index = build_retrograde_index(datetime(2024, 1, 1), datetime(2025, 1, 1), ["mercury"])
+
+    assert index.is_retrograde("Mercury", datetime(2024, 4, 10, tzinfo=timezone.utc).timestamp())
+    assert not index.is_retrograde("Mercury", datetime(2024, 3, 25, tzinfo=timezone.utc).timestamp())
+    assert not index.is_retrograde("Mercury", datetime(2024, 5, 1, tzinfo=timezone.utc).timestamp())
+
+    # Queries outside the indexed range or for other bodies are not answered
+    assert index.is_retrograde("Mercury", datetime(2026, 1, 1, tzinfo=timezone.utc).timestamp()) is None
+    assert index.is_retrograde("Venus", datetime(2024, 4, 10, tzinfo=timezone.utc).timestamp()) is None
+
+def test_is_retrograde_around_stations():
+    hour = timedelta(hours=1)
+
+    assert not is_retrograde("Mercury", MERCURY_RETROGRADE_STATION - hour, "UTC", 0, 0)
+    assert is_retrograde("Mercury", MERCURY_RETROGRADE_STATION + hour, "UTC", 0, 0)
+    assert is_retrograde("Mercury", MERCURY_DIRECT_STATION - hour, "UTC", 0, 0)
+    assert not is_retrograde("Mercury", MERCURY_DIRECT_STATION + hour, "UTC", 0, 0)
+
+def test_is_retrograde_across_years_matches_speed():
+    rng = np.random.default_rng(5)
+    start = float(ephem.Date(datetime(1990, 1, 1)))
+
+    for body_name in ["mercury", "venus", "mars", "jupiter", "saturn"]:
+        body = create_ephem_body(body_name)
+        ephem_dates = rng.uniform(start, start + 50 * 365, 40)
+        speeds = longitude_speed_ephem_dates(body, ephem_dates)
+
+        for t, speed in zip(ephem_dates, speeds):
+            # Stay clear of stations, where the sign of a finite difference is ambiguous
+            if abs(speed) < 1e-3:
+                continue
+
+            dt = ephem.Date(t).datetime().replace(tzinfo=timezone.utc)
+
+            assert is_retrograde(body_name, dt, "UTC", 0, 0) == (speed < 0), (body_name, dt)
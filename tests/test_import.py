@@ -0,0 +1,21 @@
+import subprocess
+import sys
+from pathlib import Path
+
+REPOSITORY = Path(__file__).resolve().parent.parent
+
+def test_import_does_not_load_heavy_dependencies():
+    # Import in a fresh interpreter, so modules loaded by other tests do not count
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import moon_phase, sys; print(' '.join(name for name in ('pandas', 'dateparser') if name in sys.modules))"
+        ],
+        cwd=REPOSITORY,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    assert result.stdout.split() == []
@@ -0,0 +1,67 @@
+from datetime import date, datetime, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+import moon_phase.parse_timestamp as parse_timestamp_module
+from moon_phase.parse_timestamp import parse_machine_timestamp, parse_timestamp
+
+NEW_YORK = ZoneInfo("America/New_York")
+
+# Machine timestamps parsed without dateparser, which dateparser parses the same way
+ISO_TIMESTAMPS = [
+    "2024-05-01",
+    "2024-05-01T12:30",
+    "2024-05-01 12:30",
+    "2024-05-01T00:00",
+    "2024-05-01T12:30:15",
+    "2024-05-01 12:30:00.5Z",
+    "2024-05-01t12:30z",
+    "2024-05-01T12:30:00+02:00",
+    "2024-12-31T23:59:59-08:00"
+]
+
+@pytest.fixture
+def dateparser_only(monkeypatch):
+    # Send every timestamp down the dateparser fallback
+    monkeypatch.setattr(parse_timestamp_module, "parse_machine_timestamp", lambda timestamp: None)
+
+@pytest.mark.parametrize("timestamp", ISO_TIMESTAMPS)
+def test_fast_path_matches_dateparser(timestamp, request):
+    fast = parse_timestamp(timestamp, NEW_YORK)
+    request.getfixturevalue("dateparser_only")
+    fallback = parse_timestamp(timestamp, NEW_YORK)
+
+    assert fast == fallback
+
+@pytest.mark.parametrize("timestamp", ISO_TIMESTAMPS)
+def test_fast_path_handles_iso_timestamps(timestamp):
+    assert parse_machine_timestamp(timestamp) is not None
+
+def test_date_without_time_is_a_date():
+    assert parse_timestamp("2024-05-01", NEW_YORK) == (date(2024, 5, 1), NEW_YORK)
+
+def test_midnight_with_time_is_a_datetime():
+    assert parse_timestamp("2024-05-01T00:00", NEW_YORK) == (datetime(2024, 5, 1, tzinfo=NEW_YORK), NEW_YORK)
+
+def test_offset_is_converted_to_the_timezone():
+    dt, tz = parse_timestamp("2024-05-01T12:30:00+02:00", NEW_YORK)
+
+    assert tz == NEW_YORK
+    assert dt == datetime(2024, 5, 1, 10, 30, tzinfo=timezone.utc)
+    assert dt.utcoffset() == NEW_YORK.utcoffset(datetime(2024, 5, 1))
+
+@pytest.mark.parametrize("timestamp", ["1714566600", "@1714566600", "1714566600.5"])
+def test_epoch_seconds_are_utc_instants(timestamp):
+    dt, tz = parse_timestamp(timestamp, NEW_YORK)
+
+    assert tz == NEW_YORK
+    assert dt.timestamp() == float(timestamp.lstrip("@"))
+
+@pytest.mark.parametrize("timestamp", ["20240501", "May 1 2024", "2024-13-01", "2024-05-01T25:00", "12345"])
+def test_other_strings_are_left_to_dateparser(timestamp):
+    assert parse_machine_timestamp(timestamp) is None
+
+def test_free_form_timestamps_use_dateparser():
+    assert parse_timestamp("May 1, 2024 12:30", NEW_YORK) == (datetime(2024, 5, 1, 12, 30, tzinfo=NEW_YORK), NEW_YORK)
+    assert parse_timestamp("1 May 2024", NEW_YORK) == (date(2024, 5, 1), NEW_YORK)